@@ -21,10 +21,18 @@ import sys
 import subprocess
 import logging
 import secrets
+import shlex
+import shutil
 import string
 import re
 import socket
+import stat
+import threading
 import argparse
+import glob
+import importlib.util
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import json
@@ -32,87 +40,89 @@ import time
 
 # Auto-install dependencies if needed
 def check_and_install_dependencies():
-    """Check and install required packages."""
+    """Check and install required packages.
+
+    All missing packages are installed in a single pip (or apt) call so the
+    resolver and index/mirror round-trips only run once.
+    """
     required_packages = {
         'questionary': 'python3-questionary',
         'rich': 'python3-rich'
     }
 
-    for package, apt_package in required_packages.items():
-        try:
-            __import__(package)
-        except ImportError:
-            print(f"Installing {package}...")
-
-            # Try pip first
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", package],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+    missing = [package for package in required_packages if importlib.util.find_spec(package) is None]
+    if not missing:
+        return
 
-            if result.returncode == 0:
-                print(f"✓ {package} installed via pip")
-                continue
+    apt_packages = [required_packages[package] for package in missing]
+    print(f"Installing {', '.join(missing)}...")
 
-            # Pip failed - check if it's an externally managed environment error
-            stderr_output = result.stderr or ""
-            if "externally-managed-environment" in stderr_output or "externally managed" in stderr_output.lower():
-                print(f"  Python environment is externally managed, trying apt...")
-
-                # Try apt install
-                apt_update = subprocess.run(
-                    ["apt-get", "update", "-qq"],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-
-                apt_install = subprocess.run(
-                    ["apt-get", "install", "-y", "-qq", apt_package],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-
-                if apt_install.returncode == 0:
-                    print(f"✓ {package} installed via apt")
-                    continue
-
-                # APT failed - try pip with override
-                print(f"  apt package {apt_package} not available, trying pip with override...")
-
-                pip_override = subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "--break-system-packages", package],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-
-                if pip_override.returncode == 0:
-                    print(f"✓ {package} installed via pip (with override)")
-                    continue
-
-                # Everything failed
-                print(f"✗ Failed to install {package}. Please install manually:")
-                print(f"  sudo apt install {apt_package}")
-                print(f"  OR: pip install --break-system-packages {package}")
-                sys.exit(1)
-            else:
-                # Some other pip error
-                print(f"✗ Failed to install {package} via pip: {stderr_output}")
-                sys.exit(1)
+    # Try pip first
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "install", *missing],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    if result.returncode == 0:
+        print(f"✓ {', '.join(missing)} installed via pip")
+        return
+
+    # Pip failed - check if it's an externally managed environment error
+    stderr_output = result.stderr or ""
+    if "externally-managed-environment" in stderr_output or "externally managed" in stderr_output.lower():
+        print(f"  Python environment is externally managed, trying apt...")
+
+        # Try apt install
+        apt_update = subprocess.run(
+            ["apt-get", "update", "-qq"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        apt_install = subprocess.run(
+            ["apt-get", "install", "-y", "-qq", *apt_packages],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        if apt_install.returncode == 0:
+            print(f"✓ {', '.join(missing)} installed via apt")
+            return
+
+        # APT failed - try pip with override
+        print(f"  apt packages {' '.join(apt_packages)} not available, trying pip with override...")
+
+        pip_override = subprocess.run(
+            [sys.executable, "-m", "pip", "install", "--break-system-packages", *missing],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        if pip_override.returncode == 0:
+            print(f"✓ {', '.join(missing)} installed via pip (with override)")
+            return
+
+        # Everything failed
+        print(f"✗ Failed to install {', '.join(missing)}. Please install manually:")
+        print(f"  sudo apt install {' '.join(apt_packages)}")
+        print(f"  OR: pip install --break-system-packages {' '.join(missing)}")
+        sys.exit(1)
+    else:
+        # Some other pip error
+        print(f"✗ Failed to install {', '.join(missing)} via pip: {stderr_output}")
+        sys.exit(1)
 
 check_and_install_dependencies()
 
-import questionary
-from questionary import Style
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Confirm, Prompt
-from rich import box
-from rich.markdown import Markdown
-from rich.syntax import Syntax
+from rich.text import Text
+
+# questionary is only needed by the interactive wizard; load_questionary()
+# imports it on first use so --config and --example-config runs skip it.
+questionary = None
 
 # ============================================
 # GLOBAL CONFIGURATION
@@ -120,9 +130,25 @@ from rich.syntax import Syntax
 
 APP_VERSION = "2.0.2-CLI"
 LOG_FILE = "/var/log/odoo-installer.log"
+CONTAINER_START_TIMEOUT = 30  # seconds to wait for containers to report running
+COMMAND_TIMEOUT = 600  # 10 minute timeout for run_command()
+COMMAND_OUTPUT_TAIL = 200  # lines of output kept per stream by run_command()
+
+# Environment suffixes paired with their display names, and the config keys
+# for each suffix so the collect/summary loops don't rebuild them every pass
+ENV_PAIRS = (('Test', 'Test'), ('Staging', 'Staging'), ('Prod', 'Production'))
+ENV_KEYS = {
+    env: {field: f'{field}{env}' for field in (
+        'dbUser', 'dbPass', 'domain', 'portHttp', 'portLp',
+        'sslCert', 'sslKey', 'containerName')}
+    for env, _ in ENV_PAIRS
+}
+# Lowercase name of each suffix, used for directories and compose services
+ENV_NAMES = {env: env.lower() for env, _ in ENV_PAIRS}
 
-# Custom style for questionary prompts
-custom_style = Style([
+# Custom style for questionary prompts (built by load_questionary())
+custom_style = None
+CUSTOM_STYLE_RULES = [
     ('qmark', 'fg:#673ab7 bold'),       # Question mark
     ('question', 'bold'),                # Question text
     ('answer', 'fg:#f44336 bold'),      # User's answer
@@ -133,7 +159,7 @@ custom_style = Style([
     ('instruction', ''),                 # Instructions
     ('text', ''),                        # Plain text
     ('disabled', 'fg:#858585 italic')   # Disabled choice
-])
+]
 
 console = Console()
 
@@ -173,9 +199,19 @@ logger = setup_logging()
 # HELPER FUNCTIONS
 # ============================================
 
+def load_questionary():
+    """Import questionary and build the prompt style on first use."""
+    global questionary, custom_style
+    if questionary is None:
+        import questionary as _questionary
+        questionary = _questionary
+        custom_style = questionary.Style(CUSTOM_STYLE_RULES)
+    return questionary
+
 def check_root_permissions():
     """Verify the script is running as root."""
     if os.geteuid() != 0:
+        from rich.panel import Panel
         console.print(Panel.fit(
             "[bold red]❌ ERROR: This installer must be run as root[/bold red]\n\n"
             "Please run with: [yellow]sudo python3 cli_installer.py[/yellow]",
@@ -188,41 +224,89 @@ def check_root_permissions():
 def safe_ask(question):
     """
     Safely ask a questionary question and handle Ctrl+C properly.
-    Questionary returns None when Ctrl+C is pressed, so we convert it to KeyboardInterrupt.
+    Questionary returns None (or an empty dict for forms) when Ctrl+C is pressed,
+    so we convert it to KeyboardInterrupt.
     """
     result = question.ask()
-    if result is None:
+    if result is None or result == {}:
         raise KeyboardInterrupt
     return result
 
+def as_validator(check):
+    """Adapt a (valid, message) validator to questionary's validate= contract."""
+    def validator(value):
+        valid, msg = check(value)
+        return True if valid else msg
+    return validator
+
+def ask_validated(message, default="", validate=None, prompt=None):
+    """
+    Ask a text question that cannot be submitted until validate accepts it.
+    Validation runs on Enter rather than per keystroke, and the error is shown
+    in the prompt toolbar instead of re-printing the question.
+    """
+    prompt = prompt or questionary.text
+    return safe_ask(prompt(
+        message,
+        default=default,
+        validate=validate,
+        validate_while_typing=False,
+        style=custom_style
+    ))
+
 def safe_confirm(prompt, default=True):
     """
     Safely ask a rich Confirm question and handle Ctrl+C properly.
     Rich Confirm may also return None on Ctrl+C.
     """
+    from rich.prompt import Confirm
     try:
         result = Confirm.ask(prompt, default=default)
         return result
     except (EOFError, KeyboardInterrupt):
         raise KeyboardInterrupt
 
+# Excludes $ to avoid shell variable expansion issues when passwords are
+# used in shell commands (e.g., CREATE USER ... PASSWORD).
+PASSWORD_CHARSET = string.ascii_letters + string.digits + "!@#%^&*"
+
 def generate_secure_password(length=24):
     """Generate a cryptographically secure password.
 
-    Note: Excludes $ to avoid shell variable expansion issues when
-    passwords are used in shell commands (e.g., CREATE USER ... PASSWORD).
+    Draws random bytes in one batch and rejection-samples them onto
+    PASSWORD_CHARSET, so the result stays uniform without one urandom
+    call per character.
     """
-    charset = string.ascii_letters + string.digits + "!@#%^&*"
-    password = ''.join(secrets.choice(charset) for _ in range(length))
-    return password
+    charset = PASSWORD_CHARSET
+    n = len(charset)
+    limit = 256 - (256 % n)  # bytes at or above this would bias the modulo
+    out = []
+    while len(out) < length:
+        for b in secrets.token_bytes(length * 2):
+            if b < limit:
+                out.append(charset[b % n])
+                if len(out) == length:
+                    break
+    return ''.join(out)
+
+_DOMAIN_RE = re.compile(r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$')
+_DBNAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+_PATH_BAD_RE = re.compile(r'[\x00\n\r]')
+# Docker container names must match [a-zA-Z0-9][a-zA-Z0-9_.-]*
+# (\A...\Z rather than ^...$, which would also accept a trailing newline)
+_DOCKER_NAME_RE = re.compile(r'\A[a-zA-Z0-9][a-zA-Z0-9_.-]*\Z')
+
+def is_valid_container_name(name):
+    """Check a Docker container name, rejecting obvious misses before the regex."""
+    return (isinstance(name, str) and name.isascii() and name[:1].isalnum()
+            and _DOCKER_NAME_RE.match(name) is not None)
 
 def validate_domain(domain):
     """Validate domain name format."""
     if not domain or len(domain) > 255:
         return False, "Domain name is required and must be less than 255 characters"
 
-    pattern = r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$'
-    if not re.match(pattern, domain):
+    if not _DOMAIN_RE.match(domain):
         return False, "Invalid domain format (e.g., example.com)"
 
     return True, "Valid domain"
@@ -237,15 +321,30 @@ def validate_port(port):
     return 1024 <= port <= 65535
 
 def check_port_available(port):
-    """Check if a port is available on the system."""
+    """Check if a port is available on the system.
+
+    Binding (rather than connecting) answers immediately and also catches
+    ports held by listeners on any interface, which is what Docker needs.
+    """
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)
-            result = s.connect_ex(('127.0.0.1', port))
-            return result != 0
-    except Exception as e:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(('0.0.0.0', port))
+            return True
+    except OSError:
+        return False
+    except (OverflowError, TypeError, ValueError) as e:
+        # Not a bindable port number, so it can't be used either
         logger.warning(f"Error checking port {port}: {e}")
-        return True
+        return False
+
+def check_ports_available(ports):
+    """Check several ports concurrently. Returns a {port: available} dict."""
+    ports = list(dict.fromkeys(ports))
+    if not ports:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        return dict(zip(ports, executor.map(check_port_available, ports)))
 
 def validate_database_name(db_name):
     """Validate PostgreSQL database name."""
@@ -255,12 +354,18 @@ def validate_database_name(db_name):
     if len(db_name) > 63:
         return False, "Database name must be 63 characters or less"
 
-    pattern = r'^[a-zA-Z_][a-zA-Z0-9_]*$'
-    if not re.match(pattern, db_name):
+    if not _DBNAME_RE.match(db_name):
         return False, "Database name must start with letter/underscore and contain only letters, numbers, underscores"
 
     return True, "Valid database name"
 
+def _is_file(path):
+    """True if path is a regular file (one stat call, follows symlinks)."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
 def validate_path(path):
     """Validate file system path."""
     if not path:
@@ -269,47 +374,205 @@ def validate_path(path):
     if not os.path.isabs(path):
         return False, "Path must be absolute (start with /)"
 
-    if any(char in path for char in ['\0', '\n', '\r']):
+    if _PATH_BAD_RE.search(path):
         return False, "Path contains invalid characters"
 
     return True, "Valid path"
 
-def run_command(command, description="", check=True):
-    """Execute a shell command with logging."""
-    logger.info(f"Running: {description or command}")
+def _drain_stream(stream, tail, label):
+    """Log each line of a subprocess stream as it arrives, keeping only a tail."""
+    for line in stream:
+        line = line.rstrip('\n')
+        tail.append(line)
+        logger.debug(f"{label}: {line}")
+    stream.close()
+
+def run_command(command, description="", check=True, env=None):
+    """Execute a command with logging.
+
+    A list is executed directly without a shell; a string is run through
+    /bin/sh and should only be used when shell features are needed.
+    Extra environment variables can be passed as a dict via env.
+
+    Output is streamed to the log line by line and only the last
+    COMMAND_OUTPUT_TAIL lines of each stream are kept and returned, so memory
+    stays bounded for chatty commands like apt-get or docker pull.
+    """
+    use_shell = isinstance(command, str)
+    command_text = command if use_shell else shlex.join(command)
+    logger.info(f"Running: {description or command_text}")
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             command,
-            shell=True,
-            check=check,
-            capture_output=True,
+            shell=use_shell,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=600  # 10 minute timeout
+            env={**os.environ, **env} if env else None
         )
-        if result.stdout:
-            logger.debug(f"Output: {result.stdout.strip()}")
-        if result.stderr:
-            logger.warning(f"Stderr: {result.stderr.strip()}")
-        return True, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        logger.error(f"Command timed out: {command}")
-        return False, "", "Command timed out"
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Command failed: {command}")
-        logger.error(f"Error: {e.stderr}")
-        return False, e.stdout or "", e.stderr or str(e)
     except Exception as e:
         logger.error(f"Unexpected error running command: {e}")
         return False, "", str(e)
 
+    stdout_tail = deque(maxlen=COMMAND_OUTPUT_TAIL)
+    stderr_tail = deque(maxlen=COMMAND_OUTPUT_TAIL)
+    readers = [
+        threading.Thread(target=_drain_stream, args=(proc.stdout, stdout_tail, "Output"), daemon=True),
+        threading.Thread(target=_drain_stream, args=(proc.stderr, stderr_tail, "Stderr"), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        returncode = proc.wait(timeout=COMMAND_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        # Grandchildren may still hold the pipes open, so don't wait forever
+        for reader in readers:
+            reader.join(timeout=5)
+        logger.error(f"Command timed out: {command_text}")
+        return False, "", "Command timed out"
+
+    for reader in readers:
+        reader.join()
+
+    stdout = "\n".join(stdout_tail)
+    stderr = "\n".join(stderr_tail)
+
+    if check and returncode != 0:
+        logger.error(f"Command failed: {command_text}")
+        logger.error(f"Error: {stderr}")
+        return False, stdout, stderr or f"Command exited with status {returncode}"
+
+    if stderr:
+        logger.warning(f"Stderr: {stderr}")
+    return True, stdout, stderr
+
+_APT_STATE = {"updated": False, "sources_mtime": None}
+
+def _apt_sources_mtime():
+    """Return the newest mtime across the apt sources configuration."""
+    paths = ["/etc/apt/sources.list", "/etc/apt/sources.list.d"] + glob.glob("/etc/apt/sources.list.d/*")
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            pass
+    return max(mtimes, default=None)
+
+def apt_update_if_needed(force=False):
+    """Run apt-get update only if the sources changed since the last update.
+
+    Returns the same (success, stdout, stderr) tuple as run_command().
+    """
+    sources_mtime = _apt_sources_mtime()
+    if not force and _APT_STATE["updated"] and sources_mtime == _APT_STATE["sources_mtime"]:
+        logger.info("Package list is up to date, skipping apt-get update")
+        return True, "", ""
+
+    success, stdout, stderr = run_command(["apt-get", "update", "-qq"], "Updating package list")
+    if success:
+        _APT_STATE["updated"] = True
+        _APT_STATE["sources_mtime"] = sources_mtime
+    return success, stdout, stderr
+
+_PACKAGE_STATUS = {}
+
 def check_package_installed(package_name):
-    """Check if a package is installed via dpkg."""
-    success, stdout, _ = run_command(
-        f"dpkg -l | grep -E '^ii.*{package_name}' || true",
-        f"Checking if {package_name} is installed",
-        check=False
-    )
-    return success and stdout.strip() != ""
+    """Check if a package is installed via dpkg-query.
+
+    Results are memoized; call invalidate_package_status() after installing.
+    """
+    if package_name in _PACKAGE_STATUS:
+        return _PACKAGE_STATUS[package_name]
+
+    logger.info(f"Checking if {package_name} is installed")
+    try:
+        result = subprocess.run(
+            ["dpkg-query", "-W", "-f=${Status}\\n", package_name],
+            capture_output=True,
+            text=True
+        )
+        installed = result.returncode == 0 and "install ok installed" in result.stdout
+    except OSError as e:
+        logger.warning(f"Could not query dpkg for {package_name}: {e}")
+        installed = False
+
+    _PACKAGE_STATUS[package_name] = installed
+    return installed
+
+def invalidate_package_status(*package_names):
+    """Forget memoized dpkg status for the given packages."""
+    for package_name in package_names:
+        _PACKAGE_STATUS.pop(package_name, None)
+
+def backup_file(path, description=""):
+    """Copy a file to <path>.backup_<timestamp> in-process.
+
+    Missing files are ignored, and an existing backup with the same
+    timestamp (a re-run within the same second) is left as it is.
+    """
+    logger.info(f"Running: {description or f'Backing up {path}'}")
+    backup_path = f"{path}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    if os.path.exists(backup_path):
+        logger.info(f"Backup {backup_path} already exists, skipping")
+        return
+
+    try:
+        shutil.copy2(path, backup_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not back up {path}: {e}")
+
+def atomic_write(path, content, mode=0o644):
+    """Atomically replace path with content, created with the given permissions.
+
+    Writes to a temporary sibling file and renames it over path, so readers
+    (e.g. an nginx reload) see either the old or the new file, never a
+    truncated one. The mode is set at creation, so files holding passwords
+    are never briefly world-readable.
+    """
+    tmp = f"{path}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.fchmod(fd, mode)  # O_CREAT's mode does not apply to a leftover tmp file
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    os.replace(tmp, path)
+
+def ensure_line(path, sentinel, line):
+    """Append line to path unless sentinel already occurs in the file.
+
+    Returns True if the line was appended.
+    """
+    with open(path) as f:
+        text = f.read()
+    if sentinel in text:
+        return False
+
+    separator = "" if not text or text.endswith("\n") else "\n"
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+    with os.fdopen(fd, 'w') as f:
+        f.write(f"{separator}{line}\n")
+    return True
+
+def chown_recursive(path, uid, gid):
+    """Recursively change ownership of path, like chown -R, without a subprocess."""
+    os.chown(path, uid, gid)
+    for root, dirs, files in os.walk(path):
+        for name in dirs + files:
+            os.lchown(os.path.join(root, name), uid, gid)
 
 # ============================================
 # NON-INTERACTIVE CONFIG LOADING
@@ -394,7 +657,7 @@ def load_config_file(config_path):
         'Prod': f'odoo{ver}_prod',
     }
 
-    used_ports = []
+    used_ports = set()
     used_container_names = []
 
     for env_key, env_suffix in env_map.items():
@@ -405,7 +668,7 @@ def load_config_file(config_path):
         valid, msg = validate_database_name(db_user)
         if not valid:
             errors.append(f"environments.{env_key}.db_user: {msg}")
-        config[f'dbUser{env_suffix}'] = db_user
+        config[ENV_KEYS[env_suffix]['dbUser']] = db_user
 
         # Database password (auto-generate if missing or "auto")
         db_pass = env_conf.get('db_password', 'auto')
@@ -413,7 +676,7 @@ def load_config_file(config_path):
             db_pass = generate_secure_password()
         elif len(db_pass) < 8:
             errors.append(f"environments.{env_key}.db_password: must be at least 8 characters (or omit/set to 'auto' to generate)")
-        config[f'dbPass{env_suffix}'] = db_pass
+        config[ENV_KEYS[env_suffix]['dbPass']] = db_pass
 
         # Domain
         if not config['skipNginx']:
@@ -424,9 +687,9 @@ def load_config_file(config_path):
                 valid, msg = validate_domain(domain)
                 if not valid:
                     errors.append(f"environments.{env_key}.domain: {msg}")
-            config[f'domain{env_suffix}'] = domain or f"{env_key}.local"
+            config[ENV_KEYS[env_suffix]['domain']] = domain or f"{env_key}.local"
         else:
-            config[f'domain{env_suffix}'] = f"{env_key}.local"
+            config[ENV_KEYS[env_suffix]['domain']] = f"{env_key}.local"
 
         # SSL cert/key
         if ssl:
@@ -435,15 +698,15 @@ def load_config_file(config_path):
 
             if not ssl_cert:
                 errors.append(f"environments.{env_key}.ssl_cert: required when ssl is enabled")
-            elif not os.path.isfile(ssl_cert):
+            elif not _is_file(ssl_cert):
                 errors.append(f"environments.{env_key}.ssl_cert: file does not exist: {ssl_cert}")
-            config[f'sslCert{env_suffix}'] = ssl_cert or ''
+            config[ENV_KEYS[env_suffix]['sslCert']] = ssl_cert or ''
 
             if not ssl_key:
                 errors.append(f"environments.{env_key}.ssl_key: required when ssl is enabled")
-            elif not os.path.isfile(ssl_key):
+            elif not _is_file(ssl_key):
                 errors.append(f"environments.{env_key}.ssl_key: file does not exist: {ssl_key}")
-            config[f'sslKey{env_suffix}'] = ssl_key or ''
+            config[ENV_KEYS[env_suffix]['sslKey']] = ssl_key or ''
 
         # HTTP port
         http_port = env_conf.get('http_port', default_ports[env_suffix]['http'])
@@ -453,8 +716,8 @@ def load_config_file(config_path):
             http_port = int(http_port)
             if http_port in used_ports:
                 errors.append(f"environments.{env_key}.http_port: port {http_port} already used by another environment")
-            used_ports.append(http_port)
-        config[f'portHttp{env_suffix}'] = int(http_port) if validate_port(http_port) else http_port
+            used_ports.add(http_port)
+        config[ENV_KEYS[env_suffix]['portHttp']] = int(http_port) if validate_port(http_port) else http_port
 
         # Long-polling port
         lp_port = env_conf.get('longpolling_port', default_ports[env_suffix]['lp'])
@@ -464,17 +727,17 @@ def load_config_file(config_path):
             lp_port = int(lp_port)
             if lp_port in used_ports:
                 errors.append(f"environments.{env_key}.longpolling_port: port {lp_port} already used by another environment")
-            used_ports.append(lp_port)
-        config[f'portLp{env_suffix}'] = int(lp_port) if validate_port(lp_port) else lp_port
+            used_ports.add(lp_port)
+        config[ENV_KEYS[env_suffix]['portLp']] = int(lp_port) if validate_port(lp_port) else lp_port
 
         # Container name
         container_name = env_conf.get('container_name', default_container_names[env_suffix])
-        if not container_name or not re.match(r'^[a-zA-Z0-9][a-zA-Z0-9_.-]*$', container_name):
+        if not is_valid_container_name(container_name):
             errors.append(f"environments.{env_key}.container_name: invalid Docker container name '{container_name}'")
         elif container_name in used_container_names:
             errors.append(f"environments.{env_key}.container_name: '{container_name}' already used by another environment")
         used_container_names.append(container_name)
-        config[f'containerName{env_suffix}'] = container_name
+        config[ENV_KEYS[env_suffix]['containerName']] = container_name
 
     if errors:
         console.print("[bold red]Configuration errors:[/bold red]")
@@ -553,32 +816,45 @@ EXAMPLE_CONFIG = """\
 
 def print_config_summary(config):
     """Print a summary table of the loaded config (used in non-interactive mode)."""
+    from rich import box
+    from rich.table import Table
+
     table = Table(title="Installation Configuration (from config file)", box=box.ROUNDED, show_header=True, header_style="bold magenta")
     table.add_column("Setting", style="cyan", no_wrap=True)
     table.add_column("Value", style="green")
 
-    web_server = config.get('webServer', 'nginx' if not config.get('skipNginx') else 'none')
+    skip_nginx = bool(config.get('skipNginx'))
+    skip_ssl = bool(config.get('skipSSL'))
+    web_server = config.get('webServer', 'nginx' if not skip_nginx else 'none')
     web_server_display = {'nginx': 'Nginx', 'apache2': 'Apache2', 'none': 'None (direct port access)'}
 
-    table.add_row("Odoo Version", config['odooVersion'])
-    table.add_row("Base Path", config['basePath'])
-    table.add_row("Web Server", web_server_display.get(web_server, web_server))
-    table.add_row("SSL", "No (HTTP only)" if config.get('skipSSL') else "Yes (HTTPS)")
-    table.add_row("", "")
-
-    for env, env_display in [('Test', 'Test'), ('Staging', 'Staging'), ('Prod', 'Production')]:
-        table.add_row(f"[bold]{env_display} Environment[/bold]", "")
-        table.add_row(f"  Container", config[f'containerName{env}'])
-        if not config.get('skipNginx'):
-            table.add_row(f"  Domain", config[f'domain{env}'])
-        table.add_row(f"  DB User", config[f'dbUser{env}'])
-        table.add_row(f"  DB Password", config[f'dbPass{env}'][:4] + '****')
-        table.add_row(f"  HTTP Port", str(config[f'portHttp{env}']))
-        table.add_row(f"  LP Port", str(config[f'portLp{env}']))
-        if not config.get('skipSSL') and not config.get('skipNginx'):
-            table.add_row(f"  SSL Cert", config[f'sslCert{env}'])
-            table.add_row(f"  SSL Key", config[f'sslKey{env}'])
-        table.add_row("", "")
+    rows = [
+        ("Odoo Version", config['odooVersion']),
+        ("Base Path", config['basePath']),
+        ("Web Server", web_server_display.get(web_server, web_server)),
+        ("SSL", "No (HTTP only)" if skip_ssl else "Yes (HTTPS)"),
+        ("", ""),
+    ]
+
+    for env, env_display in ENV_PAIRS:
+        keys = ENV_KEYS[env]
+        rows.append((f"[bold]{env_display} Environment[/bold]", ""))
+        rows.append(("  Container", config[keys['containerName']]))
+        if not skip_nginx:
+            rows.append(("  Domain", config[keys['domain']]))
+        rows.extend([
+            ("  DB User", config[keys['dbUser']]),
+            ("  DB Password", config[keys['dbPass']][:4] + '****'),
+            ("  HTTP Port", str(config[keys['portHttp']])),
+            ("  LP Port", str(config[keys['portLp']])),
+        ])
+        if not skip_ssl and not skip_nginx:
+            rows.append(("  SSL Cert", config[keys['sslCert']]))
+            rows.append(("  SSL Key", config[keys['sslKey']]))
+        rows.append(("", ""))
+
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -587,19 +863,46 @@ def print_config_summary(config):
 # INSTALLATION FUNCTIONS
 # ============================================
 
-def install_docker():
-    """Install Docker from official repository."""
-    logger.info("Installing Docker...")
+DOCKER_PACKAGES = ['docker-ce', 'docker-ce-cli', 'containerd.io', 'docker-buildx-plugin', 'docker-compose-plugin']
+POSTGRESQL_PACKAGES = ['postgresql', 'postgresql-contrib']
 
-    if check_package_installed("docker-ce"):
-        return True, "Docker is already installed"
+def add_docker_repository():
+    """Add the official Docker apt repository and its signing key."""
+    logger.info("Adding Docker repository...")
+
+    # curl/gnupg are needed to fetch the key, so they cannot wait for the main batch
+    prerequisites = [p for p in ('ca-certificates', 'curl', 'gnupg') if not check_package_installed(p)]
+    if prerequisites:
+        success, _, stderr = apt_update_if_needed()
+        if not success:
+            return False, f"Failed: Updating package list - {stderr}"
+        success, _, stderr = run_command(
+            ["apt-get", "install", "-y", "-qq", *prerequisites],
+            "Installing prerequisites"
+        )
+        invalidate_package_status(*prerequisites)
+        if not success:
+            return False, f"Failed: Installing prerequisites - {stderr}"
+
+    # Resolve distribution details once instead of in repeated subshells
+    try:
+        with open('/etc/os-release') as f:
+            os_release = dict(line.strip().split('=', 1) for line in f if '=' in line)
+        arch = subprocess.check_output(["dpkg", "--print-architecture"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError) as e:
+        return False, f"Failed to detect distribution: {e}"
+
+    os_ids = [os_release.get('ID', '').strip('"')] + os_release.get('ID_LIKE', '').strip('"').split()
+    distro = "ubuntu" if "ubuntu" in os_ids else "debian"
+    codename = (os_release.get('UBUNTU_CODENAME') if distro == "ubuntu" else None) or os_release.get('VERSION_CODENAME', '')
+    codename = codename.strip('"')
+    if not codename:
+        return False, "Could not determine VERSION_CODENAME from /etc/os-release"
 
     steps = [
-        ("apt-get update -qq", "Updating package list"),
-        ("apt-get install -y -qq ca-certificates curl gnupg", "Installing prerequisites"),
-        ("install -m 0755 -d /etc/apt/keyrings", "Creating keyrings directory"),
-        ("curl -fsSL https://download.docker.com/linux/ubuntu/gpg -o /etc/apt/keyrings/docker.asc || curl -fsSL https://download.docker.com/linux/debian/gpg -o /etc/apt/keyrings/docker.asc", "Downloading Docker GPG key"),
-        ("chmod a+r /etc/apt/keyrings/docker.asc", "Setting GPG key permissions"),
+        (["install", "-m", "0755", "-d", "/etc/apt/keyrings"], "Creating keyrings directory"),
+        (["curl", "-fsSL", f"https://download.docker.com/linux/{distro}/gpg", "-o", "/etc/apt/keyrings/docker.asc"], "Downloading Docker GPG key"),
+        (["chmod", "a+r", "/etc/apt/keyrings/docker.asc"], "Setting GPG key permissions"),
     ]
 
     for cmd, desc in steps:
@@ -608,163 +911,183 @@ def install_docker():
             return False, f"Failed: {desc} - {stderr}"
 
     # Add Docker repository
-    repo_cmd = '''echo "deb [arch=$(dpkg --print-architecture) signed-by=/etc/apt/keyrings/docker.asc] https://download.docker.com/linux/ubuntu $(. /etc/os-release && echo "$VERSION_CODENAME") stable" | tee /etc/apt/sources.list.d/docker.list > /dev/null || echo "deb [arch=$(dpkg --print-architecture) signed-by=/etc/apt/keyrings/docker.asc] https://download.docker.com/linux/debian $(. /etc/os-release && echo "$VERSION_CODENAME") stable" | tee /etc/apt/sources.list.d/docker.list > /dev/null'''
+    logger.info("Running: Adding Docker repository")
+    try:
+        Path("/etc/apt/sources.list.d/docker.list").write_text(
+            f"deb [arch={arch} signed-by=/etc/apt/keyrings/docker.asc] "
+            f"https://download.docker.com/linux/{distro} {codename} stable\n"
+        )
+    except OSError as e:
+        return False, f"Failed to add Docker repository: {e}"
 
-    success, _, stderr = run_command(repo_cmd, "Adding Docker repository")
-    if not success:
-        return False, f"Failed to add Docker repository: {stderr}"
+    return True, "Docker repository added"
 
-    success, _, stderr = run_command("apt-get update -qq", "Updating package list")
-    if not success:
-        return False, f"Failed to update package list: {stderr}"
+def install_system_packages(config):
+    """Install Docker, PostgreSQL and the web server in a single apt transaction.
 
-    success, _, stderr = run_command(
-        "DEBIAN_FRONTEND=noninteractive apt-get install -y -qq docker-ce docker-ce-cli containerd.io docker-buildx-plugin docker-compose-plugin",
-        "Installing Docker packages"
-    )
-    if not success:
-        return False, f"Failed to install Docker: {stderr}"
+    Batching avoids repeated resolver runs and dpkg trigger passes. Packages
+    that are already installed are left out of the transaction.
+    """
+    logger.info("Installing system packages...")
 
-    return True, "Docker installed successfully"
+    packages = DOCKER_PACKAGES + POSTGRESQL_PACKAGES
+    web_server = config.get('webServer', 'nginx' if not config.get('skipNginx') else 'none')
+    if web_server in ('nginx', 'apache2'):
+        packages.append(web_server)
 
-def install_postgresql():
-    """Install PostgreSQL via apt."""
-    logger.info("Installing PostgreSQL...")
+    missing = [p for p in packages if not check_package_installed(p)]
+    if not missing:
+        return True, "System packages are already installed"
 
-    if check_package_installed("postgresql"):
-        return True, "PostgreSQL is already installed"
+    if any(p in DOCKER_PACKAGES for p in missing):
+        success, message = add_docker_repository()
+        if not success:
+            return False, message
 
-    success, _, stderr = run_command("apt-get update -qq", "Updating package list")
+        # Sources changed, so the cached package list is stale
+        success, _, stderr = apt_update_if_needed(force=True)
+    else:
+        success, _, stderr = apt_update_if_needed()
     if not success:
         return False, f"Failed to update package list: {stderr}"
 
     success, _, stderr = run_command(
-        "DEBIAN_FRONTEND=noninteractive apt-get install -y -qq postgresql postgresql-contrib",
-        "Installing PostgreSQL"
+        ["apt-get", "install", "-y", "-qq", *missing],
+        "Installing system packages",
+        env={"DEBIAN_FRONTEND": "noninteractive"}
     )
+    invalidate_package_status(*missing)
     if not success:
-        return False, f"Failed to install PostgreSQL: {stderr}"
-
-    # Start PostgreSQL
-    success, _, stderr = run_command("systemctl enable postgresql", "Enabling PostgreSQL")
-    success, _, stderr = run_command("systemctl start postgresql", "Starting PostgreSQL")
+        return False, f"Failed to install system packages: {stderr}"
 
-    return True, "PostgreSQL installed successfully"
+    return True, f"Installed {', '.join(missing)}"
 
-def install_nginx():
-    """Install Nginx via apt."""
-    logger.info("Installing Nginx...")
+def enable_postgresql():
+    """Enable and start the PostgreSQL service."""
+    logger.info("Starting PostgreSQL...")
 
-    if check_package_installed("nginx"):
-        return True, "Nginx is already installed"
+    success, _, stderr = run_command(["systemctl", "enable", "postgresql"], "Enabling PostgreSQL")
+    success, _, stderr = run_command(["systemctl", "start", "postgresql"], "Starting PostgreSQL")
 
-    success, _, stderr = run_command(
-        "DEBIAN_FRONTEND=noninteractive apt-get install -y -qq nginx",
-        "Installing Nginx"
-    )
-    if not success:
-        return False, f"Failed to install Nginx: {stderr}"
+    return True, "PostgreSQL started successfully"
 
-    success, _, stderr = run_command("systemctl enable nginx", "Enabling Nginx")
-    success, _, stderr = run_command("systemctl start nginx", "Starting Nginx")
+def enable_nginx():
+    """Enable and start the Nginx service."""
+    logger.info("Starting Nginx...")
 
-    return True, "Nginx installed successfully"
+    success, _, stderr = run_command(["systemctl", "enable", "nginx"], "Enabling Nginx")
+    success, _, stderr = run_command(["systemctl", "start", "nginx"], "Starting Nginx")
 
-def install_apache2():
-    """Install Apache2 and enable required modules."""
-    logger.info("Installing Apache2...")
+    return True, "Nginx started successfully"
 
-    if check_package_installed("apache2"):
-        logger.info("Apache2 is already installed")
-    else:
-        success, _, stderr = run_command(
-            "DEBIAN_FRONTEND=noninteractive apt-get install -y -qq apache2",
-            "Installing Apache2"
-        )
-        if not success:
-            return False, f"Failed to install Apache2: {stderr}"
+def enable_apache2():
+    """Enable required Apache2 modules and start the service."""
+    logger.info("Configuring Apache2...")
 
     # Enable required modules
     modules = ['proxy', 'proxy_http', 'proxy_wstunnel', 'ssl', 'rewrite', 'headers']
     for mod in modules:
-        success, _, stderr = run_command(f"a2enmod {mod}", f"Enabling Apache2 module: {mod}")
+        success, _, stderr = run_command(["a2enmod", mod], f"Enabling Apache2 module: {mod}")
         if not success:
             return False, f"Failed to enable Apache2 module {mod}: {stderr}"
 
-    success, _, stderr = run_command("systemctl enable apache2", "Enabling Apache2")
-    success, _, stderr = run_command("systemctl start apache2", "Starting Apache2")
+    success, _, stderr = run_command(["systemctl", "enable", "apache2"], "Enabling Apache2")
+    success, _, stderr = run_command(["systemctl", "start", "apache2"], "Starting Apache2")
+
+    return True, "Apache2 configured successfully"
 
-    return True, "Apache2 installed successfully"
+_LISTEN_ADDRESSES_RE = re.compile(r"#?listen_addresses = 'localhost'")
 
 def configure_postgresql(config):
     """Configure PostgreSQL for Docker network access."""
     logger.info("Configuring PostgreSQL...")
 
     # Find PostgreSQL config directory
-    success, pg_config_dir, _ = run_command(
-        "find /etc/postgresql -type d -name 'main' | head -1",
-        "Finding PostgreSQL config directory",
-        check=False
-    )
-
-    if not success or not pg_config_dir.strip():
+    pg_config_dirs = sorted(glob.glob('/etc/postgresql/*/main'))
+    if not pg_config_dirs:
         return False, "Could not find PostgreSQL configuration directory"
 
-    pg_config_dir = pg_config_dir.strip()
+    pg_config_dir = pg_config_dirs[0]
     pg_hba_conf = f"{pg_config_dir}/pg_hba.conf"
     postgresql_conf = f"{pg_config_dir}/postgresql.conf"
 
     # Backup files
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_command(f"cp {pg_hba_conf} {pg_hba_conf}.backup_{timestamp}", "Backing up pg_hba.conf")
-    run_command(f"cp {postgresql_conf} {postgresql_conf}.backup_{timestamp}", "Backing up postgresql.conf")
-
-    # Add Docker networks to pg_hba.conf
-    # Use 172.16.0.0/12 to cover all Docker bridge networks (172.16.0.0 - 172.31.255.255)
-    docker_hba_entry = "host    all    all    172.16.0.0/12    md5"
-    success, _, _ = run_command(
-        f"grep -q '172.16.0.0/12' {pg_hba_conf} || echo '{docker_hba_entry}' >> {pg_hba_conf}",
-        "Adding Docker network range to pg_hba.conf"
-    )
+    backup_file(pg_hba_conf, "Backing up pg_hba.conf")
+    backup_file(postgresql_conf, "Backing up postgresql.conf")
 
-    # Set listen_addresses
-    success, _, _ = run_command(
-        f"sed -i \"s/#listen_addresses = 'localhost'/listen_addresses = '*'/g\" {postgresql_conf}",
-        "Setting listen_addresses in postgresql.conf"
-    )
-    success, _, _ = run_command(
-        f"sed -i \"s/listen_addresses = 'localhost'/listen_addresses = '*'/g\" {postgresql_conf}",
-        "Setting listen_addresses in postgresql.conf"
-    )
+    try:
+        # Add Docker networks to pg_hba.conf
+        # Use 172.16.0.0/12 to cover all Docker bridge networks (172.16.0.0 - 172.31.255.255)
+        logger.info("Running: Adding Docker network range to pg_hba.conf")
+        docker_hba_entry = "host    all    all    172.16.0.0/12    md5"
+        ensure_line(pg_hba_conf, '172.16.0.0/12', docker_hba_entry)
+
+        # Set listen_addresses (commented or not) in a single read-modify-write
+        logger.info("Running: Setting listen_addresses in postgresql.conf")
+        text = Path(postgresql_conf).read_text()
+        new_text = _LISTEN_ADDRESSES_RE.sub("listen_addresses = '*'", text)
+        if new_text != text:
+            Path(postgresql_conf).write_text(new_text)
+    except OSError as e:
+        return False, f"Failed to update PostgreSQL configuration: {e}"
 
     # Restart PostgreSQL
-    success, _, stderr = run_command("systemctl restart postgresql", "Restarting PostgreSQL")
+    success, _, stderr = run_command(["systemctl", "restart", "postgresql"], "Restarting PostgreSQL")
     if not success:
         return False, f"Failed to restart PostgreSQL: {stderr}"
 
     return True, "PostgreSQL configured successfully"
 
+def _sql_literal(value):
+    """Quote a value as a PostgreSQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
 def create_database_users(config):
-    """Create database users for each environment."""
+    """Create database users for each environment.
+
+    All checks and CREATE USER statements run in a single psql session fed
+    on stdin, so passwords never appear on a command line and values are
+    quoted by PostgreSQL's format() rather than interpolated into shell.
+    """
     logger.info("Creating database users...")
 
-    for env, env_name in [('Test', 'test'), ('Staging', 'staging'), ('Prod', 'prod')]:
-        db_user = config[f'dbUser{env}']
-        db_pass = config[f'dbPass{env}']
+    users = {}
+    for env in ENV_NAMES:
+        users.setdefault(config[ENV_KEYS[env]['dbUser']], config[ENV_KEYS[env]['dbPass']])
+
+    names = ", ".join(_sql_literal(user) for user in users)
+    values = ", ".join(f"({_sql_literal(user)}, {_sql_literal(password)})" for user, password in users.items())
+    script = (
+        f"SELECT rolname FROM pg_roles WHERE rolname IN ({names});\n"
+        # Create user with CREATEDB privilege so Odoo can create databases
+        "SELECT format('CREATE USER %I WITH LOGIN PASSWORD %L CREATEDB', u, p) "
+        f"FROM (VALUES {values}) AS v(u, p) "
+        "WHERE NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = v.u)\n"
+        "\\gexec\n"
+    )
+
+    logger.info(f"Running: Creating users {', '.join(users)}")
+    try:
+        result = subprocess.run(
+            ["sudo", "-u", "postgres", "psql", "-v", "ON_ERROR_STOP=1", "-qtA"],
+            input=script,
+            capture_output=True,
+            text=True,
+            timeout=120
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return False, f"Failed to create database users: {e}"
 
-        # Check if user exists
-        check_cmd = f"sudo -u postgres psql -tAc \"SELECT 1 FROM pg_roles WHERE rolname='{db_user}'\" 2>/dev/null || true"
-        success, stdout, _ = run_command(check_cmd, f"Checking if user {db_user} exists", check=False)
+    if result.returncode != 0:
+        logger.error(f"Error: {result.stderr}")
+        return False, f"Failed to create database users: {result.stderr.strip()}"
 
-        if stdout.strip() == '1':
-            logger.info(f"User {db_user} already exists, skipping creation")
+    existing = set(result.stdout.split())
+    for user in users:
+        if user in existing:
+            logger.info(f"User {user} already exists, skipping creation")
         else:
-            # Create user with CREATEDB privilege so Odoo can create databases
-            create_cmd = f"sudo -u postgres psql -c \"CREATE USER {db_user} WITH LOGIN PASSWORD '{db_pass}' CREATEDB;\""
-            success, _, stderr = run_command(create_cmd, f"Creating user {db_user}")
-            if not success:
-                return False, f"Failed to create user {db_user}: {stderr}"
-            logger.info(f"Created user {db_user} with CREATEDB privilege")
+            logger.info(f"Created user {user} with CREATEDB privilege")
 
     logger.info("PostgreSQL user creation completed")
     return True, "Database users created successfully. Databases will be created by Odoo on first access."
@@ -775,7 +1098,7 @@ def create_directory_structure(config):
 
     base_path = config['basePath']
 
-    for env in ['test', 'staging', 'prod']:
+    for env in ENV_NAMES.values():
         dirs = [
             f"{base_path}/{env}/addons",
             f"{base_path}/{env}/filestore"
@@ -783,8 +1106,18 @@ def create_directory_structure(config):
 
         for directory in dirs:
             Path(directory).mkdir(parents=True, exist_ok=True)
-            # Set ownership to Odoo container user (UID 100, GID 101)
-            run_command(f"chown -R 100:101 {directory}", f"Setting ownership for {directory}")
+            # Set ownership to Odoo container user (UID 100, GID 101).
+            # Skip the recursive walk on re-runs where it is already correct,
+            # since a populated filestore can hold many files.
+            st = os.stat(directory)
+            if (st.st_uid, st.st_gid) == (100, 101):
+                logger.info(f"Ownership already set for {directory}, skipping")
+                continue
+            logger.info(f"Setting ownership for {directory}")
+            try:
+                chown_recursive(directory, 100, 101)
+            except OSError as e:
+                logger.error(f"Failed to set ownership for {directory}: {e}")
 
     return True, "Directory structure created successfully"
 
@@ -795,12 +1128,12 @@ def generate_docker_compose(config):
 
     services = {}
 
-    for env, env_name in [('Test', 'test'), ('Staging', 'staging'), ('Prod', 'prod')]:
-        db_user = config[f'dbUser{env}']
-        db_pass = config[f'dbPass{env}']
-        http_port = config[f'portHttp{env}']
-        lp_port = config[f'portLp{env}']
-        container_name = config[f'containerName{env}']
+    for env, env_name in ENV_NAMES.items():
+        db_user = config[ENV_KEYS[env]['dbUser']]
+        db_pass = config[ENV_KEYS[env]['dbPass']]
+        http_port = config[ENV_KEYS[env]['portHttp']]
+        lp_port = config[ENV_KEYS[env]['portLp']]
+        container_name = config[ENV_KEYS[env]['containerName']]
 
         services[container_name] = {
             'image': f'odoo:{odoo_version}',
@@ -830,43 +1163,43 @@ def generate_docker_compose(config):
     }
 
     # Convert to YAML-like format manually (to avoid pyyaml dependency)
-    yaml_content = "version: '3.8'\n\nservices:\n"
+    parts = ["version: '3.8'\n\nservices:\n"]
 
     for service_name, service_config in services.items():
-        yaml_content += f"  {service_name}:\n"
-        yaml_content += f"    image: {service_config['image']}\n"
-        yaml_content += f"    container_name: {service_config['container_name']}\n"
-        yaml_content += f"    restart: {service_config['restart']}\n"
-        yaml_content += "    ports:\n"
+        parts.append(f"  {service_name}:\n")
+        parts.append(f"    image: {service_config['image']}\n")
+        parts.append(f"    container_name: {service_config['container_name']}\n")
+        parts.append(f"    restart: {service_config['restart']}\n")
+        parts.append("    ports:\n")
         for port in service_config['ports']:
-            yaml_content += f"      - '{port}'\n"
-        yaml_content += "    environment:\n"
+            parts.append(f"      - '{port}'\n")
+        parts.append("    environment:\n")
         for key, value in service_config['environment'].items():
-            yaml_content += f"      {key}: {value}\n"
-        yaml_content += "    volumes:\n"
+            parts.append(f"      {key}: {value}\n")
+        parts.append("    volumes:\n")
         for volume in service_config['volumes']:
-            yaml_content += f"      - {volume}\n"
-        yaml_content += "    extra_hosts:\n"
+            parts.append(f"      - {volume}\n")
+        parts.append("    extra_hosts:\n")
         for host in service_config['extra_hosts']:
-            yaml_content += f"      - {host}\n"
-        yaml_content += "\n"
+            parts.append(f"      - {host}\n")
+        parts.append("\n")
 
-    return yaml_content
+    return "".join(parts)
 
 def generate_nginx_config(config):
     """Generate Nginx configuration."""
     skip_ssl = config.get('skipSSL', False)
 
-    nginx_conf = ""
+    parts = []
 
-    for env, env_name in [('Test', 'test'), ('Staging', 'staging'), ('Prod', 'prod')]:
-        domain = config[f'domain{env}']
-        http_port = config[f'portHttp{env}']
-        lp_port = config[f'portLp{env}']
+    for env, env_name in ENV_NAMES.items():
+        domain = config[ENV_KEYS[env]['domain']]
+        http_port = config[ENV_KEYS[env]['portHttp']]
+        lp_port = config[ENV_KEYS[env]['portLp']]
 
         if skip_ssl:
             # HTTP only
-            nginx_conf += f"""
+            parts.append(f"""
 # {env} Environment - HTTP Only
 server {{
     listen 80;
@@ -892,13 +1225,13 @@ server {{
     }}
 }}
 
-"""
+""")
         else:
             # HTTPS
-            ssl_cert = config[f'sslCert{env}']
-            ssl_key = config[f'sslKey{env}']
+            ssl_cert = config[ENV_KEYS[env]['sslCert']]
+            ssl_key = config[ENV_KEYS[env]['sslKey']]
 
-            nginx_conf += f"""
+            parts.append(f"""
 # {env} Environment - HTTPS
 server {{
     listen 80;
@@ -935,23 +1268,23 @@ server {{
     }}
 }}
 
-"""
+""")
 
-    return nginx_conf
+    return "".join(parts)
 
 def generate_apache2_config(config):
     """Generate Apache2 configuration."""
     skip_ssl = config.get('skipSSL', False)
 
-    apache_conf = ""
+    parts = []
 
-    for env, env_name in [('Test', 'test'), ('Staging', 'staging'), ('Prod', 'prod')]:
-        domain = config[f'domain{env}']
-        http_port = config[f'portHttp{env}']
-        lp_port = config[f'portLp{env}']
+    for env, env_name in ENV_NAMES.items():
+        domain = config[ENV_KEYS[env]['domain']]
+        http_port = config[ENV_KEYS[env]['portHttp']]
+        lp_port = config[ENV_KEYS[env]['portLp']]
 
         if skip_ssl:
-            apache_conf += f"""
+            parts.append(f"""
 # {env} Environment - HTTP Only
 <VirtualHost *:80>
     ServerName {domain}
@@ -966,12 +1299,12 @@ def generate_apache2_config(config):
     RequestHeader set X-Forwarded-Host "%{{HTTP_HOST}}s"
 </VirtualHost>
 
-"""
+""")
         else:
-            ssl_cert = config[f'sslCert{env}']
-            ssl_key = config[f'sslKey{env}']
+            ssl_cert = config[ENV_KEYS[env]['sslCert']]
+            ssl_key = config[ENV_KEYS[env]['sslKey']]
 
-            apache_conf += f"""
+            parts.append(f"""
 # {env} Environment - HTTPS
 <VirtualHost *:80>
     ServerName {domain}
@@ -996,9 +1329,9 @@ def generate_apache2_config(config):
     RequestHeader set X-Forwarded-Host "%{{HTTP_HOST}}s"
 </VirtualHost>
 
-"""
+""")
 
-    return apache_conf
+    return "".join(parts)
 
 def copy_ssl_certificates(config):
     """Copy SSL certificate files to standard system locations.
@@ -1012,10 +1345,10 @@ def copy_ssl_certificates(config):
 
     skip_prefixes = ('/etc/ssl/', '/etc/letsencrypt/')
 
-    for env in ('Test', 'Staging', 'Prod'):
-        cert_key = f'sslCert{env}'
-        key_key = f'sslKey{env}'
-        domain = config.get(f'domain{env}', env.lower())
+    for env in ENV_NAMES:
+        cert_key = ENV_KEYS[env]['sslCert']
+        key_key = ENV_KEYS[env]['sslKey']
+        domain = config.get(ENV_KEYS[env]['domain'], env.lower())
 
         ssl_cert = config.get(cert_key, '')
         ssl_key_path = config.get(key_key, '')
@@ -1028,7 +1361,7 @@ def copy_ssl_certificates(config):
             dest_cert = f"/etc/ssl/certs/odoo-{domain}.crt"
             os.makedirs("/etc/ssl/certs", exist_ok=True)
             success, _, stderr = run_command(
-                f"cp {ssl_cert} {dest_cert}",
+                ["cp", ssl_cert, dest_cert],
                 f"Copying SSL certificate for {env}"
             )
             if not success:
@@ -1042,7 +1375,7 @@ def copy_ssl_certificates(config):
             dest_key = f"/etc/ssl/private/odoo-{domain}.key"
             os.makedirs("/etc/ssl/private", exist_ok=True)
             success, _, stderr = run_command(
-                f"cp {ssl_key_path} {dest_key}",
+                ["cp", ssl_key_path, dest_key],
                 f"Copying SSL private key for {env}"
             )
             if not success:
@@ -1053,25 +1386,29 @@ def copy_ssl_certificates(config):
 
     return True, "SSL certificates copied to /etc/ssl/"
 
+WEB_SERVER_CONF_PATHS = {
+    'nginx': "/etc/nginx/sites-available/odoo",
+    'apache2': "/etc/apache2/sites-available/odoo.conf",
+}
+
 def write_configuration_files(config):
     """Write docker-compose.yml and nginx config."""
     logger.info("Writing configuration files...")
 
     base_path = config['basePath']
-
-    # Generate and write docker-compose.yml
-    docker_compose = generate_docker_compose(config)
     docker_compose_path = f"{base_path}/docker-compose.yml"
+    web_server = config.get('webServer', 'nginx' if not config.get('skipNginx') else 'none')
+    web_conf_path = WEB_SERVER_CONF_PATHS.get(web_server)
 
-    # Backup existing file if present
-    if os.path.exists(docker_compose_path):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        run_command(f"cp {docker_compose_path} {docker_compose_path}.backup_{timestamp}", "Backing up docker-compose.yml")
-
-    with open(docker_compose_path, 'w') as f:
-        f.write(docker_compose)
+    # Backups and compose generation touch disjoint paths, so overlap them
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        compose_future = executor.submit(generate_docker_compose, config)
+        executor.submit(backup_file, docker_compose_path, "Backing up docker-compose.yml")
+        if web_conf_path:
+            executor.submit(backup_file, web_conf_path, f"Backing up {web_server} config")
+    docker_compose = compose_future.result()
 
-    web_server = config.get('webServer', 'nginx' if not config.get('skipNginx') else 'none')
+    atomic_write(docker_compose_path, docker_compose, 0o644)
 
     # Skip web server configuration if none selected
     if web_server == 'none':
@@ -1088,15 +1425,9 @@ def write_configuration_files(config):
     if web_server == 'nginx':
         # Generate and write nginx config
         nginx_conf = generate_nginx_config(config)
-        nginx_conf_path = "/etc/nginx/sites-available/odoo"
+        nginx_conf_path = web_conf_path
 
-        # Backup existing file if present
-        if os.path.exists(nginx_conf_path):
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            run_command(f"cp {nginx_conf_path} {nginx_conf_path}.backup_{timestamp}", "Backing up nginx config")
-
-        with open(nginx_conf_path, 'w') as f:
-            f.write(nginx_conf)
+        atomic_write(nginx_conf_path, nginx_conf, 0o644)
 
         # Create symlink
         symlink_path = "/etc/nginx/sites-enabled/odoo"
@@ -1105,40 +1436,34 @@ def write_configuration_files(config):
         os.symlink(nginx_conf_path, symlink_path)
 
         # Test nginx config
-        success, _, stderr = run_command("nginx -t", "Testing Nginx configuration")
+        success, _, stderr = run_command(["nginx", "-t"], "Testing Nginx configuration")
         if not success:
             return False, f"Nginx configuration test failed: {stderr}"
 
         # Reload nginx
-        success, _, stderr = run_command("systemctl reload nginx", "Reloading Nginx")
+        success, _, stderr = run_command(["systemctl", "reload", "nginx"], "Reloading Nginx")
         if not success:
             return False, f"Failed to reload Nginx: {stderr}"
 
     elif web_server == 'apache2':
         # Generate and write apache config
         apache_conf = generate_apache2_config(config)
-        apache_conf_path = "/etc/apache2/sites-available/odoo.conf"
-
-        # Backup existing file if present
-        if os.path.exists(apache_conf_path):
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            run_command(f"cp {apache_conf_path} {apache_conf_path}.backup_{timestamp}", "Backing up Apache2 config")
+        apache_conf_path = web_conf_path
 
-        with open(apache_conf_path, 'w') as f:
-            f.write(apache_conf)
+        atomic_write(apache_conf_path, apache_conf, 0o644)
 
         # Enable the site
-        success, _, stderr = run_command("a2ensite odoo", "Enabling Apache2 odoo site")
+        success, _, stderr = run_command(["a2ensite", "odoo"], "Enabling Apache2 odoo site")
         if not success:
             return False, f"Failed to enable Apache2 site: {stderr}"
 
         # Test apache config
-        success, _, stderr = run_command("apache2ctl configtest", "Testing Apache2 configuration")
+        success, _, stderr = run_command(["apache2ctl", "configtest"], "Testing Apache2 configuration")
         if not success:
             return False, f"Apache2 configuration test failed: {stderr}"
 
         # Reload apache
-        success, _, stderr = run_command("systemctl reload apache2", "Reloading Apache2")
+        success, _, stderr = run_command(["systemctl", "reload", "apache2"], "Reloading Apache2")
         if not success:
             return False, f"Failed to reload Apache2: {stderr}"
 
@@ -1151,9 +1476,11 @@ def start_docker_containers(config):
     base_path = config['basePath']
     odoo_version = config['odooVersion']
 
-    # Pull Odoo image
+    compose_file = f"{base_path}/docker-compose.yml"
+
+    # Pull images for all services (the daemon fetches layers concurrently)
     success, _, stderr = run_command(
-        f"docker pull odoo:{odoo_version}",
+        ["docker", "compose", "-f", compose_file, "pull"],
         f"Pulling Odoo {odoo_version} image"
     )
     if not success:
@@ -1161,31 +1488,35 @@ def start_docker_containers(config):
 
     # Start containers
     success, _, stderr = run_command(
-        f"cd {base_path} && docker compose up -d",
+        ["docker", "compose", "-f", compose_file, "up", "-d"],
         "Starting Docker containers"
     )
     if not success:
         return False, f"Failed to start containers: {stderr}"
 
-    # Wait a bit for containers to start
-    time.sleep(3)
-
-    # Verify containers are running
-    success, stdout, _ = run_command(
-        "docker ps --format '{{.Names}}'",
-        "Checking container status",
-        check=False
-    )
-
-    running_containers = stdout.strip().split('\n') if stdout.strip() else []
     expected_containers = [
         config['containerNameTest'],
         config['containerNameStaging'],
         config['containerNameProd']
     ]
 
-    if not all(container in running_containers for container in expected_containers):
-        return False, f"Not all containers started. Running: {running_containers}"
+    # Poll until every container is running instead of sleeping a fixed time
+    deadline = time.monotonic() + CONTAINER_START_TIMEOUT
+    while True:
+        success, stdout, _ = run_command(
+            ["docker", "inspect", "-f", "{{.Name}} {{.State.Running}}", *expected_containers],
+            "Checking container status",
+            check=False
+        )
+        running_containers = [
+            line.split()[0].lstrip('/') for line in stdout.splitlines()
+            if line.strip().endswith(' true')
+        ]
+        if all(container in running_containers for container in expected_containers):
+            break
+        if time.monotonic() >= deadline:
+            return False, f"Not all containers started. Running: {running_containers}"
+        time.sleep(0.5)
 
     return True, "All Docker containers started successfully"
 
@@ -1231,10 +1562,7 @@ def save_credentials(config):
 
     # Save to file
     creds_file = "/root/odoo-installation-credentials.json"
-    with open(creds_file, 'w') as f:
-        json.dump(credentials, f, indent=2)
-
-    os.chmod(creds_file, 0o600)  # Only root can read
+    atomic_write(creds_file, json.dumps(credentials, indent=2), 0o600)  # Only root can read
 
     return creds_file
 
@@ -1242,9 +1570,32 @@ def save_credentials(config):
 # INTERACTIVE CLI FUNCTIONS
 # ============================================
 
+# Interactive step headers, parsed from markup once at import time
+STEP_TITLES = [
+    'Odoo Version',
+    'Base Domain',
+    'Database Configuration',
+    'Domain & SSL Configuration',
+    'Directory Configuration',
+    'Port Configuration',
+    'Container Names',
+    'Review Configuration',
+]
+STEP_HEADERS = {
+    i: Text.from_markup(f"\n[bold cyan]Step {i}: {title}[/bold cyan]")
+    for i, title in enumerate(STEP_TITLES, 1)
+}
+
 def show_welcome():
     """Display welcome screen."""
-    console.clear()
+    from rich import box
+    from rich.panel import Panel
+
+    # Clearing only makes sense on a real terminal; avoid the escape sequences otherwise
+    if console.is_terminal:
+        console.clear()
+    else:
+        console.print("\n" * 2)
 
     welcome_text = """
     ╔═══════════════════════════════════════════════════════════╗
@@ -1280,7 +1631,7 @@ def show_welcome():
 
 def collect_odoo_version():
     """Ask for Odoo version."""
-    console.print("\n[bold cyan]Step 1: Odoo Version[/bold cyan]")
+    console.print(STEP_HEADERS[1])
 
     version = safe_ask(questionary.select(
         "Select the Odoo version to install:",
@@ -1300,26 +1651,15 @@ def collect_odoo_version():
 
 def collect_base_domain():
     """Ask for the base domain name used to derive defaults for all environments."""
-    console.print("\n[bold cyan]Step 2: Base Domain[/bold cyan]")
+    console.print(STEP_HEADERS[2])
     console.print("[dim]This domain will be used to derive default values for all environments.[/dim]")
     console.print("[dim]  Production: domain.com | Staging: stg.domain.com | Test: test.domain.com[/dim]\n")
 
-    while True:
-        domain = safe_ask(questionary.text(
-            "Base domain name:",
-            default="example.com",
-            style=custom_style
-        ))
-
-        valid, msg = validate_domain(domain)
-        if valid:
-            return domain
-        else:
-            console.print(f"  [red]❌ {msg}[/red]")
+    return ask_validated("Base domain name:", "example.com", as_validator(validate_domain))
 
 def collect_database_config(odoo_version):
     """Collect database configuration."""
-    console.print("\n[bold cyan]Step 3: Database Configuration[/bold cyan]")
+    console.print(STEP_HEADERS[3])
 
     config = {}
     ver = odoo_version.split('.')[0]
@@ -1332,25 +1672,28 @@ def collect_database_config(odoo_version):
         'Prod': f'odoo{ver}_prod',
     }
 
+    # Fast path: default users with generated passwords, no per-field prompts
+    if safe_ask(questionary.confirm(
+        f"Use defaults ({', '.join(default_db_users.values())} with generated passwords)?",
+        default=True,
+        style=custom_style
+    )):
+        for env, env_display in ENV_PAIRS:
+            config[ENV_KEYS[env]['dbUser']] = default_db_users[env]
+            config[ENV_KEYS[env]['dbPass']] = generate_secure_password()
+            console.print(f"  [green]✓ {env_display}: {default_db_users[env]} / {config[ENV_KEYS[env]['dbPass']]}[/green]")
+        return config
+
     # For each environment
-    for env, env_display in [('Test', 'Test'), ('Staging', 'Staging'), ('Prod', 'Production')]:
+    for env, env_display in ENV_PAIRS:
         console.print(f"\n[yellow]● {env_display} Environment[/yellow]")
 
         # Database user
-        while True:
-            default_user = default_db_users[env]
-            db_user = safe_ask(questionary.text(
-                f"  Database user:",
-                default=default_user,
-                style=custom_style
-            ))
-
-            valid, msg = validate_database_name(db_user)
-            if valid:
-                config[f'dbUser{env}'] = db_user
-                break
-            else:
-                console.print(f"  [red]❌ {msg}[/red]")
+        config[ENV_KEYS[env]['dbUser']] = ask_validated(
+            "  Database user:",
+            default_db_users[env],
+            as_validator(validate_database_name)
+        )
 
         # Database password
         if safe_ask(questionary.confirm(
@@ -1360,27 +1703,27 @@ def collect_database_config(odoo_version):
         )):
             db_password = generate_secure_password()
             console.print(f"  [green]✓ Generated password: {db_password}[/green]")
-            config[f'dbPass{env}'] = db_password
+            config[ENV_KEYS[env]['dbPass']] = db_password
         else:
-            while True:
-                db_password = safe_ask(questionary.password(
-                    f"  Database password:",
-                    style=custom_style
-                ))
-                if len(db_password) >= 8:
-                    config[f'dbPass{env}'] = db_password
-                    break
-                else:
-                    console.print("  [red]❌ Password must be at least 8 characters.[/red]")
+            config[ENV_KEYS[env]['dbPass']] = ask_validated(
+                "  Database password:",
+                validate=lambda value: len(value) >= 8 or "Password must be at least 8 characters.",
+                prompt=questionary.password
+            )
 
     return config
 
 def collect_domain_ssl_config(base_domain):
     """Collect domain and SSL configuration."""
-    console.print("\n[bold cyan]Step 4: Domain & SSL Configuration[/bold cyan]")
+    console.print(STEP_HEADERS[4])
 
     config = {}
 
+    def validate_existing_file(path):
+        if _is_file(path):
+            return True
+        return f"File does not exist: {path}"
+
     # Ask which web server to use
     web_server_choice = safe_ask(questionary.select(
         "Select reverse proxy / web server:",
@@ -1401,8 +1744,8 @@ def collect_domain_ssl_config(base_domain):
         console.print("[yellow]→ Skipping web server configuration. Access Odoo directly via ports.[/yellow]")
         config['skipSSL'] = True
         # Set placeholder domains (not used but needed for config structure)
-        for env in ['Test', 'Staging', 'Prod']:
-            config[f'domain{env}'] = f"{env.lower()}.local"
+        for env in ENV_NAMES:
+            config[ENV_KEYS[env]['domain']] = f"{env.lower()}.local"
         return config
 
     # Ask if SSL should be configured
@@ -1421,86 +1764,65 @@ def collect_domain_ssl_config(base_domain):
     }
 
     # For each environment
-    for env, env_display in [('Test', 'Test'), ('Staging', 'Staging'), ('Prod', 'Production')]:
+    for env, env_display in ENV_PAIRS:
         console.print(f"\n[yellow]● {env_display} Environment[/yellow]")
 
         # Domain
-        while True:
-            default_domain = default_domains[env]
-            domain = safe_ask(questionary.text(
-                f"  Domain name:",
-                default=default_domain,
-                style=custom_style
-            ))
-
-            valid, msg = validate_domain(domain)
-            if valid:
-                config[f'domain{env}'] = domain
-                break
-            else:
-                console.print(f"  [red]❌ {msg}[/red]")
+        config[ENV_KEYS[env]['domain']] = ask_validated(
+            "  Domain name:",
+            default_domains[env],
+            as_validator(validate_domain)
+        )
 
-        # SSL certificate paths
+        # SSL certificate paths (one form, with path completion)
         if not skip_ssl:
-            while True:
-                default_cert = f"/etc/ssl/{base_domain}_fullchain.pem"
-                ssl_cert = safe_ask(questionary.text(
-                    f"  SSL certificate path:",
-                    default=default_cert,
+            ssl_paths = safe_ask(questionary.form(
+                cert=questionary.path(
+                    "  SSL certificate path:",
+                    default=f"/etc/ssl/{base_domain}_fullchain.pem",
+                    validate=validate_existing_file,
+                    validate_while_typing=False,
                     style=custom_style
-                ))
-
-                if os.path.exists(ssl_cert) and os.path.isfile(ssl_cert):
-                    config[f'sslCert{env}'] = ssl_cert
-                    break
-                else:
-                    console.print(f"  [red]❌ File does not exist: {ssl_cert}[/red]")
-
-            while True:
-                default_key = f"/etc/ssl/{base_domain}_private.key"
-                ssl_key = safe_ask(questionary.text(
-                    f"  SSL private key path:",
-                    default=default_key,
+                ),
+                key=questionary.path(
+                    "  SSL private key path:",
+                    default=f"/etc/ssl/{base_domain}_private.key",
+                    validate=validate_existing_file,
+                    validate_while_typing=False,
                     style=custom_style
-                ))
-
-                if os.path.exists(ssl_key) and os.path.isfile(ssl_key):
-                    config[f'sslKey{env}'] = ssl_key
-                    break
-                else:
-                    console.print(f"  [red]❌ File does not exist: {ssl_key}[/red]")
+                ),
+            ))
+            config[ENV_KEYS[env]['sslCert']] = ssl_paths['cert']
+            config[ENV_KEYS[env]['sslKey']] = ssl_paths['key']
 
     return config
 
 def collect_directory_config():
     """Collect directory configuration."""
-    console.print("\n[bold cyan]Step 5: Directory Configuration[/bold cyan]")
+    console.print(STEP_HEADERS[5])
 
+    # Only loops again if the user rejects the (valid) path at the confirmation
     while True:
-        base_path = safe_ask(questionary.text(
+        base_path = ask_validated(
             "Base directory for Odoo data:",
-            default="/srv/odoo",
-            style=custom_style
-        ))
+            "/srv/odoo",
+            as_validator(validate_path)
+        )
 
-        valid, msg = validate_path(base_path)
-        if valid:
-            console.print(f"\n[dim]Directory structure that will be created:[/dim]")
-            for env in ['test', 'staging', 'prod']:
-                console.print(f"[dim]  • {base_path}/{env}/addons[/dim]")
-                console.print(f"[dim]  • {base_path}/{env}/filestore[/dim]")
+        console.print(f"\n[dim]Directory structure that will be created:[/dim]")
+        for env in ENV_NAMES.values():
+            console.print(f"[dim]  • {base_path}/{env}/addons[/dim]")
+            console.print(f"[dim]  • {base_path}/{env}/filestore[/dim]")
 
-            if safe_confirm("\nContinue with this path?", default=True):
-                return {'basePath': base_path}
-        else:
-            console.print(f"[red]❌ {msg}[/red]")
+        if safe_confirm("\nContinue with this path?", default=True):
+            return {'basePath': base_path}
 
 def collect_port_config():
     """Collect port configuration."""
-    console.print("\n[bold cyan]Step 6: Port Configuration[/bold cyan]")
+    console.print(STEP_HEADERS[6])
 
     config = {}
-    used_ports = []
+    used_ports = set()
 
     defaults = {
         'Test': {'http': 8071, 'lp': 8074},
@@ -1508,50 +1830,48 @@ def collect_port_config():
         'Prod': {'http': 8069, 'lp': 8072}
     }
 
-    for env, env_display in [('Test', 'Test'), ('Staging', 'Staging'), ('Prod', 'Production')]:
+    # Probe every default up front; only custom ports are checked on demand
+    probed = check_ports_available(
+        [defaults[env][kind] for kind in ('http', 'lp') for env, _ in ENV_PAIRS]
+    )
+
+    def port_available(port):
+        available = probed.get(port)
+        return check_port_available(port) if available is None else available
+
+    def validate_free_port(value):
+        if not validate_port(value) or int(value) in used_ports:
+            return "Invalid port or already used in configuration."
+        if not port_available(int(value)):
+            return f"Port {value} is already in use."
+        return True
+
+    for env, env_display in ENV_PAIRS:
         console.print(f"\n[yellow]● {env_display} Environment[/yellow]")
 
         # HTTP port
-        while True:
-            http_port = safe_ask(questionary.text(
-                f"  HTTP port:",
-                default=str(defaults[env]['http']),
-                style=custom_style
-            ))
-
-            if validate_port(http_port) and int(http_port) not in used_ports:
-                if check_port_available(int(http_port)):
-                    config[f'portHttp{env}'] = int(http_port)
-                    used_ports.append(int(http_port))
-                    break
-                else:
-                    console.print(f"  [red]❌ Port {http_port} is already in use.[/red]")
-            else:
-                console.print(f"  [red]❌ Invalid port or already used in configuration.[/red]")
+        http_port = int(ask_validated(
+            "  HTTP port:",
+            str(defaults[env]['http']),
+            validate_free_port
+        ))
+        config[ENV_KEYS[env]['portHttp']] = http_port
+        used_ports.add(http_port)
 
         # Long-polling port
-        while True:
-            lp_port = safe_ask(questionary.text(
-                f"  Long-polling port:",
-                default=str(defaults[env]['lp']),
-                style=custom_style
-            ))
-
-            if validate_port(lp_port) and int(lp_port) not in used_ports:
-                if check_port_available(int(lp_port)):
-                    config[f'portLp{env}'] = int(lp_port)
-                    used_ports.append(int(lp_port))
-                    break
-                else:
-                    console.print(f"  [red]❌ Port {lp_port} is already in use.[/red]")
-            else:
-                console.print(f"  [red]❌ Invalid port or already used in configuration.[/red]")
+        lp_port = int(ask_validated(
+            "  Long-polling port:",
+            str(defaults[env]['lp']),
+            validate_free_port
+        ))
+        config[ENV_KEYS[env]['portLp']] = lp_port
+        used_ports.add(lp_port)
 
     return config
 
 def collect_container_names(odoo_version):
     """Collect container names for each environment."""
-    console.print("\n[bold cyan]Step 7: Container Names[/bold cyan]")
+    console.print(STEP_HEADERS[7])
     console.print("[dim]Customize the Docker container names for each environment.[/dim]\n")
 
     config = {}
@@ -1562,69 +1882,79 @@ def collect_container_names(odoo_version):
         'Staging': f'odoo{ver}-stg',
         'Prod': f'odoo{ver}-prod'
     }
+    seen_containers = set()
 
-    for env, env_display in [('Test', 'Test'), ('Staging', 'Staging'), ('Prod', 'Production')]:
-        console.print(f"[yellow]● {env_display} Environment[/yellow]")
+    def validate_container_name(container_name):
+        # Validate container name (Docker naming rules)
+        # Container names must match: [a-zA-Z0-9][a-zA-Z0-9_.-]*
+        if not container_name:
+            return "Container name cannot be empty."
 
-        while True:
-            container_name = safe_ask(questionary.text(
-                f"  Container name:",
-                default=defaults[env],
-                style=custom_style
-            ))
+        if not is_valid_container_name(container_name):
+            return "Invalid container name. Must start with letter/number and contain only letters, numbers, underscores, dots, and hyphens."
 
-            # Validate container name (Docker naming rules)
-            # Container names must match: [a-zA-Z0-9][a-zA-Z0-9_.-]*
-            if not container_name:
-                console.print("  [red]❌ Container name cannot be empty.[/red]")
-                continue
+        # Check for uniqueness
+        if container_name in seen_containers:
+            return "Container name already used for another environment."
 
-            if not re.match(r'^[a-zA-Z0-9][a-zA-Z0-9_.-]*$', container_name):
-                console.print("  [red]❌ Invalid container name. Must start with letter/number and contain only letters, numbers, underscores, dots, and hyphens.[/red]")
-                continue
+        return True
 
-            # Check for uniqueness
-            existing_names = [config.get(f'containerName{e}') for e in ['Test', 'Staging', 'Prod'] if f'containerName{e}' in config]
-            if container_name in existing_names:
-                console.print("  [red]❌ Container name already used for another environment.[/red]")
-                continue
+    for env, env_display in ENV_PAIRS:
+        console.print(f"[yellow]● {env_display} Environment[/yellow]")
 
-            config[f'containerName{env}'] = container_name
-            break
+        container_name = ask_validated(
+            "  Container name:",
+            defaults[env],
+            validate_container_name
+        )
+        seen_containers.add(container_name)
+        config[ENV_KEYS[env]['containerName']] = container_name
 
     return config
 
 def review_configuration(config):
     """Display configuration summary for review."""
-    console.print("\n[bold cyan]Step 8: Review Configuration[/bold cyan]")
+    from rich import box
+    from rich.console import Group
+    from rich.table import Table
 
     # Create summary table
     table = Table(title="Installation Configuration Summary", box=box.ROUNDED, show_header=True, header_style="bold magenta")
     table.add_column("Setting", style="cyan", no_wrap=True)
     table.add_column("Value", style="green")
 
-    web_server = config.get('webServer', 'nginx' if not config.get('skipNginx') else 'none')
+    skip_nginx = bool(config.get('skipNginx'))
+    skip_ssl = bool(config.get('skipSSL'))
+    web_server = config.get('webServer', 'nginx' if not skip_nginx else 'none')
     web_server_display = {'nginx': 'Nginx', 'apache2': 'Apache2', 'none': 'None (direct port access)'}
 
-    table.add_row("Odoo Version", config['odooVersion'])
-    table.add_row("Base Path", config['basePath'])
-    table.add_row("Web Server", web_server_display.get(web_server, web_server))
-    table.add_row("SSL Enabled", "No (HTTP only)" if config.get('skipSSL') else "Yes (HTTPS)")
-    table.add_row("", "")
-
-    for env, env_display in [('Test', 'Test'), ('Staging', 'Staging'), ('Prod', 'Production')]:
-        table.add_row(f"[bold]{env_display} Environment[/bold]", "")
-        table.add_row(f"  Container Name", config[f'containerName{env}'])
-        if not config.get('skipNginx'):
-            table.add_row(f"  Domain", config[f'domain{env}'])
-        table.add_row(f"  DB User", config[f'dbUser{env}'])
-        table.add_row(f"  HTTP Port", str(config[f'portHttp{env}']))
-        table.add_row(f"  Long-polling Port", str(config[f'portLp{env}']))
-        if not config.get('skipSSL') and not config.get('skipNginx'):
-            table.add_row(f"  SSL Certificate", config[f'sslCert{env}'])
-        table.add_row("", "")
+    rows = [
+        ("Odoo Version", config['odooVersion']),
+        ("Base Path", config['basePath']),
+        ("Web Server", web_server_display.get(web_server, web_server)),
+        ("SSL Enabled", "No (HTTP only)" if skip_ssl else "Yes (HTTPS)"),
+        ("", ""),
+    ]
 
-    console.print(table)
+    for env, env_display in ENV_PAIRS:
+        keys = ENV_KEYS[env]
+        rows.append((f"[bold]{env_display} Environment[/bold]", ""))
+        rows.append(("  Container Name", config[keys['containerName']]))
+        if not skip_nginx:
+            rows.append(("  Domain", config[keys['domain']]))
+        rows.extend([
+            ("  DB User", config[keys['dbUser']]),
+            ("  HTTP Port", str(config[keys['portHttp']])),
+            ("  Long-polling Port", str(config[keys['portLp']])),
+        ])
+        if not skip_ssl and not skip_nginx:
+            rows.append(("  SSL Certificate", config[keys['sslCert']]))
+        rows.append(("", ""))
+
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(Group(STEP_HEADERS[8], table))
 
     return safe_ask(questionary.confirm(
         "\nProceed with installation?",
@@ -1633,107 +1963,132 @@ def review_configuration(config):
     ))
 
 def run_installation(config):
-    """Execute the full installation with progress tracking."""
+    """Execute the full installation with progress tracking.
+
+    Steps are grouped into stages. Stages run in order, and the steps
+    inside a stage are independent of each other, so they run concurrently.
+    """
     console.print("\n[bold green]Starting Installation...[/bold green]\n")
 
-    steps = [
-        ("Installing Docker", install_docker),
-        ("Installing PostgreSQL", install_postgresql),
-    ]
+    # Package installs stay in one apt transaction (dpkg allows only one at
+    # a time); the service startups that follow don't depend on each other.
+    services = [("Starting PostgreSQL", enable_postgresql)]
 
-    # Add web server installation
+    # Add web server startup
     web_server = config.get('webServer', 'nginx' if not config.get('skipNginx') else 'none')
     if web_server == 'nginx':
-        steps.append(("Installing Nginx", install_nginx))
+        services.append(("Starting Nginx", enable_nginx))
     elif web_server == 'apache2':
-        steps.append(("Installing Apache2", install_apache2))
+        services.append(("Configuring Apache2", enable_apache2))
+
+    stages = [
+        [("Installing system packages", lambda: install_system_packages(config))],
+        services,
+        [("Configuring PostgreSQL", lambda: configure_postgresql(config))],
+        [("Creating database users", lambda: create_database_users(config))],
+        [("Creating directory structure", lambda: create_directory_structure(config))],
+        [("Writing configuration files", lambda: write_configuration_files(config))],
+        [("Starting Docker containers", lambda: start_docker_containers(config))],
+    ]
 
-    steps.extend([
-        ("Configuring PostgreSQL", lambda: configure_postgresql(config)),
-        ("Creating database users", lambda: create_database_users(config)),
-        ("Creating directory structure", lambda: create_directory_structure(config)),
-        ("Writing configuration files", lambda: write_configuration_files(config)),
-        ("Starting Docker containers", lambda: start_docker_containers(config)),
-    ])
+    total_steps = sum(len(stage) for stage in stages)
+    i = 0
+    for stage in stages:
+        numbered = [(i + n, step_name, step_func) for n, (step_name, step_func) in enumerate(stage, 1)]
+        i += len(stage)
 
-    total_steps = len(steps)
-    for i, (step_name, step_func) in enumerate(steps, 1):
-        console.print(f"  [yellow]⏳ [{i}/{total_steps}] {step_name}...[/yellow]")
+        for step_no, step_name, _ in numbered:
+            console.print(f"  [yellow]⏳ [{step_no}/{total_steps}] {step_name}...[/yellow]")
 
-        success, message = step_func()
+        if len(numbered) == 1:
+            results = [numbered[0][2]()]
+        else:
+            with ThreadPoolExecutor(max_workers=len(numbered)) as executor:
+                results = list(executor.map(lambda step: step[2](), numbered))
 
-        if not success:
-            console.print(f"  [red]✗ [{i}/{total_steps}] {step_name} - FAILED[/red]")
-            console.print(f"\n[bold red]Installation failed at: {step_name}[/bold red]")
-            console.print(f"[red]Error: {message}[/red]")
-            console.print(f"\n[yellow]Check logs at: {LOG_FILE}[/yellow]")
-            return False
+        for (step_no, step_name, _), (success, message) in zip(numbered, results):
+            if not success:
+                console.print(f"  [red]✗ [{step_no}/{total_steps}] {step_name} - FAILED[/red]")
+                console.print(f"\n[bold red]Installation failed at: {step_name}[/bold red]")
+                console.print(f"[red]Error: {message}[/red]")
+                console.print(f"\n[yellow]Check logs at: {LOG_FILE}[/yellow]")
+                return False
 
-        console.print(f"  [green]✓ [{i}/{total_steps}] {step_name}[/green]")
+            console.print(f"  [green]✓ [{step_no}/{total_steps}] {step_name}[/green]")
 
     console.print("\n[bold green]✓ Installation completed successfully![/bold green]")
     return True
 
 def show_completion_summary(config):
     """Display installation completion summary."""
-    console.print("\n" + "="*70)
-    console.print("[bold green]INSTALLATION COMPLETE![/bold green]")
-    console.print("="*70 + "\n")
+    from rich import box
+    from rich.console import Group
+    from rich.table import Table
 
     # Save credentials
     creds_file = save_credentials(config)
 
+    # Collect the whole screen and render it with a single print
+    output = [
+        "\n" + "="*70,
+        "[bold green]INSTALLATION COMPLETE![/bold green]",
+        "="*70 + "\n",
+    ]
+
     # Display access information
     table = Table(title="Your Odoo Environments", box=box.DOUBLE, show_header=True, header_style="bold cyan")
     table.add_column("Environment", style="cyan", no_wrap=True)
     table.add_column("URL", style="green")
 
-    skip_nginx = config.get('skipNginx', False)
+    skip_nginx = bool(config.get('skipNginx'))
+    protocol = "http" if config.get('skipSSL') else "https"
 
     if skip_nginx:
         # Show direct port access
-        for env, env_display in [('Test', 'Test'), ('Staging', 'Staging'), ('Prod', 'Production')]:
-            url = f"http://localhost:{config[f'portHttp{env}']}"
-            table.add_row(env_display, url)
+        rows = [(env_display, f"http://localhost:{config[ENV_KEYS[env]['portHttp']]}")
+                for env, env_display in ENV_PAIRS]
     else:
         # Show domain access
-        protocol = "http" if config.get('skipSSL') else "https"
-        for env, env_display in [('Test', 'Test'), ('Staging', 'Staging'), ('Prod', 'Production')]:
-            url = f"{protocol}://{config[f'domain{env}']}"
-            table.add_row(env_display, url)
+        rows = [(env_display, f"{protocol}://{config[ENV_KEYS[env]['domain']]}")
+                for env, env_display in ENV_PAIRS]
 
-    console.print(table)
+    for row in rows:
+        table.add_row(*row)
+
+    output.append(table)
 
-    console.print(f"\n[bold cyan]Important Information:[/bold cyan]")
-    console.print(f"  • Credentials saved to: [yellow]{creds_file}[/yellow]")
-    console.print(f"  • Docker Compose file: [yellow]{config['basePath']}/docker-compose.yml[/yellow]")
+    output.append(f"\n[bold cyan]Important Information:[/bold cyan]")
+    output.append(f"  • Credentials saved to: [yellow]{creds_file}[/yellow]")
+    output.append(f"  • Docker Compose file: [yellow]{config['basePath']}/docker-compose.yml[/yellow]")
     web_server = config.get('webServer', 'nginx' if not skip_nginx else 'none')
     if web_server == 'nginx':
-        console.print(f"  • Nginx config: [yellow]/etc/nginx/sites-available/odoo[/yellow]")
+        output.append(f"  • Nginx config: [yellow]/etc/nginx/sites-available/odoo[/yellow]")
     elif web_server == 'apache2':
-        console.print(f"  • Apache2 config: [yellow]/etc/apache2/sites-available/odoo.conf[/yellow]")
-    console.print(f"  • Installation logs: [yellow]{LOG_FILE}[/yellow]")
+        output.append(f"  • Apache2 config: [yellow]/etc/apache2/sites-available/odoo.conf[/yellow]")
+    output.append(f"  • Installation logs: [yellow]{LOG_FILE}[/yellow]")
 
-    console.print(f"\n[bold cyan]Next Steps:[/bold cyan]")
+    output.append(f"\n[bold cyan]Next Steps:[/bold cyan]")
     if skip_nginx:
-        console.print("  1. Navigate to your Odoo URL via direct port access:")
-        console.print(f"     • Test: [yellow]http://localhost:{config['portHttpTest']}[/yellow]")
-        console.print(f"     • Staging: [yellow]http://localhost:{config['portHttpStaging']}[/yellow]")
-        console.print(f"     • Production: [yellow]http://localhost:{config['portHttpProd']}[/yellow]")
+        output.append("  1. Navigate to your Odoo URL via direct port access:")
+        output.append(f"     • Test: [yellow]http://localhost:{config['portHttpTest']}[/yellow]")
+        output.append(f"     • Staging: [yellow]http://localhost:{config['portHttpStaging']}[/yellow]")
+        output.append(f"     • Production: [yellow]http://localhost:{config['portHttpProd']}[/yellow]")
     else:
-        console.print("  1. Navigate to your Odoo URL (e.g., https://odoo.example.com)")
-    console.print("  2. Create your first database through the Odoo web interface:")
-    console.print("     • Set a master password (for database management)")
-    console.print("     • Choose a database name (any valid name you prefer)")
-    console.print("     • Fill in admin email and password")
-    console.print("     • Odoo will create and initialize the database automatically")
+        output.append("  1. Navigate to your Odoo URL (e.g., https://odoo.example.com)")
+    output.append("  2. Create your first database through the Odoo web interface:")
+    output.append("     • Set a master password (for database management)")
+    output.append("     • Choose a database name (any valid name you prefer)")
+    output.append("     • Fill in admin email and password")
+    output.append("     • Odoo will create and initialize the database automatically")
+
+    output.append(f"\n[bold cyan]Container Management:[/bold cyan]")
+    output.append(f"  • View logs: [yellow]docker logs {config['containerNameProd']}[/yellow]")
+    output.append(f"  • Restart: [yellow]cd {config['basePath']} && docker compose restart[/yellow]")
+    output.append(f"  • Stop: [yellow]cd {config['basePath']} && docker compose stop[/yellow]")
 
-    console.print(f"\n[bold cyan]Container Management:[/bold cyan]")
-    console.print(f"  • View logs: [yellow]docker logs {config['containerNameProd']}[/yellow]")
-    console.print(f"  • Restart: [yellow]cd {config['basePath']} && docker compose restart[/yellow]")
-    console.print(f"  • Stop: [yellow]cd {config['basePath']} && docker compose stop[/yellow]")
+    output.append("\n" + "="*70 + "\n")
 
-    console.print("\n" + "="*70 + "\n")
+    console.print(Group(*output))
 
 # ============================================
 # MAIN PROGRAM
@@ -1774,6 +2129,7 @@ def main():
                 sys.exit(1)
         else:
             # === Interactive mode ===
+            load_questionary()
 
             # Show welcome screen
             show_welcome()
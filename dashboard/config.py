@@ -1,9 +1,16 @@
 """
 Configuration management for Odoo Dashboard
 """
+import copy
+import functools
 import json
 import os
 
+try:
+    import orjson  # optional, faster JSON when installed
+except ImportError:
+    orjson = None
+
 # Base paths
 DASHBOARD_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(DASHBOARD_DIR, 'data')
@@ -12,12 +19,16 @@ DATA_DIR = os.path.join(DASHBOARD_DIR, 'data')
 GIT_REPOS_FILE = os.path.join(DATA_DIR, 'git-repos.json')
 BACKUP_CONFIG_FILE = os.path.join(DATA_DIR, 'backup-config.json')
 AUTH_CONFIG_FILE = os.path.join(DATA_DIR, 'auth.json')
+SECRET_KEY_FILE = os.path.join(DATA_DIR, 'secret.key')
 
 # Application settings
 APP_PORT = int(os.environ.get('DASHBOARD_PORT', 9998))
 APP_VERSION = '1.0.0-DASHBOARD'
+# Set when a front-end server (Apache mod_xsendfile, lighttpd) serves X-Sendfile
+USE_X_SENDFILE = os.environ.get('DASHBOARD_USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
 
 # Odoo environment paths
+@functools.lru_cache(maxsize=1)
 def _detect_odoo_base_dir():
     """Auto-detect Odoo installation directory."""
     # Check environment variable first
@@ -33,7 +44,20 @@ def _detect_odoo_base_dir():
         os.path.expanduser('~/odoo'),
     ]
 
+    # List each parent once so candidates that don't exist cost no stat
+    present = {}
+    for path in common_paths:
+        parent = os.path.dirname(path)
+        if parent not in present:
+            try:
+                with os.scandir(parent) as entries:
+                    present[parent] = {entry.name for entry in entries}
+            except OSError:
+                present[parent] = set()
+
     for path in common_paths:
+        if os.path.basename(path) not in present[os.path.dirname(path)]:
+            continue
         docker_compose = os.path.join(path, 'docker-compose.yml')
         if os.path.exists(docker_compose):
             return path
@@ -49,6 +73,10 @@ BACKUP_DIR = os.path.join(ODOO_BASE_DIR, 'backups')
 DEFAULT_ENVIRONMENTS = ['test', 'staging', 'prod']
 
 
+# Last parse_docker_compose() result, keyed on the file's (mtime_ns, size)
+_compose_cache = {'stat': None, 'data': None}
+
+
 def parse_docker_compose():
     """
     Parse docker-compose.yml to discover containers and their environments.
@@ -58,65 +86,128 @@ def parse_docker_compose():
               {'test': {'container_name': 'odoo-test', 'service_name': 'odoo-test'},
                'staging': {'container_name': 'odoo-staging', 'service_name': 'odoo-staging'},
                'prod': {'container_name': 'odoo-prod', 'service_name': 'odoo-prod'}}
-    """
-    import re
 
-    if not os.path.exists(DOCKER_COMPOSE_FILE):
+        Entries parsed from the file also carry an 'environment' dict with
+        the service's environment variables. The result is cached until
+        docker-compose.yml changes; treat it as read-only.
+    """
+    try:
+        st = os.stat(DOCKER_COMPOSE_FILE)
+    except OSError:
         # Return defaults if file doesn't exist
         return {env: {'container_name': f'odoo-{env}', 'service_name': f'odoo-{env}'}
                 for env in DEFAULT_ENVIRONMENTS}
 
+    # Reuse the previous parse while the file is unchanged
+    key = (st.st_mtime_ns, st.st_size)
+    if _compose_cache['stat'] == key:
+        return _compose_cache['data']
+
+    containers = _parse_docker_compose_file()
+    _compose_cache['stat'] = key
+    _compose_cache['data'] = containers
+    return containers
+
+
+def _parse_docker_compose_file():
+    """Parse DOCKER_COMPOSE_FILE (uncached). See parse_docker_compose().
+
+    Simple single-pass YAML scan (avoids a pyyaml dependency): services are
+    the 2-space indented keys under "services:", and each one is read for
+    its container_name, the first */<env>/addons:/mnt/extra-addons volume
+    and its environment variables.
+    """
+    containers = {}
+    in_services = False
+    service = None
+
+    def finish(service):
+        if service and service['env']:
+            containers[service['env']] = {
+                'container_name': service['container_name'] or service['name'],
+                'service_name': service['name'],
+                'environment': service['environment']
+            }
+
     try:
         with open(DOCKER_COMPOSE_FILE, 'r') as f:
-            content = f.read()
+            for line in f:
+                line = line.rstrip()
+                stripped = line.lstrip()
+                # Comments say nothing about structure, whatever their indentation
+                if not stripped or stripped.startswith('#'):
+                    continue
+                indent = len(line) - len(stripped)
+
+                # Top-level keys: "services:" opens the section, anything else closes it
+                if indent == 0:
+                    finish(service)
+                    service = None
+                    in_services = line == 'services:'
+                    continue
+                if not in_services:
+                    continue
+
+                # Service header (2-space indented name)
+                if indent == 2:
+                    finish(service)
+                    service = None
+                    name = stripped[:-1]
+                    if stripped.endswith(':') and _is_word(name.replace('-', '')):
+                        service = {'name': name, 'container_name': None, 'env': None,
+                                   'environment': {}, 'env_indent': None}
+                    continue
+                if service is None:
+                    continue
+
+                # Inside the environment section until indentation drops back
+                if service['env_indent'] is not None:
+                    if indent > service['env_indent']:
+                        _parse_environment_line(stripped, service['environment'])
+                        continue
+                    service['env_indent'] = None
+
+                if stripped.startswith('container_name:'):
+                    if service['container_name'] is None:
+                        value = stripped[len('container_name:'):].split()
+                        service['container_name'] = value[0] if value else None
+                elif stripped == 'environment:':
+                    service['env_indent'] = indent
+                elif service['env'] is None and '/addons:/mnt/extra-addons' in stripped:
+                    # Determine environment from volumes path (e.g., /srv/odoo/test/addons)
+                    head = stripped.split('/addons:/mnt/extra-addons', 1)[0]
+                    if '/' in head:
+                        service['env'] = head.rsplit('/', 1)[1] or None
     except IOError:
         return {env: {'container_name': f'odoo-{env}', 'service_name': f'odoo-{env}'}
                 for env in DEFAULT_ENVIRONMENTS}
 
-    # Simple YAML parsing (avoid pyyaml dependency)
-    # Find all services and their container_name and volumes
-    containers = {}
+    finish(service)
 
-    # Split into service blocks
-    # Services section starts after "services:" line
-    services_match = re.search(r'^services:\s*$', content, re.MULTILINE)
-    if not services_match:
+    # If no containers found, return defaults
+    if not containers:
         return {env: {'container_name': f'odoo-{env}', 'service_name': f'odoo-{env}'}
                 for env in DEFAULT_ENVIRONMENTS}
 
-    services_content = content[services_match.end():]
-
-    # Find each service block (2-space indented service name)
-    service_pattern = re.compile(r'^  ([a-zA-Z0-9_-]+):\s*$', re.MULTILINE)
-    service_matches = list(service_pattern.finditer(services_content))
-
-    for i, match in enumerate(service_matches):
-        service_name = match.group(1)
-
-        # Get the content of this service block (until next service or end)
-        start = match.end()
-        end = service_matches[i + 1].start() if i + 1 < len(service_matches) else len(services_content)
-        service_block = services_content[start:end]
+    return containers
 
-        # Extract container_name
-        container_match = re.search(r'container_name:\s*([^\s\n]+)', service_block)
-        container_name = container_match.group(1) if container_match else service_name
 
-        # Determine environment from volumes path (e.g., /srv/odoo/test/addons)
-        volume_match = re.search(r'/([^/]+)/addons:/mnt/extra-addons', service_block)
-        if volume_match:
-            env = volume_match.group(1)
-            containers[env] = {
-                'container_name': container_name,
-                'service_name': service_name
-            }
+def _is_word(value):
+    """True for a non-empty run of letters, digits and underscores."""
+    return bool(value) and value.replace('_', 'a').isalnum()
 
-    # If no containers found, return defaults
-    if not containers:
-        return {env: {'container_name': f'odoo-{env}', 'service_name': f'odoo-{env}'}
-                for env in DEFAULT_ENVIRONMENTS}
 
-    return containers
+def _parse_environment_line(line, environment):
+    """Add one environment entry to the dict. Handles both formats:
+    Format 1 (list): - KEY=value
+    Format 2 (dict): KEY: value
+    """
+    if line.startswith('-'):
+        key, sep, value = line[1:].lstrip().partition('=')
+    else:
+        key, sep, value = line.partition(':')
+    if sep and value and _is_word(key):
+        environment[key] = value.strip()
 
 
 def get_environments():
@@ -149,76 +240,21 @@ def get_service_config(env):
 
     Returns dict with service_name, container_name, and environment variables.
     """
-    import re
-
     containers = parse_docker_compose()
     if env not in containers:
         return None
 
-    service_name = containers[env]['service_name']
-
-    # Re-parse to get environment variables
-    if not os.path.exists(DOCKER_COMPOSE_FILE):
-        return {'service_name': service_name, 'container_name': containers[env]['container_name'], 'environment': {}}
-
-    try:
-        with open(DOCKER_COMPOSE_FILE, 'r') as f:
-            content = f.read()
-    except IOError:
-        return {'service_name': service_name, 'container_name': containers[env]['container_name'], 'environment': {}}
-
-    # Find the service block
-    services_match = re.search(r'^services:\s*$', content, re.MULTILINE)
-    if not services_match:
-        return {'service_name': service_name, 'container_name': containers[env]['container_name'], 'environment': {}}
-
-    services_content = content[services_match.end():]
-
-    # Find this specific service
-    service_pattern = re.compile(rf'^  {re.escape(service_name)}:\s*$', re.MULTILINE)
-    service_match = service_pattern.search(services_content)
-
-    if not service_match:
-        return {'service_name': service_name, 'container_name': containers[env]['container_name'], 'environment': {}}
-
-    # Find the end of this service block (next service at same indentation or end)
-    start = service_match.end()
-    next_service = re.search(r'^  [a-zA-Z0-9_-]+:\s*$', services_content[start:], re.MULTILINE)
-    end = start + next_service.start() if next_service else len(services_content)
-    service_block = services_content[start:end]
-
-    # Extract environment variables
-    environment = {}
-
-    # Look for environment section - handles both formats:
-    # Format 1 (list): - KEY=value
-    # Format 2 (dict): KEY: value
-    env_section_match = re.search(r'environment:\s*\n((?:\s+.+\n?)+?)(?=\n    \w|\n  \w|$)', service_block)
-    if env_section_match:
-        env_lines = env_section_match.group(1)
-        for line in env_lines.strip().split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            # Format 1: - KEY=value
-            match = re.match(r'-\s*(\w+)=(.+)', line)
-            if match:
-                environment[match.group(1)] = match.group(2).strip()
-                continue
-            # Format 2: KEY: value (YAML dict style)
-            match = re.match(r'(\w+):\s*(.+)', line)
-            if match:
-                environment[match.group(1)] = match.group(2).strip()
-
     return {
-        'service_name': service_name,
+        'service_name': containers[env]['service_name'],
         'container_name': containers[env]['container_name'],
-        'environment': environment
+        'environment': dict(containers[env].get('environment', {}))
     }
 
 
 # Dynamic environments (parsed from docker-compose.yml)
 ENVIRONMENTS = get_environments()
+# Same names as a frozenset, for O(1) request validation
+ENVIRONMENTS_SET = frozenset(ENVIRONMENTS)
 
 
 def ensure_data_dir():
@@ -226,32 +262,101 @@ def ensure_data_dir():
     os.makedirs(DATA_DIR, exist_ok=True)
 
 
+# file_path -> ((st_mtime_ns, st_size), parsed data)
+_json_cache = {}
+
+
 def load_json_file(file_path, default=None):
-    """Load JSON configuration file."""
-    if not os.path.exists(file_path):
+    """Load JSON configuration file.
+
+    Parsed contents are cached until the file's mtime or size changes;
+    callers get a deep copy so they can mutate the result freely.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        _json_cache.pop(file_path, None)
         return default if default is not None else {}
 
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _json_cache.get(file_path)
+    if cached is not None and cached[0] == key:
+        return copy.deepcopy(cached[1])
+
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+        _json_cache[file_path] = (key, data)
+        return copy.deepcopy(data)
     except (json.JSONDecodeError, IOError) as e:
         print(f"Error loading {file_path}: {e}")
         return default if default is not None else {}
 
 
 def save_json_file(file_path, data):
-    """Save JSON configuration file."""
+    """Save JSON configuration file atomically (write temp file, then rename)."""
     ensure_data_dir()
 
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+
+    tmp_path = file_path + '.tmp'
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+        # Write through so the next load doesn't re-read what we just wrote;
+        # cache the parsed payload so it matches what a fresh load returns
+        st = os.stat(file_path)
+        parsed = orjson.loads(payload) if orjson else json.loads(payload)
+        _json_cache[file_path] = ((st.st_mtime_ns, st.st_size), parsed)
         return True
     except IOError as e:
         print(f"Error saving {file_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
 
+def read_lines_reversed(path, end=None, block_size=64 * 1024):
+    """
+    Yield (offset, line) pairs from the end of a file backwards.
+
+    Reads block by block, so the cost is proportional to what the caller
+    consumes rather than the file size. `end` is a byte offset to start
+    from instead of the end of the file; offsets are line starts.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell() if end is None else min(end, f.tell())
+        buffer = b''
+
+        while pos > 0:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            lines = (f.read(read_size) + buffer).split(b'\n')
+
+            # The first piece may be the tail of a line in the previous block
+            buffer = lines.pop(0)
+            offset = pos + len(buffer) + 1
+            entries = []
+            for line in lines:
+                entries.append((offset, line))
+                offset += len(line) + 1
+            yield from reversed(entries)
+
+        if buffer:
+            yield 0, buffer
+
+
 def load_git_repos():
     """Load git repository registry."""
     default = {env: [] for env in ENVIRONMENTS}
@@ -284,6 +389,10 @@ def load_backup_config():
         'retention': {
             'local_days': 7,
             'remote_days': 30
+        },
+        'filestore': {
+            'incremental': False,
+            'full_every_days': 7
         }
     }
     return load_json_file(BACKUP_CONFIG_FILE, default)
@@ -306,3 +415,53 @@ def load_auth_config():
 def save_auth_config(auth_data):
     """Save authentication configuration."""
     return save_json_file(AUTH_CONFIG_FILE, auth_data)
+
+
+def _load_or_create_secret(file_path, size=32):
+    """
+    Load the Flask secret key, creating it on first run.
+
+    Every worker process (and every restart) must share the same key, so
+    it is generated once and kept in the data directory. The new key is
+    linked into place so concurrent first starts agree on one value.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            secret = f.read()
+        if len(secret) >= size:
+            return secret
+    except FileNotFoundError:
+        pass
+    except IOError as e:
+        print(f"Error reading {file_path}: {e}")
+
+    secret = os.urandom(size)
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        ensure_data_dir()
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(secret)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.link(tmp_path, file_path)
+        except FileExistsError:
+            # Another worker won the race (or the file was short): use what is there
+            with open(file_path, 'rb') as f:
+                existing = f.read()
+            if len(existing) >= size:
+                return existing
+            os.replace(tmp_path, file_path)
+    except (IOError, OSError) as e:
+        # Still usable for this process; sessions just won't survive a restart
+        print(f"Error saving {file_path}: {e}")
+    finally:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return secret
+
+
+SECRET_KEY = _load_or_create_secret(SECRET_KEY_FILE)
@@ -4,12 +4,39 @@ Odoo Management Dashboard
 A Flask-based web dashboard for managing Odoo Docker environments
 """
 
+import atexit
+import base64
+import functools
+import gzip
+import hashlib
+import hmac
 import os
+import queue
 import sys
 import logging
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from functools import wraps
 from flask import Flask, render_template, jsonify, request, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson  # optional, faster jsonify() when installed
+except ImportError:
+    orjson = None
+
+try:
+    import bcrypt  # optional, preferred password hash when installed
+except ImportError:
+    bcrypt = None
+
+try:
+    from flask_compress import Compress  # optional, gzip/brotli responses
+except ImportError:
+    Compress = None
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -20,10 +47,40 @@ from services import log_service
 from services import git_service
 from services import backup_service
 from services import scheduler_service
+from services import job_service
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider serializing with orjson, matching Flask's default output."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        # Datetimes and other non-native types go through Flask's default()
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 # Initialize Flask app
 app = Flask(__name__)
-app.config['SECRET_KEY'] = os.urandom(24)
+app.config['SECRET_KEY'] = config.SECRET_KEY
+# Let a front-end web server send backup files itself (X-Sendfile)
+app.config['USE_X_SENDFILE'] = config.USE_X_SENDFILE
+if orjson:
+    app.json = OrjsonProvider(app)
+
+# Response compression; streamed responses (SSE log tails) are never compressed
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/plain']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_STREAMS'] = False
+if Compress:
+    Compress(app)
 
 # Configure logging
 logging.basicConfig(
@@ -39,19 +96,116 @@ logger = logging.getLogger('odoo_dashboard')
 # Ensure data directory exists
 config.ensure_data_dir()
 
+# Shared pool for fanning out independent per-environment docker/psql calls
+_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='dashboard-io')
+IO_POOL_TIMEOUT = 120  # seconds a request waits for its whole fan-out
+
+
+def _wait_io(futures):
+    """Wait for pooled calls up to IO_POOL_TIMEOUT in total; return the unfinished ones."""
+    _, pending = wait(futures, timeout=IO_POOL_TIMEOUT)
+    return pending
+
 
 # ============================================================================
 # Authentication (HTTP Basic Auth - same as installer)
 # ============================================================================
 
+# Iterations for the PBKDF2 fallback used when bcrypt is not installed
+PBKDF2_ITERATIONS = 600000
+
+
+def hash_password(password):
+    """Hash a password for auth.json (bcrypt if available, else PBKDF2-SHA256)."""
+    if bcrypt:
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('ascii')
+    salt = os.urandom(16)
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, PBKDF2_ITERATIONS)
+    return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password, password_hash):
+    """Check a password against a hash produced by hash_password()."""
+    try:
+        if password_hash.startswith('pbkdf2_sha256$'):
+            _, iterations, salt, expected = password_hash.split('$')
+            digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), bytes.fromhex(salt), int(iterations))
+            return hmac.compare_digest(digest.hex(), expected)
+        if password_hash.startswith('$2'):
+            if bcrypt is None:
+                logger.error("Password is stored as a bcrypt hash but bcrypt is not installed")
+                return False
+            return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('ascii'))
+    except ValueError:
+        # Malformed stored hash: deny rather than fail the request
+        logger.error("Stored password hash is malformed")
+    return False
+
+
 # Load auth config from file (persists across restarts)
-# Credentials are stored in data/auth.json
+# Credentials are stored in data/auth.json, the password only as a hash
 _auth_config = config.load_auth_config()
+if 'password_hash' not in _auth_config:
+    # Older auth.json files (and the admin/admin default) hold a plaintext password
+    _auth_config['password_hash'] = hash_password(_auth_config.pop('password', 'admin'))
+    if os.path.exists(config.AUTH_CONFIG_FILE):
+        config.save_auth_config(_auth_config)
 
 
 def check_auth(username, password):
-    """Check if username/password combination is valid."""
-    return username == _auth_config.get('username', 'admin') and password == _auth_config.get('password', 'admin')
+    """Check if username/password combination is valid (constant-time comparisons)."""
+    username_ok = hmac.compare_digest(username.encode('utf-8'), _auth_config.get('username', 'admin').encode('utf-8'))
+    # Always verify the password so a wrong username takes as long as a wrong password
+    password_ok = verify_password(password, _auth_config['password_hash'])
+    return username_ok and password_ok
+
+
+# SHA-256 digests of Authorization headers that verified; cleared whenever
+# the credentials change. Only successes are kept, and never the header itself.
+_verified_headers = set()
+VERIFIED_HEADERS_MAX = 32
+
+
+def _run_off_hub(fn, *args):
+    """
+    Run CPU-heavy fn(*args) without stalling other requests.
+
+    Under gevent (see wsgi.py) it goes to the hub's thread pool, so other
+    greenlets keep running while it computes; otherwise it runs inline.
+    """
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_module_patched('threading'):
+        import gevent
+        return gevent.get_hub().threadpool.apply(fn, args)
+    return fn(*args)
+
+
+def _authorized(header):
+    """
+    Verify a raw Basic Authorization header.
+
+    Password hashing is deliberately slow, and the dashboard pages poll
+    several endpoints every few seconds, so headers that verified are
+    remembered (by digest) and skip the hash next time.
+    """
+    key = hashlib.sha256(header.encode('utf-8')).digest()
+    if key in _verified_headers:
+        return True
+
+    scheme, _, encoded = header.partition(' ')
+    if scheme.lower() != 'basic':
+        return False
+    try:
+        username, separator, password = base64.b64decode(encoded, validate=True).decode('utf-8').partition(':')
+    except (ValueError, UnicodeDecodeError):
+        return False
+    if not (separator and _run_off_hub(check_auth, username, password)):
+        return False
+
+    if len(_verified_headers) >= VERIFIED_HEADERS_MAX:
+        _verified_headers.clear()
+    _verified_headers.add(key)
+    return True
 
 
 def authenticate():
@@ -67,22 +221,152 @@ def requires_auth(f):
     """Decorator to require HTTP Basic Auth."""
     @wraps(f)
     def decorated(*args, **kwargs):
-        auth = request.authorization
-        if not auth or not check_auth(auth.username, auth.password):
+        if not _authorized(request.headers.get('Authorization', '')):
             return authenticate()
         return f(*args, **kwargs)
     return decorated
 
 
+def validated_env(f):
+    """Decorator rejecting requests whose <env> is not a known environment."""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if kwargs.get('env') not in config.ENVIRONMENTS_SET:
+            return jsonify({'error': 'Invalid environment'}), 400
+        return f(*args, **kwargs)
+    return decorated
+
+
+def json_errors(message, success_flag=False):
+    """
+    Decorator turning unhandled exceptions into a logged JSON 500 response.
+
+    message is formatted with the view's URL arguments (e.g. "{env}"), and
+    success_flag adds 'success': False for endpoints whose clients check it.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            try:
+                return f(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{message.format(**kwargs)}: {e}")
+                body = {'success': False, 'error': str(e)} if success_flag else {'error': str(e)}
+                return jsonify(body), 500
+        return decorated
+    return decorator
+
+
+# ============================================================================
+# Container status cache
+# ============================================================================
+
+# Status lookups shell out to docker; with several tabs polling, a short TTL
+# lets them share one result. Entries are key -> (value, expires_at).
+STATUS_CACHE_TTL = 2  # seconds
+_status_cache = {}
+_status_cache_lock = threading.Lock()
+
+
+def _cached(key, ttl, fn):
+    """Return fn() from the status cache, calling it if the entry expired."""
+    with _status_cache_lock:
+        entry = _status_cache.get(key)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+
+    value = fn()
+
+    with _status_cache_lock:
+        _status_cache[key] = (value, time.monotonic() + ttl)
+    return value
+
+
+def _invalidate_status(env=None):
+    """Drop cached status for env (or every env) after a state change."""
+    with _status_cache_lock:
+        if env is None:
+            _status_cache.clear()
+        else:
+            _status_cache.pop(('status', env), None)
+            _status_cache.pop(('stats', env), None)
+            _status_cache.pop('all', None)
+
+
+# ============================================================================
+# Response compression (fallback when flask-compress is not installed)
+# ============================================================================
+
+def _accepts_gzip():
+    """Whether the client sent Accept-Encoding: gzip."""
+    return request.accept_encodings['gzip'] > 0
+
+
+@app.after_request
+def gzip_response(response):
+    """Gzip large JSON/text responses using the COMPRESS_* settings."""
+    if Compress:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200
+            or response.is_streamed
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in app.config['COMPRESS_MIMETYPES']
+            or not _accepts_gzip()):
+        return response
+
+    data = response.get_data()
+    if len(data) < app.config['COMPRESS_MIN_SIZE']:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=app.config['COMPRESS_LEVEL']))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+def _gzip_stream(chunks, level):
+    """Gzip an iterable of byte chunks on the fly."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
 # ============================================================================
 # Web Routes
 # ============================================================================
 
+# The pages only vary by endpoint and selected environment, so each variant
+# is rendered once and served from memory. Keyed by (endpoint, selected_env).
+_page_cache = {}
+
+
+def render_page(template, **context):
+    """Render a page (cached per endpoint/environment) with ETag support."""
+    selected_env = context.get('selected_env')
+    key = (request.endpoint, selected_env)
+
+    body = _page_cache.get(key)
+    if body is None:
+        body = render_template(template, **context).encode('utf-8')
+        # Only cache known environments so arbitrary ?env= values can't grow it
+        if selected_env is None or selected_env in config.ENVIRONMENTS_SET:
+            _page_cache[key] = body
+
+    response = Response(body, mimetype='text/html')
+    response.add_etag()
+    return response.make_conditional(request)
+
+
 @app.route('/')
 @requires_auth
 def index():
     """Dashboard home page - container status."""
-    return render_template('index.html')
+    return render_page('index.html')
 
 
 @app.route('/logs')
@@ -91,7 +375,7 @@ def logs():
     """Log viewer page."""
     # Get selected environment from query params, default to first available
     selected_env = request.args.get('env', config.ENVIRONMENTS[0] if config.ENVIRONMENTS else 'test')
-    return render_template('logs.html', environments=config.ENVIRONMENTS, selected_env=selected_env)
+    return render_page('logs.html', environments=config.ENVIRONMENTS, selected_env=selected_env)
 
 
 @app.route('/git')
@@ -99,7 +383,7 @@ def logs():
 def git():
     """Git repository management page."""
     selected_env = request.args.get('env', config.ENVIRONMENTS[0] if config.ENVIRONMENTS else 'test')
-    return render_template('git.html', environments=config.ENVIRONMENTS, selected_env=selected_env)
+    return render_page('git.html', environments=config.ENVIRONMENTS, selected_env=selected_env)
 
 
 @app.route('/backups')
@@ -107,19 +391,20 @@ def git():
 def backups():
     """Backup management page."""
     selected_env = request.args.get('env', config.ENVIRONMENTS[0] if config.ENVIRONMENTS else 'test')
-    return render_template('backups.html', environments=config.ENVIRONMENTS, selected_env=selected_env)
+    return render_page('backups.html', environments=config.ENVIRONMENTS, selected_env=selected_env)
 
 
 @app.route('/settings')
 @requires_auth
 def settings():
     """Settings page."""
-    return render_template('settings.html',
-                           version=config.APP_VERSION,
-                           odoo_base_dir=config.ODOO_BASE_DIR,
-                           environments=config.ENVIRONMENTS,
-                           port=config.APP_PORT,
-                           data_dir=config.DATA_DIR)
+    return render_page('settings.html',
+                       version=config.APP_VERSION,
+                       odoo_base_dir=config.ODOO_BASE_DIR,
+                       environments=config.ENVIRONMENTS,
+                       port=config.APP_PORT,
+                       data_dir=config.DATA_DIR,
+                       server=request.environ.get('SERVER_SOFTWARE', 'unknown'))
 
 
 # ============================================================================
@@ -128,112 +413,90 @@ def settings():
 
 @app.route('/api/containers/status')
 @requires_auth
+@json_errors("Error getting container status")
 def api_container_status():
     """Get status of all containers."""
-    try:
-        statuses = container_service.get_all_container_status()
-        return jsonify(statuses)
-    except Exception as e:
-        logger.error(f"Error getting container status: {e}")
-        return jsonify({'error': str(e)}), 500
+    statuses = _cached('all', STATUS_CACHE_TTL, container_service.get_all_container_status)
+    return jsonify(statuses)
 
 
 @app.route('/api/containers/<env>/status')
 @requires_auth
+@validated_env
+@json_errors("Error getting {env} container status")
 def api_single_container_status(env):
     """Get status of a single container."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        status = container_service.get_container_status(env)
-        return jsonify(status)
-    except Exception as e:
-        logger.error(f"Error getting {env} container status: {e}")
-        return jsonify({'error': str(e)}), 500
+    status = _cached(('status', env), STATUS_CACHE_TTL,
+                     lambda: container_service.get_container_status(env))
+    return jsonify(status)
 
 
 @app.route('/api/containers/<env>/start', methods=['POST'])
 @requires_auth
+@validated_env
+@json_errors("Error starting {env} container", success_flag=True)
 def api_start_container(env):
     """Start a container."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
+    logger.info(f"Starting {env} container")
+    result = container_service.start_container(env)
 
-    try:
-        logger.info(f"Starting {env} container")
-        result = container_service.start_container(env)
+    if result['success']:
+        _invalidate_status(env)
+        logger.info(f"Successfully started {env} container")
+    else:
+        logger.warning(f"Failed to start {env} container: {result['message']}")
 
-        if result['success']:
-            logger.info(f"Successfully started {env} container")
-        else:
-            logger.warning(f"Failed to start {env} container: {result['message']}")
-
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error starting {env} container: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+    return jsonify(result)
 
 
 @app.route('/api/containers/<env>/stop', methods=['POST'])
 @requires_auth
+@validated_env
+@json_errors("Error stopping {env} container", success_flag=True)
 def api_stop_container(env):
     """Stop a container."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
+    logger.info(f"Stopping {env} container")
+    result = container_service.stop_container(env)
 
-    try:
-        logger.info(f"Stopping {env} container")
-        result = container_service.stop_container(env)
+    if result['success']:
+        _invalidate_status(env)
+        logger.info(f"Successfully stopped {env} container")
+    else:
+        logger.warning(f"Failed to stop {env} container: {result['message']}")
 
-        if result['success']:
-            logger.info(f"Successfully stopped {env} container")
-        else:
-            logger.warning(f"Failed to stop {env} container: {result['message']}")
-
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error stopping {env} container: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+    return jsonify(result)
 
 
 @app.route('/api/containers/<env>/restart', methods=['POST'])
 @requires_auth
+@validated_env
+@json_errors("Error restarting {env} container", success_flag=True)
 def api_restart_container(env):
     """Restart a container."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        logger.info(f"Restarting {env} container")
-        result = container_service.restart_container(env)
+    logger.info(f"Restarting {env} container")
+    result = container_service.restart_container(env)
 
-        if result['success']:
-            logger.info(f"Successfully restarted {env} container")
-        else:
-            logger.warning(f"Failed to restart {env} container: {result['message']}")
+    if result['success']:
+        _invalidate_status(env)
+        logger.info(f"Successfully restarted {env} container")
+    else:
+        logger.warning(f"Failed to restart {env} container: {result['message']}")
 
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error restarting {env} container: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+    return jsonify(result)
 
 
 @app.route('/api/containers/<env>/stats')
 @requires_auth
+@validated_env
+@json_errors("Error getting {env} container stats")
 def api_container_stats(env):
     """Get container resource statistics."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        stats = container_service.get_container_stats(env)
-        if stats is None:
-            return jsonify({'error': 'Could not retrieve stats'}), 404
-        return jsonify(stats)
-    except Exception as e:
-        logger.error(f"Error getting {env} container stats: {e}")
-        return jsonify({'error': str(e)}), 500
+    # docker stats samples for about a second, so polls share one result
+    stats = _cached(('stats', env), STATUS_CACHE_TTL,
+                    lambda: container_service.get_container_stats(env))
+    if stats is None:
+        return jsonify({'error': 'Could not retrieve stats'}), 404
+    return jsonify(stats)
 
 
 # ============================================================================
@@ -242,41 +505,30 @@ def api_container_stats(env):
 
 @app.route('/api/logs/<env>')
 @requires_auth
+@validated_env
+@json_errors("Error getting {env} logs", success_flag=True)
 def api_get_logs(env):
     """Get last N lines of container logs."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        lines = request.args.get('lines', 100, type=int)
-        lines = min(max(lines, 1), 10000)  # Limit between 1 and 10000
+    lines = request.args.get('lines', 100, type=int)
+    lines = min(max(lines, 1), 10000)  # Limit between 1 and 10000
 
-        timestamps = request.args.get('timestamps', 'false').lower() == 'true'
-        level = request.args.get('level')  # Optional log level filter
-        search = request.args.get('search')  # Optional search filter
+    timestamps = request.args.get('timestamps', 'false').lower() == 'true'
+    level = request.args.get('level')  # Optional log level filter
+    search = request.args.get('search')  # Optional search filter
 
-        result = log_service.get_logs(env, lines=lines, timestamps=timestamps)
+    result = log_service.get_logs(env, lines=lines, timestamps=timestamps, level=level, search=search)
 
-        if not result['success']:
-            return jsonify(result), 500
+    if not result['success']:
+        return jsonify(result), 500
 
-        # Apply filters if specified
-        if level or search:
-            result['logs'] = log_service.filter_logs(result['logs'], level=level, search=search)
-
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error getting {env} logs: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+    return jsonify(result)
 
 
 @app.route('/api/logs/<env>/stream')
 @requires_auth
+@validated_env
 def api_stream_logs(env):
     """Server-Sent Events endpoint for log streaming."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
     tail = request.args.get('tail', 50, type=int)
     tail = min(max(tail, 1), 500)  # Limit between 1 and 500
 
@@ -305,44 +557,42 @@ def api_stream_logs(env):
 
 @app.route('/api/logs/<env>/download')
 @requires_auth
+@validated_env
+@json_errors("Error downloading {env} logs")
 def api_download_logs(env):
     """Download container logs as text file."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        lines = request.args.get('lines', 1000, type=int)
-        lines = min(max(lines, 1), 50000)  # Allow up to 50000 lines for download
-
-        content = log_service.get_logs_download(env, lines=lines, timestamps=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"odoo-{env}-logs-{timestamp}.txt"
-
-        return Response(
-            content,
-            mimetype='text/plain',
-            headers={
-                'Content-Disposition': f'attachment; filename="{filename}"'
-            }
-        )
-    except Exception as e:
-        logger.error(f"Error downloading {env} logs: {e}")
-        return jsonify({'error': str(e)}), 500
+    lines = request.args.get('lines', 1000, type=int)
+    lines = min(max(lines, 1), 50000)  # Allow up to 50000 lines for download
+
+    content = log_service.iter_logs_download(env, lines=lines, timestamps=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"odoo-{env}-logs-{timestamp}.txt"
+    headers = {
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'Vary': 'Accept-Encoding'
+    }
+
+    # Logs compress very well; gzip them while streaming
+    if _accepts_gzip():
+        content = _gzip_stream(content, app.config['COMPRESS_LEVEL'])
+        headers['Content-Encoding'] = 'gzip'
+
+    # Stream chunks as docker writes them instead of buffering the whole log
+    return Response(
+        stream_with_context(content),
+        mimetype='text/plain',
+        headers=headers
+    )
 
 
 @app.route('/api/logs/<env>/stats')
 @requires_auth
+@validated_env
+@json_errors("Error getting {env} log stats")
 def api_log_stats(env):
     """Get log statistics for an environment."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        stats = log_service.get_log_stats(env)
-        return jsonify(stats)
-    except Exception as e:
-        logger.error(f"Error getting {env} log stats: {e}")
-        return jsonify({'error': str(e)}), 500
+    stats = log_service.get_log_stats(env)
+    return jsonify(stats)
 
 
 # ============================================================================
@@ -351,38 +601,29 @@ def api_log_stats(env):
 
 @app.route('/api/repos')
 @requires_auth
+@json_errors("Error getting all repos")
 def api_get_all_repos():
     """Get all repositories across all environments."""
-    try:
-        repos = git_service.get_all_repos_status()
-        return jsonify(repos)
-    except Exception as e:
-        logger.error(f"Error getting all repos: {e}")
-        return jsonify({'error': str(e)}), 500
+    repos = git_service.get_all_repos_status()
+    return jsonify(repos)
 
 
 @app.route('/api/repos/<env>')
 @requires_auth
+@validated_env
+@json_errors("Error getting {env} repos")
 def api_get_repos(env):
     """Get repositories for a specific environment."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        repos = git_service.list_repositories(env)
-        return jsonify(repos)
-    except Exception as e:
-        logger.error(f"Error getting {env} repos: {e}")
-        return jsonify({'error': str(e)}), 500
+    repos = git_service.list_repositories(env)
+    return jsonify(repos)
 
 
 @app.route('/api/repos/<env>/add', methods=['POST'])
 @requires_auth
+@validated_env
+@json_errors("Error cloning repository to {env}")
 def api_add_repo(env):
     """Clone a new repository."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
     try:
         data = request.get_json()
         if not data:
@@ -419,35 +660,35 @@ def api_add_repo(env):
     except ValueError as e:
         logger.warning(f"Clone failed for {env}: {e}")
         return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        logger.error(f"Error cloning repository to {env}: {e}")
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/repos/<env>/<repo_id>/status')
 @requires_auth
+@validated_env
+@json_errors("Error getting status for {repo_id}")
 def api_repo_status(env, repo_id):
     """Get detailed status of a repository."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
     try:
         status = git_service.get_repo_status(env, repo_id)
         return jsonify(status)
     except ValueError as e:
         return jsonify({'error': str(e)}), 404
-    except Exception as e:
-        logger.error(f"Error getting status for {repo_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+
+
+def _restart_after_pull(env):
+    """Background job: restart a container after new commits were pulled."""
+    try:
+        return container_service.restart_container(env)
+    finally:
+        _invalidate_status(env)
 
 
 @app.route('/api/repos/<env>/<repo_id>/pull', methods=['POST'])
 @requires_auth
+@validated_env
+@json_errors("Error pulling {repo_id}")
 def api_pull_repo(env, repo_id):
     """Pull latest changes from remote."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
     try:
         logger.info(f"Pulling repository {repo_id} in {env}")
         result = git_service.pull_repository(env, repo_id)
@@ -455,40 +696,30 @@ def api_pull_repo(env, repo_id):
         # Auto-restart container if enabled and commits were pulled
         if result.get('auto_restart') and result.get('commits_pulled', 0) > 0:
             logger.info(f"Auto-restarting {env} container after pull")
-            restart_result = container_service.restart_container(env)
-            result['container_restarted'] = restart_result.get('success', False)
+            result['restart_job_id'] = job_service.submit(f"restart:{env}", _restart_after_pull, env)
 
         return jsonify(result)
 
     except ValueError as e:
         logger.warning(f"Pull failed for {repo_id}: {e}")
         return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        logger.error(f"Error pulling {repo_id}: {e}")
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/repos/<env>/<repo_id>', methods=['DELETE'])
 @requires_auth
+@validated_env
+@json_errors("Error removing {repo_id}")
 def api_delete_repo(env, repo_id):
     """Remove repository from registry."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
+    delete_files = request.args.get('delete_files', 'false').lower() == 'true'
 
-    try:
-        delete_files = request.args.get('delete_files', 'false').lower() == 'true'
-
-        logger.info(f"Removing repository {repo_id} from {env} (delete_files={delete_files})")
-        success = git_service.remove_repository(env, repo_id, delete_files=delete_files)
+    logger.info(f"Removing repository {repo_id} from {env} (delete_files={delete_files})")
+    success = git_service.remove_repository(env, repo_id, delete_files=delete_files)
 
-        if success:
-            return jsonify({'success': True})
-        else:
-            return jsonify({'error': 'Repository not found'}), 404
-
-    except Exception as e:
-        logger.error(f"Error removing {repo_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+    if success:
+        return jsonify({'success': True})
+    else:
+        return jsonify({'error': 'Repository not found'}), 404
 
 
 # ============================================================================
@@ -497,189 +728,158 @@ def api_delete_repo(env, repo_id):
 
 @app.route('/api/backups')
 @requires_auth
+@json_errors("Error listing backups")
 def api_list_all_backups():
     """List all backups across all environments."""
-    try:
-        backups = backup_service.list_backups()
-        return jsonify(backups)
-    except Exception as e:
-        logger.error(f"Error listing backups: {e}")
-        return jsonify({'error': str(e)}), 500
+    backups = backup_service.list_backups()
+    return jsonify(backups)
 
 
 @app.route('/api/backups/<env>')
 @requires_auth
+@validated_env
+@json_errors("Error listing {env} backups")
 def api_list_backups(env):
     """List backups for a specific environment."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        backups = backup_service.list_backups(env)
-        return jsonify(backups)
-    except Exception as e:
-        logger.error(f"Error listing {env} backups: {e}")
-        return jsonify({'error': str(e)}), 500
+    backups = backup_service.list_backups(env)
+    return jsonify(backups)
 
 
 @app.route('/api/backups/<env>/create', methods=['POST'])
 @requires_auth
+@validated_env
+@json_errors("Error creating backup for {env}")
 def api_create_backup(env):
     """Create a new backup."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
+    data = request.get_json() or {}
+    backup_type = data.get('type', 'full')
+    description = data.get('description', '')
+    upload = data.get('upload', False)
 
-    try:
-        data = request.get_json() or {}
-        backup_type = data.get('type', 'full')
-        description = data.get('description', '')
-        upload = data.get('upload', False)
+    logger.info(f"Creating {backup_type} backup for {env}")
 
-        logger.info(f"Creating {backup_type} backup for {env}")
+    job_id = job_service.submit(f"backup:{env}", _create_backup_job, env, backup_type, description, upload)
+    return jsonify({'job_id': job_id}), 202
 
-        result = backup_service.create_backup(
-            env=env,
-            backup_type=backup_type,
-            description=description
-        )
 
-        logger.info(f"Backup created: {result['backup_id']}")
+def _create_backup_job(env, backup_type, description, upload):
+    """Background job: create a backup and optionally upload it."""
+    result = backup_service.create_backup(
+        env=env,
+        backup_type=backup_type,
+        description=description
+    )
 
-        # Upload if requested
-        if upload:
-            try:
-                upload_result = backup_service.upload_backup(result['backup_id'], env)
-                result['upload'] = upload_result
-            except Exception as e:
-                logger.warning(f"Upload failed: {e}")
-                result['upload'] = {'uploaded': False, 'error': str(e)}
+    logger.info(f"Backup created: {result['backup_id']}")
 
-        return jsonify(result)
+    # Upload if requested
+    if upload:
+        try:
+            upload_result = backup_service.upload_backup(result['backup_id'], env)
+            result['upload'] = upload_result
+        except Exception as e:
+            logger.warning(f"Upload failed: {e}")
+            result['upload'] = {'uploaded': False, 'error': str(e)}
 
-    except Exception as e:
-        logger.error(f"Error creating backup for {env}: {e}")
-        return jsonify({'error': str(e)}), 500
+    return result
 
 
 @app.route('/api/backups/<env>/<backup_id>')
 @requires_auth
+@validated_env
+@json_errors("Error getting backup {backup_id}")
 def api_get_backup(env, backup_id):
     """Get details of a specific backup."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
+    refresh = request.args.get('refresh', '0') == '1'  # re-read file sizes from disk
     try:
-        details = backup_service.get_backup_details(env, backup_id)
+        details = backup_service.get_backup_details(env, backup_id, refresh=refresh)
         return jsonify(details)
     except ValueError as e:
         return jsonify({'error': str(e)}), 404
-    except Exception as e:
-        logger.error(f"Error getting backup {backup_id}: {e}")
-        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/backups/<env>/<backup_id>/download')
 @requires_auth
+@validated_env
+@json_errors("Error downloading backup {backup_id}")
 def api_download_backup(env, backup_id):
     """Download a backup file."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        file_type = request.args.get('type', 'database')
-        file_path = backup_service.get_backup_file_path(env, backup_id, file_type)
-
-        if not file_path:
-            return jsonify({'error': 'Backup file not found'}), 404
-
-        from flask import send_file
-        return send_file(
-            file_path,
-            as_attachment=True,
-            download_name=os.path.basename(file_path)
-        )
-
-    except Exception as e:
-        logger.error(f"Error downloading backup {backup_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+    file_type = request.args.get('type', 'database')
+    file_path = backup_service.get_backup_file_path(env, backup_id, file_type)
+
+    if not file_path:
+        return jsonify({'error': 'Backup file not found'}), 404
+
+    from flask import send_file
+    # conditional enables Range/If-Modified-Since, so interrupted downloads resume;
+    # the body goes out through the server's file wrapper (sendfile where supported)
+    return send_file(
+        file_path,
+        as_attachment=True,
+        download_name=os.path.basename(file_path),
+        conditional=True,
+        max_age=0
+    )
 
 
 @app.route('/api/backups/<env>/<backup_id>/upload', methods=['POST'])
 @requires_auth
+@validated_env
+@json_errors("Error uploading backup {backup_id}")
 def api_upload_backup(env, backup_id):
     """Upload a backup to remote storage."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        logger.info(f"Uploading backup {backup_id} to remote storage")
-        result = backup_service.upload_backup(backup_id, env)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error uploading backup {backup_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+    logger.info(f"Uploading backup {backup_id} to remote storage")
+    job_id = job_service.submit(f"upload:{backup_id}", backup_service.upload_backup, backup_id, env)
+    return jsonify({'job_id': job_id}), 202
 
 
 @app.route('/api/backups/<env>/<backup_id>', methods=['DELETE'])
 @requires_auth
+@validated_env
+@json_errors("Error deleting backup {backup_id}")
 def api_delete_backup(env, backup_id):
     """Delete a backup."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
-
-    try:
-        logger.info(f"Deleting backup {backup_id}")
-        success = backup_service.delete_backup(env, backup_id)
+    logger.info(f"Deleting backup {backup_id}")
+    success = backup_service.delete_backup(env, backup_id)
 
-        if success:
-            return jsonify({'success': True})
-        else:
-            return jsonify({'error': 'Backup not found'}), 404
-
-    except Exception as e:
-        logger.error(f"Error deleting backup {backup_id}: {e}")
-        return jsonify({'error': str(e)}), 500
+    if success:
+        return jsonify({'success': True})
+    else:
+        return jsonify({'error': 'Backup not found'}), 404
 
 
 @app.route('/api/backups/config')
 @requires_auth
+@json_errors("Error getting backup config")
 def api_get_backup_config():
     """Get backup configuration."""
-    try:
-        backup_config = config.load_backup_config()
-        # Remove secret key from response for security
-        if 's3' in backup_config and 'secret_key' in backup_config['s3']:
-            backup_config['s3']['secret_key'] = ''
-        return jsonify(backup_config)
-    except Exception as e:
-        logger.error(f"Error getting backup config: {e}")
-        return jsonify({'error': str(e)}), 500
+    backup_config = config.load_backup_config()
+    # Remove secret key from response for security
+    if 's3' in backup_config and 'secret_key' in backup_config['s3']:
+        backup_config['s3']['secret_key'] = ''
+    return jsonify(backup_config)
 
 
 @app.route('/api/backups/config', methods=['POST'])
 @requires_auth
+@json_errors("Error saving backup config")
 def api_save_backup_config():
     """Save backup configuration."""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
+    data = request.get_json()
+    if not data:
+        return jsonify({'error': 'No data provided'}), 400
 
-        # Load existing config to preserve secret key if not provided
-        existing_config = config.load_backup_config()
+    # Load existing config to preserve secret key if not provided
+    existing_config = config.load_backup_config()
 
-        # Preserve existing secret key if new one is empty
-        if 's3' in data and not data['s3'].get('secret_key'):
-            data['s3']['secret_key'] = existing_config.get('s3', {}).get('secret_key', '')
+    # Preserve existing secret key if new one is empty
+    if 's3' in data and not data['s3'].get('secret_key'):
+        data['s3']['secret_key'] = existing_config.get('s3', {}).get('secret_key', '')
 
-        logger.info("Saving backup configuration")
-        config.save_backup_config(data)
+    logger.info("Saving backup configuration")
+    config.save_backup_config(data)
 
-        return jsonify({'success': True})
-
-    except Exception as e:
-        logger.error(f"Error saving backup config: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'success': True})
 
 
 @app.route('/api/backups/test-s3', methods=['POST'])
@@ -722,45 +922,71 @@ def api_test_rsync():
 
 @app.route('/api/databases/info')
 @requires_auth
+@json_errors("Error getting database info")
 def api_get_database_info():
     """Get database info for all environments."""
-    try:
-        info = {}
-        for env in config.ENVIRONMENTS:
-            info[env] = backup_service.get_database_info(env)
-        return jsonify(info)
-    except Exception as e:
-        logger.error(f"Error getting database info: {e}")
-        return jsonify({'error': str(e)}), 500
+    # Probe every environment concurrently; total time is the slowest probe
+    futures = {env: _io_pool.submit(backup_service.get_database_info, env)
+               for env in config.ENVIRONMENTS}
+    pending = _wait_io(futures.values())
+    info = {}
+    for env, future in futures.items():
+        if future in pending:
+            logger.warning(f"Database info for {env} timed out")
+            info[env] = {
+                'name': None,
+                'size': 'Unknown',
+                'table_count': 0,
+                'user': None,
+                'available': False,
+                'error': f'Timed out after {IO_POOL_TIMEOUT}s'
+            }
+        else:
+            info[env] = future.result()
+    return jsonify(info)
 
 
 @app.route('/api/databases/copy', methods=['POST'])
 @requires_auth
+@json_errors("Error copying database")
 def api_copy_database():
     """Copy database between environments."""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
+    data = request.get_json()
+    if not data:
+        return jsonify({'error': 'No data provided'}), 400
+
+    source_env = data.get('source_env')
+    target_env = data.get('target_env')
+    include_filestore = data.get('include_filestore', True)
+    include_addons = data.get('include_addons', True)
+    target_db_name = data.get('target_db_name')  # Optional: name for new database
+
+    if not source_env or not target_env:
+        return jsonify({'error': 'source_env and target_env are required'}), 400
 
-        source_env = data.get('source_env')
-        target_env = data.get('target_env')
-        include_filestore = data.get('include_filestore', True)
-        include_addons = data.get('include_addons', True)
-        target_db_name = data.get('target_db_name')  # Optional: name for new database
+    if source_env == target_env:
+        return jsonify({'error': 'Source and target environments must be different'}), 400
 
-        if not source_env or not target_env:
-            return jsonify({'error': 'source_env and target_env are required'}), 400
+    if source_env not in config.ENVIRONMENTS_SET:
+        return jsonify({'error': f'Invalid source environment: {source_env}'}), 400
 
-        if source_env not in config.ENVIRONMENTS:
-            return jsonify({'error': f'Invalid source environment: {source_env}'}), 400
+    if target_env not in config.ENVIRONMENTS_SET:
+        return jsonify({'error': f'Invalid target environment: {target_env}'}), 400
 
-        if target_env not in config.ENVIRONMENTS:
-            return jsonify({'error': f'Invalid target environment: {target_env}'}), 400
+    logger.warning(f"DESTRUCTIVE: Copying database from {source_env} to {target_env}" +
+                  (f" (new db name: {target_db_name})" if target_db_name else ""))
+
+    job_id = job_service.submit(
+        f"copy:{source_env}->{target_env}",
+        _copy_database_job,
+        source_env, target_env, include_filestore, include_addons, target_db_name
+    )
+    return jsonify({'job_id': job_id}), 202
 
-        logger.warning(f"DESTRUCTIVE: Copying database from {source_env} to {target_env}" +
-                      (f" (new db name: {target_db_name})" if target_db_name else ""))
 
+def _copy_database_job(source_env, target_env, include_filestore, include_addons, target_db_name):
+    """Background job: copy a database between environments."""
+    try:
         result = backup_service.copy_database(
             source_env=source_env,
             target_env=target_env,
@@ -768,19 +994,16 @@ def api_copy_database():
             include_addons=include_addons,
             target_db_name=target_db_name
         )
+    finally:
+        # The target container was stopped and started again
+        _invalidate_status(target_env)
 
-        if result['success']:
-            logger.info(f"Database copy completed: {source_env} -> {target_env}")
-        else:
-            logger.error(f"Database copy failed: {result.get('errors')}")
+    if result['success']:
+        logger.info(f"Database copy completed: {source_env} -> {target_env}")
+    else:
+        logger.error(f"Database copy failed: {result.get('errors')}")
 
-        return jsonify(result)
-
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        logger.error(f"Error copying database: {e}")
-        return jsonify({'error': str(e)}), 500
+    return result
 
 
 # ============================================================================
@@ -789,95 +1012,98 @@ def api_copy_database():
 
 @app.route('/api/schedules')
 @requires_auth
+@json_errors("Error getting schedules")
 def api_get_schedules():
     """Get all backup schedules and job info."""
-    try:
-        schedules = scheduler_service.get_all_schedules()
-        jobs = scheduler_service.get_scheduled_jobs()
+    schedules = scheduler_service.get_all_schedules()
+    jobs = scheduler_service.get_scheduled_jobs()
 
-        return jsonify({
-            'schedules': schedules,
-            'jobs': jobs
-        })
-    except Exception as e:
-        logger.error(f"Error getting schedules: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'schedules': schedules,
+        'jobs': jobs
+    })
 
 
 @app.route('/api/schedules/<env>')
 @requires_auth
+@validated_env
+@json_errors("Error getting schedule for {env}")
 def api_get_schedule(env):
     """Get schedule for a specific environment."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
+    schedule = scheduler_service.get_schedule(env)
+    job_info = scheduler_service.get_job_info(env)
 
-    try:
-        schedule = scheduler_service.get_schedule(env)
-        job_info = scheduler_service.get_job_info(env)
-
-        return jsonify({
-            'schedule': schedule,
-            'job': job_info
-        })
-    except Exception as e:
-        logger.error(f"Error getting schedule for {env}: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'schedule': schedule,
+        'job': job_info
+    })
 
 
 @app.route('/api/schedules/<env>', methods=['POST'])
 @requires_auth
+@validated_env
+@json_errors("Error saving schedule for {env}")
 def api_save_schedule(env):
     """Save schedule for an environment."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
+    data = request.get_json()
+    if not data:
+        return jsonify({'error': 'No data provided'}), 400
 
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
+    logger.info(f"Saving schedule for {env}: enabled={data.get('enabled')}")
+    scheduler_service.save_schedule(env, data)
 
-        logger.info(f"Saving schedule for {env}: enabled={data.get('enabled')}")
-        scheduler_service.save_schedule(env, data)
-
-        return jsonify({'success': True})
-
-    except Exception as e:
-        logger.error(f"Error saving schedule for {env}: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'success': True})
 
 
 @app.route('/api/schedules/<env>/trigger', methods=['POST'])
 @requires_auth
+@validated_env
+@json_errors("Error triggering backup for {env}")
 def api_trigger_backup(env):
     """Manually trigger a backup for an environment."""
-    if env not in config.ENVIRONMENTS:
-        return jsonify({'error': 'Invalid environment'}), 400
+    logger.info(f"Manually triggering backup for {env}")
+    job_id = job_service.submit(f"trigger:{env}", scheduler_service.trigger_backup_now, env)
 
-    try:
-        logger.info(f"Manually triggering backup for {env}")
-        result = scheduler_service.trigger_backup_now(env)
-
-        return jsonify(result)
-
-    except Exception as e:
-        logger.error(f"Error triggering backup for {env}: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'job_id': job_id}), 202
 
 
 @app.route('/api/schedules/history')
 @requires_auth
+@json_errors("Error getting backup history")
 def api_get_backup_history():
-    """Get backup history from audit log."""
-    try:
-        env = request.args.get('env')
-        limit = request.args.get('limit', 50, type=int)
+    """
+    Get backup history from audit log.
 
-        history = scheduler_service.get_backup_history(env=env, limit=limit)
+    Without `limit` or `before` this returns the plain list of entries, as it
+    always has. Paging clients get {'entries': [...], 'next_cursor': ...}.
+    """
+    env = request.args.get('env')
+    limit = request.args.get('limit', 50, type=int)
+    limit = min(max(limit, 1), 1000)
+    before = request.args.get('before', type=int)  # next_cursor of the previous page
+    if before is not None and before < 0:
+        return jsonify({'error': 'Invalid cursor'}), 400
 
-        return jsonify(history)
-    except Exception as e:
-        logger.error(f"Error getting backup history: {e}")
-        return jsonify({'error': str(e)}), 500
+    history = scheduler_service.get_backup_history(env=env, limit=limit, before=before)
+
+    if 'limit' not in request.args and 'before' not in request.args:
+        return jsonify(history['entries'])
+
+    return jsonify(history)
+
+
+# ============================================================================
+# API Routes - Background Jobs
+# ============================================================================
+
+@app.route('/api/jobs/<job_id>')
+@requires_auth
+def api_get_job(job_id):
+    """Get status and result of a background job."""
+    job = job_service.get_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
 
 
 # ============================================================================
@@ -903,10 +1129,11 @@ def api_save_auth():
 
         _auth_config['username'] = username
         if password:
-            _auth_config['password'] = password
+            _auth_config['password_hash'] = hash_password(password)
 
         # Persist credentials to file so they survive restarts
         config.save_auth_config(_auth_config)
+        _verified_headers.clear()
 
         # Log the change
         log_audit_event('auth', 'credentials_changed', f'Username: {username}')
@@ -921,129 +1148,183 @@ def api_save_auth():
 
 @app.route('/api/settings/audit')
 @requires_auth
+@json_errors("Error getting audit log")
 def api_get_audit_log():
     """Get audit log entries."""
-    try:
-        category = request.args.get('category')
-        limit = request.args.get('limit', 100, type=int)
-
-        audit_file = os.path.join(config.DATA_DIR, 'audit.log')
-        logs = []
-
-        if os.path.exists(audit_file):
-            with open(audit_file, 'r') as f:
-                lines = f.readlines()
-
-            for line in reversed(lines):
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    parts = line.split(' | ')
-                    if len(parts) >= 3:
-                        entry = {
-                            'timestamp': parts[0],
-                            'category': parts[1],
-                            'action': parts[2],
-                            'details': parts[3] if len(parts) > 3 else ''
-                        }
-
-                        if category and entry['category'] != category:
-                            continue
-
-                        logs.append(entry)
-
-                        if len(logs) >= limit:
-                            break
-                except Exception:
-                    continue
-
-        return jsonify(logs)
+    category = request.args.get('category')
+    limit = request.args.get('limit', 100, type=int)
 
-    except Exception as e:
-        logger.error(f"Error getting audit log: {e}")
-        return jsonify({'error': str(e)}), 500
+    audit_file = os.path.join(config.DATA_DIR, 'audit.log')
+    logs = []
+    wanted = category.encode() if category else None
+
+    # Include events logged just before this request
+    flush_audit_log()
+
+    if os.path.exists(audit_file):
+        # Read from the end so only the lines needed for `limit` are touched
+        for _, raw_line in config.read_lines_reversed(audit_file):
+            # Lines are "timestamp | category | action | details"; the category
+            # is checked before the rest of the line is split or decoded
+            timestamp, sep, rest = raw_line.strip().partition(b' | ')
+            entry_category, sep2, rest = rest.partition(b' | ')
+            if not (sep and sep2):
+                continue
+            if wanted and entry_category != wanted:
+                continue
+
+            action, _, details = rest.partition(b' | ')
+            logs.append({
+                'timestamp': timestamp.decode('utf-8', errors='replace'),
+                'category': entry_category.decode('utf-8', errors='replace'),
+                'action': action.decode('utf-8', errors='replace'),
+                'details': details.decode('utf-8', errors='replace')
+            })
+
+            if len(logs) >= limit:
+                break
+
+    return jsonify(logs)
 
 
 @app.route('/api/settings/restart-all', methods=['POST'])
 @requires_auth
+@json_errors("Error restarting containers")
 def api_restart_all():
     """Restart all containers."""
-    try:
-        logger.warning("Restarting all containers")
-        results = {}
+    logger.warning("Restarting all containers")
 
-        for env in config.ENVIRONMENTS:
-            result = container_service.restart_container(env)
-            results[env] = result.get('success', False)
+    # Restarts are independent; run them together so this takes the slowest, not the sum
+    futures = {env: _io_pool.submit(container_service.restart_container, env)
+               for env in config.ENVIRONMENTS}
+    pending = _wait_io(futures.values())
+    results = {env: future not in pending and future.result().get('success', False)
+               for env, future in futures.items()}
+    timed_out = [env for env, future in futures.items() if future in pending]
 
-        log_audit_event('container', 'restart_all', f'Results: {results}')
+    _invalidate_status()
+    log_audit_event('container', 'restart_all', f'Results: {results}')
 
-        return jsonify({'success': True, 'results': results})
+    if timed_out:
+        logger.error(f"Restart timed out for: {', '.join(timed_out)}")
+        return jsonify({
+            'success': False,
+            'error': f"Restart timed out after {IO_POOL_TIMEOUT}s for: {', '.join(timed_out)}",
+            'results': results
+        }), 504
 
-    except Exception as e:
-        logger.error(f"Error restarting containers: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'success': True, 'results': results})
 
 
 @app.route('/api/settings/cleanup-backups', methods=['POST'])
 @requires_auth
+@json_errors("Error cleaning up backups")
 def api_cleanup_backups():
     """Cleanup old backups."""
-    try:
-        data = request.get_json()
-        days = data.get('days', 7) if data else 7
+    data = request.get_json()
+    days = data.get('days', 7) if data else 7
 
-        total_deleted = 0
+    # Environments have separate backup directories, so sweep them concurrently
+    futures = {env: _io_pool.submit(backup_service.cleanup_old_backups, env, days)
+               for env in config.ENVIRONMENTS}
+    pending = _wait_io(futures.values())
+    total_deleted = sum(future.result() for future in futures.values() if future not in pending)
+    timed_out = [env for env, future in futures.items() if future in pending]
 
-        for env in config.ENVIRONMENTS:
-            deleted = backup_service.cleanup_old_backups(env, days)
-            total_deleted += deleted
+    log_audit_event('backup', 'cleanup', f'Deleted {total_deleted} backups older than {days} days')
+    logger.info(f"Cleaned up {total_deleted} old backups")
 
-        log_audit_event('backup', 'cleanup', f'Deleted {total_deleted} backups older than {days} days')
-        logger.info(f"Cleaned up {total_deleted} old backups")
+    if timed_out:
+        logger.error(f"Backup cleanup timed out for: {', '.join(timed_out)}")
+        return jsonify({
+            'success': False,
+            'error': f"Cleanup timed out after {IO_POOL_TIMEOUT}s for: {', '.join(timed_out)}",
+            'deleted': total_deleted
+        }), 504
 
-        return jsonify({'success': True, 'deleted': total_deleted})
-
-    except Exception as e:
-        logger.error(f"Error cleaning up backups: {e}")
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'success': True, 'deleted': total_deleted})
 
 
 @app.route('/api/logs/dashboard/download')
 @requires_auth
+@json_errors("Error downloading dashboard logs")
 def api_download_dashboard_logs():
     """Download dashboard logs."""
-    try:
-        log_file = os.path.join(config.DATA_DIR, 'dashboard.log')
+    log_file = os.path.join(config.DATA_DIR, 'dashboard.log')
 
-        if not os.path.exists(log_file):
-            return jsonify({'error': 'Log file not found'}), 404
+    if not os.path.exists(log_file):
+        return jsonify({'error': 'Log file not found'}), 404
 
-        from flask import send_file
-        return send_file(
-            log_file,
-            as_attachment=True,
-            download_name=f'dashboard-{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-        )
+    from flask import send_file
+    return send_file(
+        log_file,
+        as_attachment=True,
+        download_name=f'dashboard-{datetime.now().strftime("%Y%m%d_%H%M%S")}.log',
+        conditional=True
+    )
 
-    except Exception as e:
-        logger.error(f"Error downloading dashboard logs: {e}")
-        return jsonify({'error': str(e)}), 500
 
+# Audit entries are queued by request threads and appended by one writer
+# thread, which gathers whatever arrives within the flush interval (up to
+# a batch) into a single write.
+AUDIT_BATCH_SIZE = 256
+AUDIT_FLUSH_INTERVAL = 0.1  # seconds
+_audit_queue = queue.Queue()
 
-def log_audit_event(category, action, details=''):
-    """Log an event to the audit log."""
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(seconds):
+    """Local time of a whole epoch second in ISO format; batches share one."""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+
+
+def _format_audit_line(event):
+    """Render a queued (time, category, action, details) event as a log line."""
+    when, category, action, details = event
+    seconds = int(when)
+    micros = int((when - seconds) * 1_000_000)
+    return f"{_iso_second(seconds)}.{micros:06d} | {category} | {action} | {details}\n"
+
+
+def _audit_writer():
+    """Append queued audit lines to audit.log in batches (runs forever)."""
     audit_file = os.path.join(config.DATA_DIR, 'audit.log')
 
-    try:
-        timestamp = datetime.now().isoformat()
+    while True:
+        events = [_audit_queue.get()]
+        deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL
+        while len(events) < AUDIT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                events.append(_audit_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
 
-        with open(audit_file, 'a') as f:
-            f.write(f"{timestamp} | {category} | {action} | {details}\n")
-    except IOError as e:
-        logger.warning(f"Failed to write audit log: {e}")
+        try:
+            with open(audit_file, 'a') as f:
+                f.write(''.join(map(_format_audit_line, events)))
+        except Exception as e:
+            logger.warning(f"Failed to write audit log: {e}")
+        finally:
+            for _ in events:
+                _audit_queue.task_done()
+
+
+def flush_audit_log():
+    """Block until every queued audit entry has been written."""
+    _audit_queue.join()
+
+
+threading.Thread(target=_audit_writer, name='audit-writer', daemon=True).start()
+# Don't lose the last batch on shutdown
+atexit.register(flush_audit_log)
+
+
+def log_audit_event(category, action, details=''):
+    """Log an event to the audit log (formatted and written in the background)."""
+    _audit_queue.put_nowait((time.time(), category, action, details))
 
 
 # ============================================================================
@@ -1082,7 +1363,7 @@ def main():
     print()
     print(f"Credentials file: {config.AUTH_CONFIG_FILE}")
     print(f"Current username: {_auth_config.get('username', 'admin')}")
-    print("(If you forget your password, check the credentials file above)")
+    print("(If you forget your password, delete the credentials file above to reset it to admin/admin)")
     print()
     print(f"Dashboard will be available at: http://localhost:{config.APP_PORT}")
     print()
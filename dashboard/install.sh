@@ -104,6 +104,7 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 cp "$SCRIPT_DIR/dashboard.py" "$INSTALL_DIR/"
 cp "$SCRIPT_DIR/config.py" "$INSTALL_DIR/"
+cp "$SCRIPT_DIR/wsgi.py" "$INSTALL_DIR/"
 cp -r "$SCRIPT_DIR/services" "$INSTALL_DIR/"
 cp -r "$SCRIPT_DIR/templates" "$INSTALL_DIR/"
 cp -r "$SCRIPT_DIR/static" "$INSTALL_DIR/"
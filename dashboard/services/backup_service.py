@@ -12,17 +12,37 @@ Handles:
 
 import os
 import subprocess
+import contextlib
+import fcntl
+import functools
 import json
-import gzip
+import shlex
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import sys
 import re
+import threading
+import time
 
 # Add parent directory to path for config import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
+try:
+    import psycopg2
+    import psycopg2.extensions
+    from psycopg2 import sql as pgsql
+    from psycopg2.pool import ThreadedConnectionPool
+except ImportError:
+    psycopg2 = None
+
+try:
+    import orjson  # optional, faster manifest parsing when installed
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # Database Credential Functions
@@ -68,10 +88,90 @@ def get_db_credentials(env):
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _pg_base_env():
+    """The part of the environment PostgreSQL client tools use."""
+    base = {key: value for key, value in os.environ.items()
+            if key in ('PATH', 'HOME') or key.startswith('PG')}
+    base['LC_ALL'] = 'C.UTF-8'  # plain, predictable messages and UTF-8 output
+    return base
+
+
+def _pg_env(creds):
+    """Environment for running psql/pg_dump/pg_restore with a set of credentials."""
+    return {**_pg_base_env(), 'PGPASSWORD': creds['password']}
+
+
+def _psycopg2_usable():
+    """
+    Whether psycopg2 can be used without stalling the server.
+
+    psycopg2 blocks in C while it waits on PostgreSQL. Under gevent (see
+    wsgi.py) that would freeze every request, so there it is only used once
+    a wait callback makes it cooperative; otherwise psql runs instead.
+    """
+    if psycopg2 is None:
+        return False
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_module_patched('socket'):
+        return psycopg2.extensions.get_wait_callback() is not None
+    return True
+
+
+# Databases owned by a user (the user name is passed as a parameter)
+_DISCOVER_DATABASES_SQL = """
+    SELECT datname
+    FROM pg_database
+    WHERE datdba = (SELECT usesysid FROM pg_user WHERE usename = %s)
+    AND datname NOT IN ('postgres', 'template0', 'template1')
+"""
+
+# (host, port, user, password) -> ThreadedConnectionPool on the postgres db
+_pg_pools = {}
+_pg_pools_lock = threading.Lock()
+
+
+def _get_pg_pool(creds):
+    """Get (or create) the connection pool for a set of credentials."""
+    key = (creds['host'], creds['port'], creds['user'], creds['password'])
+    with _pg_pools_lock:
+        pool = _pg_pools.get(key)
+        if pool is None:
+            # psycopg2 only keeps returned connections while fewer than
+            # minconn are idle, so minconn=0 would close every one
+            pool = _pg_pools[key] = ThreadedConnectionPool(
+                1, 4,
+                host=creds['host'], port=creds['port'],
+                user=creds['user'], password=creds['password'],
+                dbname='postgres', connect_timeout=10
+            )
+        return pool
+
+
+def _discover_databases_pooled(creds):
+    """Run the discovery query on a pooled psycopg2 connection."""
+    pool = _get_pg_pool(creds)
+    conn = pool.getconn()
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(_DISCOVER_DATABASES_SQL, (creds['user'],))
+            rows = cur.fetchall()
+    except psycopg2.Error:
+        # Don't hand a broken connection (e.g. after a server restart) to the next caller
+        pool.putconn(conn, close=True)
+        raise
+    pool.putconn(conn)
+    return [row[0] for row in rows]
+
+
 def discover_databases(env):
     """
     Discover databases owned by the Odoo user for an environment.
 
+    Uses a pooled psycopg2 connection when psycopg2 is usable (see
+    _psycopg2_usable), and falls back to running psql.
+
     Returns:
         list: List of database names
     """
@@ -80,20 +180,21 @@ def discover_databases(env):
     if not creds['password']:
         raise ValueError(f"No password found for {env} environment")
 
-    env_vars = os.environ.copy()
-    env_vars['PGPASSWORD'] = creds['password']
+    if _psycopg2_usable():
+        try:
+            return _discover_databases_pooled(creds)
+        except psycopg2.Error:
+            # Let psql try (and report the error the usual way)
+            pass
 
-    # Query PostgreSQL for databases owned by this user
-    query = f"""
-        SELECT datname
-        FROM pg_database
-        WHERE datdba = (SELECT usesysid FROM pg_user WHERE usename = '{creds['user']}')
-        AND datname NOT IN ('postgres', 'template0', 'template1')
-    """
+    env_vars = _pg_env(creds)
 
+    # Query PostgreSQL for databases owned by this user; the query is read
+    # from stdin so psql substitutes :'owner' as a quoted literal
     result = subprocess.run(
         ['psql', '-h', creds['host'], '-p', creds['port'], '-U', creds['user'],
-         '-d', 'postgres', '-t', '-A', '-c', query],
+         '-d', 'postgres', '-t', '-A', '-v', f"owner={creds['user']}", '-f', '-'],
+        input=_DISCOVER_DATABASES_SQL.replace('%s', ":'owner'"),
         capture_output=True,
         text=True,
         env=env_vars
@@ -122,10 +223,180 @@ def get_primary_database(env):
     return databases[0]
 
 
+# ============================================================================
+# Manifest Functions
+# ============================================================================
+
+def _load_manifest(manifest_file):
+    """Read a backup manifest."""
+    with open(manifest_file, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dump_manifest(manifest_file, manifest):
+    """
+    Write a backup manifest atomically.
+
+    The payload goes to a temporary file that is renamed over the manifest,
+    so readers (and a crash) see either the old file or the complete new one.
+    """
+    if orjson:
+        payload = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(manifest, indent=2).encode()
+    tmp_file = manifest_file + '.tmp'
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, manifest_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
 # ============================================================================
 # Backup Creation Functions
 # ============================================================================
 
+def _drop_page_cache(path):
+    """
+    Flush a finished backup file and tell the kernel not to keep it cached.
+
+    Backups are written once and rarely read soon after; left in the page
+    cache, gigabytes of them would push out pages Odoo and PostgreSQL use.
+    DONTNEED only drops clean pages, hence the fsync first.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+# 1 MiB, the default /proc/sys/fs/pipe-max-size
+PIPE_BUFFER_SIZE = 1024 * 1024
+
+
+def _enlarge_pipe(pipe):
+    """Grow a pipe's kernel buffer from 64 KiB, so reader and writer wake up less often."""
+    if not hasattr(fcntl, 'F_SETPIPE_SZ'):
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _compress_program():
+    """pigz (multi-threaded gzip) when installed, else gzip."""
+    return 'pigz' if shutil.which('pigz') else 'gzip'
+
+
+# Incremental filestore archives (GNU tar --listed-incremental). The snapshot
+# file records what the chain has archived so far; the chain file records
+# the chain's start and its latest archive.
+FILESTORE_SNAPSHOT_FILE = 'filestore.snar'
+FILESTORE_CHAIN_FILE = 'filestore-chain.json'
+_filestore_lock = threading.Lock()
+
+
+def _filestore_chain_position(env_backup_dir, full_every_days):
+    """
+    Decide where the next incremental filestore archive starts.
+
+    Returns:
+        tuple: (level, parent_backup_id); level 0 with no parent starts a
+        new chain with a full archive
+    """
+    from datetime import timedelta
+
+    snapshot_file = os.path.join(env_backup_dir, FILESTORE_SNAPSHOT_FILE)
+    try:
+        chain = _load_manifest(os.path.join(env_backup_dir, FILESTORE_CHAIN_FILE))
+        started = datetime.fromisoformat(chain['started'])
+    except (ValueError, KeyError, IOError):
+        return 0, None
+
+    if datetime.now() - started >= timedelta(days=full_every_days):
+        return 0, None
+
+    # The snapshot describes the parent's archive; without both the chain is broken
+    if not os.path.exists(snapshot_file) or not os.path.exists(chain['last_file']):
+        return 0, None
+
+    return chain['level'] + 1, chain['last_backup_id']
+
+
+def _archive_filestore(filestore_path, filestore_file, env_backup_dir, backup_id, incremental):
+    """
+    Archive a filestore with tar.
+
+    With incremental settings ({'full_every_days': N}), the archive only
+    holds files changed since the previous one, and a full archive starts
+    a new chain every N days.
+
+    Returns:
+        dict: {'level': int, 'parent_backup_id': str or None} for incremental
+        archives, {} otherwise
+    """
+    cmd = ['tar', '-I', _compress_program(), '-cf', filestore_file, '-C', filestore_path, '.']
+
+    if not incremental:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise Exception(f"tar failed: {result.stderr}")
+        return {}
+
+    snapshot_file = os.path.join(env_backup_dir, FILESTORE_SNAPSHOT_FILE)
+    chain_file = os.path.join(env_backup_dir, FILESTORE_CHAIN_FILE)
+
+    with _filestore_lock:
+        level, parent_backup_id = _filestore_chain_position(
+            env_backup_dir, incremental.get('full_every_days', 7)
+        )
+
+        # tar updates the snapshot as it goes; work on a copy so a failed
+        # run leaves the chain as it was
+        snapshot_tmp = f"{snapshot_file}.{backup_id}"
+        if level:
+            shutil.copyfile(snapshot_file, snapshot_tmp)
+        elif os.path.exists(snapshot_tmp):
+            os.remove(snapshot_tmp)
+
+        result = subprocess.run(
+            cmd[:1] + ['--listed-incremental', snapshot_tmp] + cmd[1:],
+            capture_output=True,
+            text=True
+        )
+
+        if result.returncode != 0:
+            if os.path.exists(snapshot_tmp):
+                os.remove(snapshot_tmp)
+            raise Exception(f"tar failed: {result.stderr}")
+
+        os.replace(snapshot_tmp, snapshot_file)
+
+        if level:
+            chain = _load_manifest(chain_file)
+        else:
+            chain = {'started': datetime.now().isoformat()}
+        chain.update(level=level, last_backup_id=backup_id, last_file=filestore_file)
+        _dump_manifest(chain_file, chain)
+
+    return {'level': level, 'parent_backup_id': parent_backup_id}
+
+
 def create_backup(env, backup_type='full', description='', database_name=None):
     """
     Create database and/or filestore backup.
@@ -146,19 +417,24 @@ def create_backup(env, backup_type='full', description='', database_name=None):
     os.makedirs(env_backup_dir, exist_ok=True)
 
     files = {}
+    chain = {}
 
-    # Database backup
+    # Resolve the database once: discovery runs psql
+    db_name = None
     if backup_type in ['full', 'database']:
         db_name = database_name or get_primary_database(env)
+
+    # Database backup
+    if db_name:
         db_file = os.path.join(env_backup_dir, f"{env}_db_{timestamp}.sql.gz")
 
         creds = get_db_credentials(env)
 
-        env_vars = os.environ.copy()
-        env_vars['PGPASSWORD'] = creds['password']
+        env_vars = _pg_env(creds)
 
-        # Use pg_dump with gzip compression
-        with gzip.open(db_file, 'wb') as f:
+        # Pipe pg_dump straight into (p)gzip; the dump never passes through Python
+        compressor = _compress_program()
+        with open(db_file, 'wb') as f:
             proc = subprocess.Popen(
                 ['pg_dump', '-h', creds['host'], '-p', creds['port'],
                  '-U', creds['user'], '-d', db_name],
@@ -166,19 +442,32 @@ def create_backup(env, backup_type='full', description='', database_name=None):
                 stderr=subprocess.PIPE,
                 env=env_vars
             )
+            _enlarge_pipe(proc.stdout)
+            gzip_proc = subprocess.Popen(
+                [compressor, '-c'],
+                stdin=proc.stdout,
+                stdout=f,
+                stderr=subprocess.PIPE
+            )
+            # Only the compressor holds the pipe now, so pg_dump sees it close if gzip dies
+            proc.stdout.close()
 
-            for chunk in iter(lambda: proc.stdout.read(8192), b''):
-                f.write(chunk)
-
+            stderr = proc.stderr.read().decode()
             proc.wait()
-
-            if proc.returncode != 0:
-                stderr = proc.stderr.read().decode()
-                # Clean up partial file
-                if os.path.exists(db_file):
-                    os.remove(db_file)
-                raise Exception(f"pg_dump failed: {stderr}")
-
+            gzip_stderr = gzip_proc.stderr.read().decode()
+            gzip_proc.wait()
+
+        if proc.returncode != 0 or gzip_proc.returncode != 0:
+            # Clean up partial file
+            if os.path.exists(db_file):
+                os.remove(db_file)
+            # A dead compressor also kills pg_dump (SIGPIPE / write error), so
+            # blame the compressor first or its stderr would never be seen
+            if gzip_proc.returncode != 0:
+                raise Exception(f"{compressor} failed (exit {gzip_proc.returncode}): {gzip_stderr}")
+            raise Exception(f"pg_dump failed (exit {proc.returncode}): {stderr}")
+
+        _drop_page_cache(db_file)
         files['database'] = db_file
 
     # Filestore backup
@@ -187,15 +476,11 @@ def create_backup(env, backup_type='full', description='', database_name=None):
         filestore_file = os.path.join(env_backup_dir, f"{env}_filestore_{timestamp}.tar.gz")
 
         if os.path.exists(filestore_path) and os.listdir(filestore_path):
-            result = subprocess.run(
-                ['tar', '-czf', filestore_file, '-C', filestore_path, '.'],
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                raise Exception(f"tar failed: {result.stderr}")
+            filestore_settings = config.load_backup_config().get('filestore', {})
+            incremental = filestore_settings if filestore_settings.get('incremental') else None
+            chain = _archive_filestore(filestore_path, filestore_file, env_backup_dir, backup_id, incremental)
 
+            _drop_page_cache(filestore_file)
             files['filestore'] = filestore_file
         else:
             # Create empty tarball if filestore is empty or doesn't exist
@@ -208,14 +493,14 @@ def create_backup(env, backup_type='full', description='', database_name=None):
         'environment': env,
         'type': backup_type,
         'description': description,
-        'database_name': database_name or (get_primary_database(env) if backup_type in ['full', 'database'] else None),
+        'database_name': db_name,
         'files': {k: v for k, v in files.items() if v},  # Only include non-None files
-        'sizes': {k: os.path.getsize(v) for k, v in files.items() if v}
+        'sizes': {k: os.path.getsize(v) for k, v in files.items() if v},
+        **chain  # level and parent_backup_id of an incremental filestore archive
     }
 
     manifest_file = os.path.join(env_backup_dir, f"{backup_id}.manifest.json")
-    with open(manifest_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    _dump_manifest(manifest_file, manifest)
 
     return {
         'backup_id': backup_id,
@@ -228,6 +513,59 @@ def create_backup(env, backup_type='full', description='', database_name=None):
 # Upload Functions
 # ============================================================================
 
+@functools.lru_cache(maxsize=4)
+def _get_s3_client(endpoint, access_key, secret_key, region):
+    """
+    Get an S3 client for a set of credentials, reusing it across calls.
+
+    boto3 clients are thread-safe and keep a pool of open connections, so
+    uploads after the first skip the TCP/TLS handshake. Keyed on the
+    settings, so saving new credentials simply yields a new client.
+    """
+    import boto3
+    from botocore.config import Config as BotoConfig
+
+    if endpoint and not endpoint.startswith('http'):
+        endpoint = f"https://{endpoint}"
+
+    return boto3.client(
+        's3',
+        endpoint_url=endpoint or None,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+        config=BotoConfig(
+            signature_version='s3v4',
+            max_pool_connections=32,
+            retries={'max_attempts': 3, 'mode': 'adaptive'}
+        )
+    )
+
+
+def _s3_client_for(s3_config):
+    """Shared S3 client for an s3 config dict."""
+    return _get_s3_client(
+        s3_config.get('endpoint', ''),
+        s3_config['access_key'],
+        s3_config['secret_key'],
+        s3_config.get('region', 'us-east-1')
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _transfer_config():
+    """Multipart settings shared by all S3 uploads."""
+    from boto3.s3.transfer import TransferConfig
+
+    # Files over 25MB go up as 8MB parts, 8 at a time (s3transfer grows the
+    # part size on its own for files that would need over 10,000 parts)
+    return TransferConfig(
+        multipart_threshold=25 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=8
+    )
+
+
 def upload_to_s3(local_file, remote_key, s3_config):
     """
     Upload file to S3-compatible storage.
@@ -241,43 +579,64 @@ def upload_to_s3(local_file, remote_key, s3_config):
         bool: Success status
     """
     try:
-        import boto3
-        from botocore.config import Config as BotoConfig
+        transfer_config = _transfer_config()
     except ImportError:
         raise ImportError("boto3 is required for S3 uploads. Install with: pip install boto3")
 
-    endpoint = s3_config.get('endpoint', '')
-    if endpoint and not endpoint.startswith('http'):
-        endpoint = f"https://{endpoint}"
-
-    s3_client = boto3.client(
-        's3',
-        endpoint_url=endpoint or None,
-        aws_access_key_id=s3_config['access_key'],
-        aws_secret_access_key=s3_config['secret_key'],
-        region_name=s3_config.get('region', 'us-east-1'),
-        config=BotoConfig(signature_version='s3v4')
+    s3_client = _s3_client_for(s3_config)
+    s3_client.upload_file(
+        local_file,
+        s3_config['bucket'],
+        remote_key,
+        Config=transfer_config
     )
 
-    file_size = os.path.getsize(local_file)
+    return True
 
-    # Use multipart upload for files > 100MB
-    if file_size > 100 * 1024 * 1024:
-        from boto3.s3.transfer import TransferConfig
-        transfer_config = TransferConfig(
-            multipart_threshold=25 * 1024 * 1024,  # 25MB
-            max_concurrency=10
-        )
-        s3_client.upload_file(
-            local_file,
-            s3_config['bucket'],
-            remote_key,
-            Config=transfer_config
-        )
-    else:
-        s3_client.upload_file(local_file, s3_config['bucket'], remote_key)
 
-    return True
+# Parallel uploads must not both find no master and both start one: only
+# one can own the ControlPath, and the loser stays up as a plain -N session
+_ssh_master_lock = threading.Lock()
+
+
+def _rsync_ssh_command(rsync_config, *options):
+    """
+    Build the ssh command rsync should use, sharing one SSH connection.
+
+    A master connection is kept open for 60s after its last use, so the
+    several files of one backup (and a connection test) share a single
+    SSH handshake. The master is started here with its output detached:
+    if rsync's own ssh spawned it, the backgrounded master would keep
+    rsync's stderr pipe open and hold up subprocess.run until it exits.
+    If it can't be started, rsync just connects directly.
+    """
+    control_path = os.path.join(config.DATA_DIR, 'ssh-%C')
+    destination = f"{rsync_config['username']}@{rsync_config['host']}"
+    base = [
+        'ssh', '-i', rsync_config['ssh_key_path'],
+        '-o', 'StrictHostKeyChecking=no',
+        '-o', f'ControlPath={control_path}',
+        *options
+    ]
+
+    try:
+        with _ssh_master_lock:
+            running = subprocess.run(
+                base + ['-O', 'check', destination],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=10
+            ).returncode == 0
+            if not running:
+                subprocess.run(
+                    base + ['-o', 'ControlMaster=yes', '-o', 'ControlPersist=60s',
+                            '-o', 'BatchMode=yes', '-f', '-N', destination],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    timeout=30
+                )
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+
+    return ' '.join(shlex.quote(part) for part in base)
 
 
 def upload_to_rsync(local_file, remote_path, rsync_config):
@@ -294,11 +653,12 @@ def upload_to_rsync(local_file, remote_path, rsync_config):
     """
     remote_dest = f"{rsync_config['username']}@{rsync_config['host']}:{rsync_config['remote_path']}/{remote_path}"
 
-    ssh_cmd = f"ssh -i {rsync_config['ssh_key_path']} -o StrictHostKeyChecking=no"
+    ssh_cmd = _rsync_ssh_command(rsync_config)
 
     cmd = [
         'rsync',
         '-avz',
+        '--partial',  # keep what an interrupted upload sent; the retry sends only the rest
         '--progress',
         '-e', ssh_cmd,
         local_file,
@@ -333,34 +693,35 @@ def upload_backup(backup_id, env):
     # Load manifest
     manifest_file = os.path.join(config.BACKUP_DIR, env, f"{backup_id}.manifest.json")
 
-    if not os.path.exists(manifest_file):
+    try:
+        manifest = _load_manifest(manifest_file)
+    except FileNotFoundError:
         raise ValueError(f"Backup {backup_id} not found")
 
-    with open(manifest_file, 'r') as f:
-        manifest = json.load(f)
-
-    uploaded_files = []
-
-    # Upload all backup files
-    for file_type, local_file in manifest['files'].items():
-        if not os.path.exists(local_file):
-            continue
-
-        remote_key = f"{env}/{os.path.basename(local_file)}"
-
+    def upload(local_file, remote_key):
         if backend == 's3':
             upload_to_s3(local_file, remote_key, backup_config['s3'])
         elif backend == 'rsync':
             upload_to_rsync(local_file, remote_key, backup_config['rsync'])
+        return local_file
+
+    uploaded_files = [
+        local_file for local_file in manifest['files'].values()
+        if os.path.exists(local_file)
+    ]
 
-        uploaded_files.append(local_file)
+    # Upload all backup files at once (S3 clients and ssh connections are shared)
+    if uploaded_files:
+        with ThreadPoolExecutor(max_workers=min(4, len(uploaded_files))) as executor:
+            futures = [
+                executor.submit(upload, local_file, f"{env}/{os.path.basename(local_file)}")
+                for local_file in uploaded_files
+            ]
+            for future in futures:
+                future.result()
 
-    # Upload manifest
-    manifest_remote = f"{env}/{backup_id}.manifest.json"
-    if backend == 's3':
-        upload_to_s3(manifest_file, manifest_remote, backup_config['s3'])
-    elif backend == 'rsync':
-        upload_to_rsync(manifest_file, manifest_remote, backup_config['rsync'])
+    # Upload manifest last, so a remote manifest always has its files
+    upload(manifest_file, f"{env}/{backup_id}.manifest.json")
 
     return {
         'uploaded': True,
@@ -379,24 +740,12 @@ def test_s3_connection(s3_config):
     """
     try:
         import boto3
-        from botocore.config import Config as BotoConfig
         from botocore.exceptions import ClientError
     except ImportError:
         return {'success': False, 'message': 'boto3 not installed'}
 
     try:
-        endpoint = s3_config.get('endpoint', '')
-        if endpoint and not endpoint.startswith('http'):
-            endpoint = f"https://{endpoint}"
-
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=endpoint or None,
-            aws_access_key_id=s3_config['access_key'],
-            aws_secret_access_key=s3_config['secret_key'],
-            region_name=s3_config.get('region', 'us-east-1'),
-            config=BotoConfig(signature_version='s3v4')
-        )
+        s3_client = _s3_client_for(s3_config)
 
         # Try to list bucket contents
         s3_client.list_objects_v2(Bucket=s3_config['bucket'], MaxKeys=1)
@@ -417,7 +766,7 @@ def test_rsync_connection(rsync_config):
         dict: Test result with success status and message
     """
     try:
-        ssh_cmd = f"ssh -i {rsync_config['ssh_key_path']} -o StrictHostKeyChecking=no -o BatchMode=yes"
+        ssh_cmd = _rsync_ssh_command(rsync_config, '-o', 'BatchMode=yes')
 
         cmd = [
             'rsync',
@@ -443,10 +792,70 @@ def test_rsync_connection(rsync_config):
 # Backup Listing and Management
 # ============================================================================
 
+# environment -> (backup dir st_mtime_ns, backup entries); adding or removing
+# any file in the directory changes its mtime, which invalidates the entry
+_list_cache = {}
+
+
+def _scan_backups(env_backup_dir):
+    """
+    Read every manifest in an environment's backup directory.
+
+    Returns:
+        tuple: (entries, complete); complete is False if any manifest
+        could not be read, so the listing shouldn't be cached
+    """
+    entries = []
+    complete = True
+
+    # One directory read answers the existence checks for files stored here
+    with os.scandir(env_backup_dir) as it:
+        names = {entry.name for entry in it}
+
+    def exists(file_path):
+        if os.path.dirname(file_path) == env_backup_dir:
+            return os.path.basename(file_path) in names
+        return os.path.exists(file_path)
+
+    # Find all manifest files
+    for filename in names:
+        if filename.endswith('.manifest.json'):
+            manifest_path = os.path.join(env_backup_dir, filename)
+
+            try:
+                manifest = _load_manifest(manifest_path)
+
+                # Verify files exist
+                files_exist = all(exists(f) for f in manifest.get('files', {}).values())
+
+                entries.append({
+                    'backup_id': manifest['backup_id'],
+                    'timestamp': manifest['timestamp'],
+                    'type': manifest['type'],
+                    'description': manifest.get('description', ''),
+                    'database_name': manifest.get('database_name'),
+                    'sizes': manifest.get('sizes', {}),
+                    'total_size': sum(manifest.get('sizes', {}).values()),
+                    'level': manifest.get('level', 0),
+                    'parent_backup_id': manifest.get('parent_backup_id'),
+                    'files_exist': files_exist
+                })
+            except (json.JSONDecodeError, KeyError, IOError):
+                complete = False
+                continue
+
+    # Sort by timestamp (newest first)
+    entries.sort(key=lambda x: x['timestamp'], reverse=True)
+    return entries, complete
+
+
 def list_backups(env=None):
     """
     List available backups.
 
+    Manifests are only re-read when the environment's backup directory
+    has changed since the last scan.
+
     Args:
         env: Environment name (optional, lists all if not specified)
 
@@ -459,58 +868,52 @@ def list_backups(env=None):
 
     for environment in environments:
         env_backup_dir = os.path.join(config.BACKUP_DIR, environment)
-        backups[environment] = []
 
-        if not os.path.exists(env_backup_dir):
+        try:
+            mtime = os.stat(env_backup_dir).st_mtime_ns
+        except OSError:
+            _list_cache.pop(environment, None)
+            backups[environment] = []
             continue
 
-        # Find all manifest files
-        for filename in os.listdir(env_backup_dir):
-            if filename.endswith('.manifest.json'):
-                manifest_path = os.path.join(env_backup_dir, filename)
-
-                try:
-                    with open(manifest_path, 'r') as f:
-                        manifest = json.load(f)
-
-                    # Verify files exist
-                    files_exist = all(
-                        os.path.exists(f) for f in manifest.get('files', {}).values()
-                    )
-
-                    backups[environment].append({
-                        'backup_id': manifest['backup_id'],
-                        'timestamp': manifest['timestamp'],
-                        'type': manifest['type'],
-                        'description': manifest.get('description', ''),
-                        'database_name': manifest.get('database_name'),
-                        'sizes': manifest.get('sizes', {}),
-                        'total_size': sum(manifest.get('sizes', {}).values()),
-                        'files_exist': files_exist
-                    })
-                except (json.JSONDecodeError, IOError):
-                    continue
+        cached = _list_cache.get(environment)
+        if cached is None or cached[0] != mtime:
+            entries, complete = _scan_backups(env_backup_dir)
+            cached = (mtime, entries)
+            if complete:
+                _list_cache[environment] = cached
+            else:
+                # An unreadable manifest may be one still being written; its
+                # completion won't change the directory mtime, so rescan next time
+                _list_cache.pop(environment, None)
 
-        # Sort by timestamp (newest first)
-        backups[environment].sort(key=lambda x: x['timestamp'], reverse=True)
+        # Copies, so callers can't alter the cached entries
+        backups[environment] = [dict(entry) for entry in cached[1]]
 
     return backups if not env else backups.get(env, [])
 
 
-def get_backup_details(env, backup_id):
-    """Get detailed information about a specific backup."""
+def get_backup_details(env, backup_id, refresh=False):
+    """
+    Get detailed information about a specific backup.
+
+    Sizes come from the manifest, which records them when the backup is
+    written; pass refresh=True to re-read them from the files on disk.
+    """
     manifest_file = os.path.join(config.BACKUP_DIR, env, f"{backup_id}.manifest.json")
 
-    if not os.path.exists(manifest_file):
+    try:
+        manifest = _load_manifest(manifest_file)
+    except FileNotFoundError:
         raise ValueError(f"Backup {backup_id} not found")
 
-    with open(manifest_file, 'r') as f:
-        manifest = json.load(f)
-
-    # Check file existence and update sizes
-    for file_type, file_path in manifest.get('files', {}).items():
-        if os.path.exists(file_path):
-            manifest['sizes'][file_type] = os.path.getsize(file_path)
+    if refresh:
+        sizes = manifest.setdefault('sizes', {})
+        for file_type, file_path in manifest.get('files', {}).items():
+            try:
+                sizes[file_type] = os.path.getsize(file_path)
+            except OSError:
+                pass
 
     manifest['total_size'] = sum(manifest.get('sizes', {}).values())
 
@@ -530,16 +933,17 @@ def delete_backup(env, backup_id):
     """
     manifest_file = os.path.join(config.BACKUP_DIR, env, f"{backup_id}.manifest.json")
 
-    if not os.path.exists(manifest_file):
+    try:
+        manifest = _load_manifest(manifest_file)
+    except FileNotFoundError:
         return False
 
-    with open(manifest_file, 'r') as f:
-        manifest = json.load(f)
-
     # Delete all backup files
     for file_path in manifest.get('files', {}).values():
-        if os.path.exists(file_path):
+        try:
             os.remove(file_path)
+        except FileNotFoundError:
+            pass
 
     # Delete manifest
     os.remove(manifest_file)
@@ -547,6 +951,56 @@ def delete_backup(env, backup_id):
     return True
 
 
+# backup ids end in the creation time: {env}_{type}_%Y%m%d_%H%M%S
+_MANIFEST_TIME_RE = re.compile(r'_(\d{8})_(\d{6})\.manifest\.json$')
+
+
+def _expired_backup_ids(env_backup_dir, cutoff):
+    """
+    List backups created before cutoff.
+
+    The creation time is read from the manifest file name, so only
+    manifests with a non-standard name have to be opened.
+    """
+    cutoff_key = int(cutoff.strftime('%Y%m%d%H%M%S'))
+    expired = []
+
+    with os.scandir(env_backup_dir) as it:
+        for entry in it:
+            if not entry.name.endswith('.manifest.json'):
+                continue
+
+            match = _MANIFEST_TIME_RE.search(entry.name)
+            if match:
+                is_expired = int(match.group(1) + match.group(2)) < cutoff_key
+            else:
+                try:
+                    manifest = _load_manifest(entry.path)
+                    is_expired = datetime.fromisoformat(manifest['timestamp']) < cutoff
+                except (ValueError, KeyError, IOError):
+                    continue
+
+            if is_expired:
+                expired.append(entry.name[:-len('.manifest.json')])
+
+    return expired
+
+
+def _keep_chain_parents(env, expired):
+    """Drop backups from expired that a kept incremental backup still builds on."""
+    parents = {backup['backup_id']: backup['parent_backup_id'] for backup in list_backups(env)}
+    expired = set(expired)
+
+    for backup_id, parent in parents.items():
+        if backup_id in expired:
+            continue
+        while parent in expired:
+            expired.discard(parent)
+            parent = parents.get(parent)
+
+    return sorted(expired)
+
+
 def cleanup_old_backups(env, retention_days=7):
     """
     Remove backups older than retention period.
@@ -561,18 +1015,24 @@ def cleanup_old_backups(env, retention_days=7):
     from datetime import timedelta
 
     cutoff = datetime.now() - timedelta(days=retention_days)
-    deleted_count = 0
 
-    backups = list_backups(env)
+    env_backup_dir = os.path.join(config.BACKUP_DIR, env)
+    try:
+        expired = _expired_backup_ids(env_backup_dir, cutoff)
+    except FileNotFoundError:
+        return 0
 
-    for backup in backups:
-        backup_time = datetime.fromisoformat(backup['timestamp'])
+    # Incremental archives are useless without their parents
+    if expired and os.path.exists(os.path.join(env_backup_dir, FILESTORE_CHAIN_FILE)):
+        expired = _keep_chain_parents(env, expired)
+    if not expired:
+        return 0
 
-        if backup_time < cutoff:
-            if delete_backup(env, backup['backup_id']):
-                deleted_count += 1
+    # Deletions are independent unlinks; overlap them instead of one by one
+    with ThreadPoolExecutor(max_workers=min(8, len(expired))) as executor:
+        results = list(executor.map(lambda backup_id: delete_backup(env, backup_id), expired))
 
-    return deleted_count
+    return sum(results)
 
 
 def get_backup_file_path(env, backup_id, file_type):
@@ -589,12 +1049,11 @@ def get_backup_file_path(env, backup_id, file_type):
     """
     manifest_file = os.path.join(config.BACKUP_DIR, env, f"{backup_id}.manifest.json")
 
-    if not os.path.exists(manifest_file):
+    try:
+        manifest = _load_manifest(manifest_file)
+    except FileNotFoundError:
         return None
 
-    with open(manifest_file, 'r') as f:
-        manifest = json.load(f)
-
     file_path = manifest.get('files', {}).get(file_type)
 
     if file_path and os.path.exists(file_path):
@@ -607,6 +1066,168 @@ def get_backup_file_path(env, backup_id, file_type):
 # Database Copy Functions
 # ============================================================================
 
+@contextlib.contextmanager
+def _pg_admin_session(creds):
+    """
+    Run maintenance statements (terminate, drop, create) on the postgres database.
+
+    Yields execute(statement, identifiers=(), params=()), returning an error
+    message or None. Statements use {} for identifiers and %s for values.
+    All statements share one pooled psycopg2 connection; when psycopg2
+    isn't usable (or can't connect) each runs through psql.
+    """
+    conn = None
+    if _psycopg2_usable():
+        try:
+            # Creating the pool opens its first connection
+            pool = _get_pg_pool(creds)
+            conn = pool.getconn()
+            conn.autocommit = True
+        except psycopg2.Error:
+            conn = None
+
+    if conn is not None:
+        def execute(statement, identifiers=(), params=()):
+            query = pgsql.SQL(statement).format(*map(pgsql.Identifier, identifiers))
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+            except psycopg2.Error as e:
+                return str(e).strip()
+            return None
+
+        try:
+            yield execute
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
+        return
+
+    env_vars = _pg_env(creds)
+
+    def execute(statement, identifiers=(), params=()):
+        # psql quotes :"name" as an identifier and :'name' as a literal
+        cmd = ['psql', '-h', creds['host'], '-p', creds['port'], '-U', creds['user'],
+               '-d', 'postgres', '-v', 'ON_ERROR_STOP=1', '-f', '-']
+        for i, value in enumerate(identifiers):
+            cmd += ['-v', f'i{i}={value}']
+        for i, value in enumerate(params):
+            cmd += ['-v', f'p{i}={value}']
+        query = statement.format(*(f':"i{i}"' for i in range(len(identifiers))))
+        counter = iter(range(len(params)))
+        query = re.sub('%s', lambda _: f":'p{next(counter)}'", query)
+
+        result = subprocess.run(cmd, input=query, capture_output=True, text=True, env=env_vars)
+        return result.stderr.strip() if result.returncode != 0 else None
+
+    yield execute
+
+
+def _copy_jobs():
+    """Parallel pg_dump/pg_restore workers; capped so the source database isn't swamped."""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def _dump_and_restore(source_creds, source_db, target_creds, target_db):
+    """
+    Copy a database's contents into an existing empty database.
+
+    Dumps in directory format with parallel workers (light compression:
+    the dump is scratch data, read back right away), then restores the
+    schema in one job (so objects are created in dependency order) and the
+    data and indexes in parallel. Objects end up owned by the target user.
+
+    Returns:
+        str: Error message, or None on success
+    """
+    jobs = str(_copy_jobs())
+
+    source_env_vars = _pg_env(source_creds)
+    target_env_vars = _pg_env(target_creds)
+
+    # Next to the backups: a dump can be far larger than /tmp
+    os.makedirs(config.BACKUP_DIR, exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix='.copy-', dir=config.BACKUP_DIR)
+    dump_dir = os.path.join(work_dir, 'dump')
+
+    try:
+        dump_result = subprocess.run(
+            ['pg_dump', '-h', source_creds['host'], '-p', source_creds['port'],
+             '-U', source_creds['user'], '-d', source_db,
+             '-Fd', '-j', jobs, '-Z', '1', '-f', dump_dir],
+            capture_output=True,
+            text=True,
+            env=source_env_vars
+        )
+        if dump_result.returncode != 0:
+            return f"Database dump failed: {dump_result.stderr}"
+
+        restore_cmd = ['pg_restore', '-h', target_creds['host'], '-p', target_creds['port'],
+                       '-U', target_creds['user'], '-d', target_db,
+                       '--no-owner', '--no-privileges']
+        for sections in (['--section=pre-data', '-j', '1'],
+                         ['--section=data', '--section=post-data', '-j', jobs]):
+            restore_result = subprocess.run(
+                restore_cmd + sections + [dump_dir],
+                capture_output=True,
+                text=True,
+                env=target_env_vars
+            )
+            if restore_result.returncode != 0:
+                return f"Database restore failed: {restore_result.stderr}"
+
+        return None
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _fast_copytree(src, dst):
+    """
+    Copy a directory tree, preserving modes and timestamps.
+
+    GNU cp does it in one process and clones file extents where the
+    filesystem supports it (btrfs, XFS), otherwise uses copy_file_range;
+    rsync and shutil.copytree are fallbacks for systems without GNU cp.
+    """
+    result = subprocess.run(['cp', '-a', '--reflink=auto', '-T', src, dst], capture_output=True)
+    if result.returncode == 0:
+        return
+
+    if shutil.which('rsync'):
+        result = subprocess.run(
+            ['rsync', '-a', '--inplace', '--numeric-ids', src + '/', dst + '/'],
+            capture_output=True
+        )
+        if result.returncode == 0:
+            return
+
+    shutil.copytree(src, dst, dirs_exist_ok=True)
+
+
+def _async_rmtree(path, trash_dir=None):
+    """
+    Remove a directory tree without waiting for it.
+
+    The tree is renamed to a hidden entry in trash_dir (default: its parent;
+    instant, and frees the name for the new copy) and deleted by a detached
+    `rm -rf`. trash_dir must be on the same filesystem and outside anything
+    that gets archived. Falls back to deleting in place if the rename fails.
+    """
+    parent, name = os.path.split(path.rstrip('/'))
+    trash = os.path.join(trash_dir or parent, f".{name}.trash-{time.time_ns()}")
+
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path)
+        return
+
+    subprocess.Popen(
+        ['rm', '-rf', trash],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
 def copy_database(source_env, target_env, include_filestore=True, include_addons=True, target_db_name=None):
     """
     Copy database (and optionally filestore/addons) from one environment to another.
@@ -628,10 +1249,10 @@ def copy_database(source_env, target_env, include_filestore=True, include_addons
     if source_env == target_env:
         raise ValueError("Source and target environments must be different")
 
-    if source_env not in config.ENVIRONMENTS:
+    if source_env not in config.ENVIRONMENTS_SET:
         raise ValueError(f"Invalid source environment: {source_env}")
 
-    if target_env not in config.ENVIRONMENTS:
+    if target_env not in config.ENVIRONMENTS_SET:
         raise ValueError(f"Invalid target environment: {target_env}")
 
     result = {
@@ -671,78 +1292,49 @@ def copy_database(source_env, target_env, include_filestore=True, include_addons
         pass
 
     try:
-        # Step 2: Drop and recreate target database
-        env_vars = os.environ.copy()
-        env_vars['PGPASSWORD'] = target_creds['password']
-
-        # Terminate existing connections to target database
-        terminate_query = f"""
+        # Step 2: Drop and recreate target database (one server session)
+        terminate_query = """
             SELECT pg_terminate_backend(pg_stat_activity.pid)
             FROM pg_stat_activity
-            WHERE pg_stat_activity.datname = '{target_db}'
+            WHERE pg_stat_activity.datname = %s
             AND pid <> pg_backend_pid()
         """
 
-        subprocess.run(
-            ['psql', '-h', target_creds['host'], '-p', target_creds['port'],
-             '-U', target_creds['user'], '-d', 'postgres', '-c', terminate_query],
-            capture_output=True,
-            env=env_vars
-        )
+        with _pg_admin_session(target_creds) as execute:
+            # Terminate existing connections to target database
+            execute(terminate_query, params=(target_db,))
 
-        # Drop target database if it exists
-        drop_result = subprocess.run(
-            ['psql', '-h', target_creds['host'], '-p', target_creds['port'],
-             '-U', target_creds['user'], '-d', 'postgres',
-             '-c', f'DROP DATABASE IF EXISTS "{target_db}"'],
-            capture_output=True,
-            text=True,
-            env=env_vars
-        )
-
-        # Create new target database
-        create_result = subprocess.run(
-            ['psql', '-h', target_creds['host'], '-p', target_creds['port'],
-             '-U', target_creds['user'], '-d', 'postgres',
-             '-c', f'CREATE DATABASE "{target_db}"'],
-            capture_output=True,
-            text=True,
-            env=env_vars
-        )
+            # Drop target database if it exists
+            execute('DROP DATABASE IF EXISTS {}', (target_db,))
 
-        if create_result.returncode != 0:
-            result['errors'].append(f"Failed to create database: {create_result.stderr}")
-            return result
+            # Step 3: Copy data. When both environments use the same server and
+            # user, the server clones the database files itself (the copy then
+            # keeps the right owner); otherwise dump and restore.
+            same_cluster = all(source_creds[key] == target_creds[key] for key in ('host', 'port', 'user'))
+            if same_cluster:
+                # TEMPLATE needs the source free of other sessions (Odoo reconnects)
+                execute(terminate_query, params=(source_db,))
+                if execute('CREATE DATABASE {} WITH TEMPLATE {}', (target_db, source_db)) is None:
+                    result['method'] = 'template'
+                    result['database_copied'] = True
 
-        # Step 3: Copy data using pg_dump | psql
-        source_env_vars = os.environ.copy()
-        source_env_vars['PGPASSWORD'] = source_creds['password']
+            if not result['database_copied']:
+                # Create new target database
+                create_error = execute('CREATE DATABASE {}', (target_db,))
 
-        # Pipe pg_dump output directly to psql
-        dump_proc = subprocess.Popen(
-            ['pg_dump', '-h', source_creds['host'], '-p', source_creds['port'],
-             '-U', source_creds['user'], '-d', source_db],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=source_env_vars
-        )
+        if not result['database_copied']:
+            result['method'] = 'dump'
 
-        restore_proc = subprocess.Popen(
-            ['psql', '-h', target_creds['host'], '-p', target_creds['port'],
-             '-U', target_creds['user'], '-d', target_db],
-            stdin=dump_proc.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=env_vars
-        )
+            if create_error:
+                result['errors'].append(f"Failed to create database: {create_error}")
+                return result
 
-        dump_proc.stdout.close()
-        stdout, stderr = restore_proc.communicate()
+            copy_error = _dump_and_restore(source_creds, source_db, target_creds, target_db)
 
-        if restore_proc.returncode != 0:
-            result['errors'].append(f"Database restore failed: {stderr.decode()}")
-        else:
-            result['database_copied'] = True
+            if copy_error:
+                result['errors'].append(copy_error)
+            else:
+                result['database_copied'] = True
 
         # Step 4: Copy filestore if requested
         if include_filestore:
@@ -759,20 +1351,29 @@ def copy_database(source_env, target_env, include_filestore=True, include_addons
                     target_db_filestore = os.path.join(target_filestore, target_db)
 
                     if os.path.exists(target_db_filestore):
-                        shutil.rmtree(target_db_filestore)
+                        # Not inside the filestore: backups tar that whole directory
+                        _async_rmtree(target_db_filestore, os.path.join(config.ODOO_BASE_DIR, target_env))
+
+                    _fast_copytree(source_db_filestore, target_db_filestore)
 
-                    shutil.copytree(source_db_filestore, target_db_filestore)
+                    # Fix ownership (Odoo container user: UID 100, GID 101); only
+                    # the copied tree, not other databases or the one being deleted
+                    subprocess.run(['chown', '100:101', target_filestore], capture_output=True)
+                    subprocess.run(
+                        ['chown', '-R', '100:101', target_db_filestore],
+                        capture_output=True
+                    )
                 else:
                     # Fallback: copy entire filestore directory if DB subdirectory not found
                     if os.path.exists(target_filestore):
-                        shutil.rmtree(target_filestore)
-                    shutil.copytree(source_filestore, target_filestore)
+                        _async_rmtree(target_filestore)
+                    _fast_copytree(source_filestore, target_filestore)
 
-                # Fix ownership (Odoo container user: UID 100, GID 101)
-                subprocess.run(
-                    ['chown', '-R', '100:101', target_filestore],
-                    capture_output=True
-                )
+                    # Fix ownership (Odoo container user: UID 100, GID 101)
+                    subprocess.run(
+                        ['chown', '-R', '100:101', target_filestore],
+                        capture_output=True
+                    )
 
                 result['filestore_copied'] = True
 
@@ -784,10 +1385,10 @@ def copy_database(source_env, target_env, include_filestore=True, include_addons
             if os.path.exists(source_addons) and os.listdir(source_addons):
                 # Remove target addons contents
                 if os.path.exists(target_addons):
-                    shutil.rmtree(target_addons)
+                    _async_rmtree(target_addons)
 
                 # Copy source to target
-                shutil.copytree(source_addons, target_addons)
+                _fast_copytree(source_addons, target_addons)
 
                 # Fix ownership (Odoo container user: UID 100, GID 101)
                 subprocess.run(
@@ -851,46 +1452,45 @@ def get_database_info(env):
             debug_info['steps'].append(f'FAILED to discover database: {e}')
             raise
 
-        env_vars = os.environ.copy()
-        env_vars['PGPASSWORD'] = creds['password']
-
-        # Step 3: Get database size
-        debug_info['steps'].append('Getting database size...')
-        size_query = f"SELECT pg_size_pretty(pg_database_size('{db_name}'))"
-
-        result = subprocess.run(
-            ['psql', '-h', creds['host'], '-p', creds['port'],
-             '-U', creds['user'], '-d', db_name, '-t', '-A', '-c', size_query],
-            capture_output=True,
-            text=True,
-            env=env_vars
-        )
-
-        if result.returncode == 0:
-            db_size = result.stdout.strip()
-            debug_info['steps'].append(f'Size query success: {db_size}')
+        # Step 3: Get database size and table count in one query
+        debug_info['steps'].append('Getting database size and table count...')
+        info_query = """
+            SELECT pg_size_pretty(pg_database_size(current_database())),
+                   (SELECT count(*) FROM information_schema.tables WHERE table_schema = 'public')
+        """
+        db_size, table_count = 'Unknown', 0
+
+        if _psycopg2_usable():
+            try:
+                conn = psycopg2.connect(
+                    host=creds['host'], port=creds['port'],
+                    user=creds['user'], password=creds['password'],
+                    dbname=db_name, connect_timeout=10
+                )
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute(info_query)
+                        db_size, table_count = cur.fetchone()
+                finally:
+                    conn.close()
+                debug_info['steps'].append(f'Info query success: {db_size}, {table_count} tables')
+            except psycopg2.Error as e:
+                debug_info['steps'].append(f'Info query FAILED: {e}')
         else:
-            db_size = 'Unknown'
-            debug_info['steps'].append(f'Size query FAILED: {result.stderr}')
-
-        # Step 4: Get table count
-        debug_info['steps'].append('Getting table count...')
-        table_query = "SELECT count(*) FROM information_schema.tables WHERE table_schema = 'public'"
-
-        result = subprocess.run(
-            ['psql', '-h', creds['host'], '-p', creds['port'],
-             '-U', creds['user'], '-d', db_name, '-t', '-A', '-c', table_query],
-            capture_output=True,
-            text=True,
-            env=env_vars
-        )
+            result = subprocess.run(
+                ['psql', '-h', creds['host'], '-p', creds['port'],
+                 '-U', creds['user'], '-d', db_name, '-t', '-A', '-c', info_query],
+                capture_output=True,
+                text=True,
+                env=_pg_env(creds)
+            )
 
-        if result.returncode == 0:
-            table_count = int(result.stdout.strip())
-            debug_info['steps'].append(f'Table count success: {table_count}')
-        else:
-            table_count = 0
-            debug_info['steps'].append(f'Table count FAILED: {result.stderr}')
+            if result.returncode == 0:
+                size_text, _, count_text = result.stdout.strip().partition('|')
+                db_size, table_count = size_text, int(count_text)
+                debug_info['steps'].append(f'Info query success: {db_size}, {table_count} tables')
+            else:
+                debug_info['steps'].append(f'Info query FAILED: {result.stderr}')
 
         return {
             'name': db_name,
@@ -12,25 +12,25 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import get_container_name, get_environments
 
 
-def get_container_status(env):
-    """Get status of Odoo container."""
-    container_name = get_container_name(env)
-
-    # Check if container exists and is running
+def _inspect_containers(container_names):
+    """Run one `docker inspect` for several containers. Returns {name: data}."""
     result = subprocess.run(
-        ['docker', 'inspect', container_name],
+        ['docker', 'inspect', *container_names],
         capture_output=True,
         text=True
     )
 
-    if result.returncode != 0:
-        return {'status': 'not_found', 'env': env}
-
+    # Missing containers make docker exit non-zero but the others are still printed
     try:
-        data = json.loads(result.stdout)[0]
-    except (json.JSONDecodeError, IndexError):
-        return {'status': 'error', 'env': env, 'error': 'Failed to parse container info'}
+        entries = json.loads(result.stdout) if result.stdout.strip() else []
+    except json.JSONDecodeError:
+        return None
+
+    return {entry.get('Name', '').lstrip('/'): entry for entry in entries}
 
+
+def _status_from_inspect(env, data):
+    """Build the status dict for one container from its inspect data."""
     state = data.get('State', {})
 
     return {
@@ -43,19 +43,47 @@ def get_container_status(env):
     }
 
 
+def get_container_status(env):
+    """Get status of Odoo container."""
+    container_name = get_container_name(env)
+
+    # Check if container exists and is running
+    inspected = _inspect_containers([container_name])
+
+    if inspected is None:
+        return {'status': 'error', 'env': env, 'error': 'Failed to parse container info'}
+    if container_name not in inspected:
+        return {'status': 'not_found', 'env': env}
+
+    return _status_from_inspect(env, inspected[container_name])
+
+
 def get_all_container_status():
-    """Get status of all Odoo containers."""
+    """Get status of all Odoo containers.
+
+    Uses one `docker inspect` and one `docker stats` call for all
+    environments instead of two docker processes per environment.
+    """
     environments = get_environments()
+    names = {env: get_container_name(env) for env in environments}
+
+    inspected = _inspect_containers(list(names.values())) if names else {}
     statuses = {}
 
     for env in environments:
-        status = get_container_status(env)
-        # Also get stats if running
-        if status['status'] == 'running':
-            stats = get_container_stats(env)
-            if stats:
-                status['stats'] = stats
-        statuses[env] = status
+        if inspected is None:
+            statuses[env] = {'status': 'error', 'env': env, 'error': 'Failed to parse container info'}
+        elif names[env] not in inspected:
+            statuses[env] = {'status': 'not_found', 'env': env}
+        else:
+            statuses[env] = _status_from_inspect(env, inspected[names[env]])
+
+    # Also get stats for the running ones
+    running = [names[env] for env in environments if statuses[env]['status'] == 'running']
+    stats = _get_stats(running) if running else {}
+    for env in environments:
+        if names[env] in stats:
+            statuses[env]['stats'] = stats[names[env]]
 
     return statuses
 
@@ -105,30 +133,67 @@ def restart_container(env):
     }
 
 
-def get_container_stats(env):
-    """Get container resource usage."""
-    container_name = get_container_name(env)
+# Units used by `docker stats` for memory (binary) and I/O (decimal) sizes
+_SIZE_UNITS = {
+    'B': 1,
+    'KiB': 1024, 'MiB': 1024 ** 2, 'GiB': 1024 ** 3, 'TiB': 1024 ** 4,
+    'kB': 1000, 'KB': 1000, 'MB': 1000 ** 2, 'GB': 1000 ** 3, 'TB': 1000 ** 4,
+}
+
+
+def _parse_size(text):
+    """Convert a docker size string like '512.3MiB' to bytes, or None."""
+    text = text.strip()
+    number = text.rstrip('BKMGTikb')
+    unit = text[len(number):]
+    try:
+        return int(float(number) * _SIZE_UNITS[unit])
+    except (KeyError, ValueError):
+        return None
 
+
+def _get_stats(container_names):
+    """
+    Run one `docker stats --no-stream` for several containers. Returns {name: stats}.
+
+    The CLI already reports memory as usage minus inactive file cache (what
+    the kernel can reclaim), so MemUsage is the figure to show; the raw
+    Engine API value would include page cache. memory_used/memory_limit
+    carry the same numbers in bytes.
+    """
     result = subprocess.run(
-        ['docker', 'stats', '--no-stream', '--format', '{{json .}}', container_name],
+        ['docker', 'stats', '--no-stream', '--format', '{{json .}}', *container_names],
         capture_output=True,
         text=True
     )
 
     if result.returncode != 0:
-        return None
-
-    try:
-        stats = json.loads(result.stdout)
-        return {
-            'cpu': stats.get('CPUPerc', 'N/A'),
-            'memory': stats.get('MemUsage', 'N/A'),
-            'memory_percent': stats.get('MemPerc', 'N/A'),
-            'net_io': stats.get('NetIO', 'N/A'),
-            'block_io': stats.get('BlockIO', 'N/A')
+        return {}
+
+    stats = {}
+    for line in result.stdout.splitlines():
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        mem_usage = entry.get('MemUsage', 'N/A')
+        used, _, limit = mem_usage.partition('/')
+        stats[entry.get('Name', '')] = {
+            'cpu': entry.get('CPUPerc', 'N/A'),
+            'memory': mem_usage,
+            'memory_used': _parse_size(used),
+            'memory_limit': _parse_size(limit),
+            'memory_percent': entry.get('MemPerc', 'N/A'),
+            'net_io': entry.get('NetIO', 'N/A'),
+            'block_io': entry.get('BlockIO', 'N/A')
         }
-    except (json.JSONDecodeError, KeyError):
-        return None
+    return stats
+
+
+def get_container_stats(env):
+    """Get container resource usage."""
+    container_name = get_container_name(env)
+    return _get_stats([container_name]).get(container_name)
 
 
 def get_container_logs(env, lines=100):
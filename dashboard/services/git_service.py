@@ -8,6 +8,7 @@ in Odoo addon directories.
 import os
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from git import Repo, GitCommandError
 import sys
@@ -434,13 +435,13 @@ def get_all_repos_status():
     Returns:
         dict: Mapping of environment to list of repo statuses
     """
-    result = {}
-    registry = load_registry()
-
-    for env in config.ENVIRONMENTS:
-        result[env] = list_repositories(env)
+    # Each status check fetches from the remote, so check environments concurrently
+    environments = list(config.ENVIRONMENTS)
+    if not environments:
+        return {}
 
-    return result
+    with ThreadPoolExecutor(max_workers=len(environments)) as executor:
+        return dict(zip(environments, executor.map(list_repositories, environments)))
 
 
 def validate_git_url(url):
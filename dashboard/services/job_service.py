@@ -0,0 +1,105 @@
+"""
+Background job service for Odoo Dashboard
+
+Runs long operations (backups, uploads, database copies, restarts) off the
+request thread. Endpoints submit a job and return its id right away; clients
+poll /api/jobs/<id> for the outcome.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+logger = logging.getLogger('odoo_dashboard.jobs')
+
+# Backups and copies are disk/database heavy, so only a couple run at once;
+# the rest wait in the executor queue.
+MAX_WORKERS = 2
+
+# Finished jobs are kept this long so slow pollers still see the result
+JOB_RESULT_TTL = 3600  # seconds
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='dashboard-job')
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+def _prune_jobs():
+    """Drop finished jobs older than JOB_RESULT_TTL. Caller holds _jobs_lock."""
+    cutoff = time.monotonic() - JOB_RESULT_TTL
+    expired = [job_id for job_id, job in _jobs.items()
+               if job['_finished'] is not None and job['_finished'] < cutoff]
+    for job_id in expired:
+        del _jobs[job_id]
+
+
+def _run(job_id, fn, args, kwargs):
+    """Execute a job and record its outcome."""
+    with _jobs_lock:
+        job = _jobs[job_id]
+        job['status'] = 'started'
+        job['started_at'] = datetime.now().isoformat()
+
+    try:
+        result = fn(*args, **kwargs)
+        status, error = 'finished', None
+    except Exception as e:
+        logger.error(f"Job {job['name']} ({job_id}) failed: {e}")
+        result, status, error = None, 'failed', str(e)
+
+    with _jobs_lock:
+        job.update(
+            status=status,
+            result=result,
+            error=error,
+            ended_at=datetime.now().isoformat(),
+            _finished=time.monotonic()
+        )
+
+
+def submit(name, fn, *args, **kwargs):
+    """
+    Queue fn(*args, **kwargs) to run in the background.
+
+    Args:
+        name: Short description shown in job status (e.g. 'backup:test')
+
+    Returns:
+        The new job id
+    """
+    job_id = uuid.uuid4().hex
+    with _jobs_lock:
+        _prune_jobs()
+        _jobs[job_id] = {
+            'id': job_id,
+            'name': name,
+            'status': 'queued',
+            'result': None,
+            'error': None,
+            'enqueued_at': datetime.now().isoformat(),
+            'started_at': None,
+            'ended_at': None,
+            '_finished': None
+        }
+
+    logger.info(f"Queued job {name} ({job_id})")
+    _executor.submit(_run, job_id, fn, args, kwargs)
+    return job_id
+
+
+def get_job(job_id):
+    """
+    Get the status of a job.
+
+    Returns:
+        dict with 'id', 'name', 'status' (queued, started, finished, failed),
+        'result', 'error' and timestamps, or None if the job is unknown
+    """
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return None
+        return {key: value for key, value in job.items() if not key.startswith('_')}
@@ -2,24 +2,50 @@
 Log service for Odoo Management Dashboard
 Handles log retrieval and streaming for Docker containers
 """
+import bisect
+import collections
+import functools
+import itertools
+import re
+import select
 import subprocess
 import sys
 import os
 import signal
+import threading
 
 # Add parent directory to path for config import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import get_container_name
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
-def get_logs(env, lines=100, timestamps=False):
+# Seconds without log output before an idle SSE stream gets a keepalive comment
+SSE_HEARTBEAT_INTERVAL = 15
+
+# Below this many lines a compiled re beats building the hyperscan buffer
+HYPERSCAN_MIN_LINES = 2000
+
+# get_logs filters docker's output in batches of this many lines
+FILTER_BATCH_SIZE = HYPERSCAN_MIN_LINES
+
+
+def get_logs(env, lines=100, timestamps=False, level=None, search=None):
     """
     Get last N lines of container logs.
 
+    Level/search filters are applied while reading docker's output, in
+    batches, so non-matching lines are never collected into the result.
+
     Args:
         env: Environment name (test, staging, prod)
-        lines: Number of lines to retrieve
+        lines: Number of lines to retrieve (filters apply within these)
         timestamps: Whether to include timestamps
+        level: Optional log level to filter (see filter_logs)
+        search: Optional search string to filter
 
     Returns:
         dict with 'success', 'logs' list, and 'error' if failed
@@ -30,70 +56,244 @@ def get_logs(env, lines=100, timestamps=False):
     if timestamps:
         cmd.insert(2, '--timestamps')
 
-    result = subprocess.run(
+    # Docker logs go to stderr for Odoo, read both as one stream
+    proc = subprocess.Popen(
         cmd,
-        capture_output=True,
-        text=True
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT
     )
 
-    if result.returncode != 0:
+    log_lines = []
+    batch = []
+    recent = collections.deque(maxlen=5)  # unfiltered, for error messages
+    with proc.stdout:
+        for raw in proc.stdout:
+            line = raw.decode('utf-8', errors='replace').rstrip('\n')
+            recent.append(line)
+            batch.append(line)
+            if len(batch) >= FILTER_BATCH_SIZE:
+                log_lines.extend(filter_logs(batch, level=level, search=search))
+                batch = []
+    log_lines.extend(filter_logs(batch, level=level, search=search))
+
+    if proc.wait() != 0:
         return {
             'success': False,
-            'error': result.stderr or 'Failed to retrieve logs',
+            'error': '\n'.join(recent).strip() or 'Failed to retrieve logs',
             'logs': []
         }
 
-    # Docker logs go to stderr for Odoo, combine both
-    combined_output = result.stdout + result.stderr
-    log_lines = combined_output.strip().split('\n') if combined_output.strip() else []
+    # Leading/trailing blank lines are noise in the viewer
+    while log_lines and not log_lines[-1].strip():
+        log_lines.pop()
+    start = 0
+    while start < len(log_lines) and not log_lines[start].strip():
+        start += 1
 
     return {
         'success': True,
-        'logs': log_lines
+        'logs': log_lines[start:]
     }
 
 
-def stream_logs(env, tail=50):
+class RingBuffer:
+    """
+    Fixed-size buffer of the latest log lines with one writer and many readers.
+
+    Lines get increasing sequence numbers; `head` is the number of the next
+    line to be written. Readers keep their own cursor, and a slow reader
+    that falls more than `capacity` lines behind simply skips the lines
+    that were overwritten. The writer and readers take the condition's lock
+    once per batch: the writer to fill slots and move head, a reader to
+    copy what it hasn't seen yet. So a copy never mixes in slots that a
+    concurrent write is replacing.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.head = 0
+        self.closed = False
+        self._slots = [None] * capacity
+        self._cond = threading.Condition()
+
+    def extend(self, lines):
+        """Append lines (single writer only) and wake waiting readers."""
+        with self._cond:
+            head = self.head
+            for line in lines:
+                self._slots[head % self.capacity] = line
+                head += 1
+            self.head = head
+            self._cond.notify_all()
+
+    def close(self):
+        """Mark the end of the stream and wake waiting readers."""
+        self.closed = True
+        with self._cond:
+            self._cond.notify_all()
+
+    def read(self, cursor, timeout=None):
+        """
+        Return (lines, new_cursor) for everything written after cursor.
+
+        Waits up to timeout seconds when there is nothing new; an empty
+        list then means a timeout, or the end of the stream if closed.
+        """
+        with self._cond:
+            if cursor == self.head and not self.closed:
+                self._cond.wait_for(lambda: self.head != cursor or self.closed, timeout)
+
+            head = self.head
+            cursor = max(cursor, head - self.capacity)
+            lines = [self._slots[seq % self.capacity] for seq in range(cursor, head)]
+        return lines, head
+
+
+class LogHub:
+    """
+    Shares one `docker logs -f` process per environment between all SSE clients.
+
+    A tailer thread reads the container's log into a RingBuffer that every
+    client of that environment reads from at its own pace. The buffer also
+    holds the recent history, so a new client gets its initial tail without
+    starting another docker process. A tailer stops when its last client
+    leaves.
+    """
+
+    MAX_TAIL = 500
+    BUFFER_SIZE = 1024
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tailers = {}  # env -> _Tailer
+
+    def subscribe(self, env):
+        """Register a client and return the env's tailer once its history is loaded."""
+        with self._lock:
+            tailer = self._tailers.get(env)
+            if tailer is None:
+                tailer = self._tailers[env] = _Tailer(self, env, self.MAX_TAIL, self.BUFFER_SIZE)
+            tailer.clients += 1
+
+        # Let the history arrive so the initial tail comes from the buffer
+        tailer.ready.wait(timeout=2)
+        return tailer
+
+    def unsubscribe(self, env, tailer):
+        """Deregister a client, stopping the tailer if it was the last one."""
+        with self._lock:
+            tailer.clients -= 1
+            if tailer.clients > 0 or self._tailers.get(env) is not tailer:
+                return
+            del self._tailers[env]
+        tailer.stop()
+
+    def _finished(self, tailer):
+        """The docker process exited; later clients get a fresh tailer."""
+        with self._lock:
+            if self._tailers.get(tailer.env) is tailer:
+                del self._tailers[tailer.env]
+
+
+class _Tailer:
+    """A `docker logs -f` process and the thread reading it, for one env."""
+
+    def __init__(self, hub, env, history, buffer_size):
+        self.hub = hub
+        self.env = env
+        self.ring = RingBuffer(buffer_size)
+        self.clients = 0
+        self.ready = threading.Event()
+
+        self.proc = subprocess.Popen(
+            ['docker', 'logs', '-f', '--tail', str(history), get_container_name(env)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0
+        )
+        threading.Thread(target=self._run, name=f'log-tailer-{env}', daemon=True).start()
+
+    def _run(self):
+        pending = b''
+        try:
+            while True:
+                # History comes out in one burst; the first quiet moment ends it
+                if not self.ready.is_set():
+                    ready, _, _ = select.select([self.proc.stdout], [], [], 0.25)
+                    if not ready:
+                        self.ready.set()
+                        continue
+
+                chunk = self.proc.stdout.read(64 * 1024)
+                if not chunk:
+                    break
+
+                *lines, pending = (pending + chunk).split(b'\n')
+                if lines:
+                    self.ring.extend([line.decode('utf-8', errors='replace') for line in lines])
+
+            if pending:
+                self.ring.extend([pending.decode('utf-8', errors='replace')])
+        finally:
+            self.hub._finished(self)
+            self.ring.close()
+            self.ready.set()
+            self.stop()
+            self.proc.stdout.close()
+
+    def stop(self):
+        """Terminate the docker process; the reader thread then sees EOF."""
+        if self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+
+
+log_hub = LogHub()
+
+
+def stream_logs(env, tail=50, heartbeat=SSE_HEARTBEAT_INTERVAL):
     """
     Generator for SSE log streaming.
 
-    Yields log lines in SSE format for real-time streaming.
+    Yields log lines in SSE format for real-time streaming. Clients of the
+    same environment share one docker process through log_hub. While the
+    container is quiet a comment line is sent every `heartbeat` seconds, so
+    proxies keep the connection open and a disconnected client is noticed
+    without waiting for the next log line.
 
     Args:
         env: Environment name (test, staging, prod)
-        tail: Number of initial lines to show
+        tail: Number of initial lines to show (at most LogHub.MAX_TAIL)
+        heartbeat: Seconds of silence before sending a keepalive comment
 
     Yields:
         SSE formatted log lines
     """
-    container_name = get_container_name(env)
-
-    proc = subprocess.Popen(
-        ['docker', 'logs', '-f', '--tail', str(tail), container_name],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1  # Line buffered
-    )
-
+    tailer = log_hub.subscribe(env)
+    ring = tailer.ring
+    cursor = max(ring.head - max(tail, 0), 0)
     try:
-        for line in iter(proc.stdout.readline, ''):
-            if line:
-                # Escape special characters for SSE
-                # Replace newlines within the line (shouldn't happen, but just in case)
-                safe_line = line.rstrip('\n').replace('\n', '\\n')
-                yield f"data: {safe_line}\n\n"
+        while True:
+            lines, cursor = ring.read(cursor, timeout=heartbeat)
+            if not lines:
+                if ring.closed:
+                    # docker logs exited (container stopped or removed)
+                    break
+                yield ": keepalive\n\n"
+                continue
+
+            for line in lines:
+                # Lines are split on newline already, so none can break the SSE framing
+                yield f"data: {line}\n\n"
     except GeneratorExit:
         # Client disconnected
         pass
     finally:
-        # Clean up the subprocess
-        proc.terminate()
-        try:
-            proc.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            proc.wait()
+        log_hub.unsubscribe(env, tailer)
 
 
 def get_logs_download(env, lines=1000, timestamps=True):
@@ -108,22 +308,50 @@ def get_logs_download(env, lines=1000, timestamps=True):
     Returns:
         String of log content ready for download
     """
+    return b''.join(iter_logs_download(env, lines, timestamps)).decode('utf-8', errors='replace')
+
+
+def iter_logs_download(env, lines=1000, timestamps=True, chunk_size=64 * 1024):
+    """
+    Stream logs for download in chunks as docker produces them.
+
+    Args:
+        env: Environment name
+        lines: Number of lines (default 1000 for downloads)
+        timestamps: Include timestamps (default True for downloads)
+        chunk_size: Maximum bytes per yielded chunk
+
+    Yields:
+        Raw log bytes (stdout and stderr interleaved; Odoo logs go to stderr)
+    """
     container_name = get_container_name(env)
 
     cmd = ['docker', 'logs', '--tail', str(lines), container_name]
     if timestamps:
         cmd.insert(2, '--timestamps')
 
-    result = subprocess.run(
+    proc = subprocess.Popen(
         cmd,
-        capture_output=True,
-        text=True
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT
     )
 
-    # Combine stdout and stderr (Odoo logs go to stderr)
-    content = result.stdout + result.stderr
-
-    return content
+    try:
+        while True:
+            chunk = proc.stdout.read1(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        # Clean up the subprocess (also runs if the client disconnects)
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
 
 
 def get_log_stats(env):
@@ -158,10 +386,58 @@ def get_log_stats(env):
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_filter(level, search):
+    """Compile the level/search filter into one case-insensitive regex."""
+    terms = [term for term in (level, search) if term]
+    return re.compile(''.join(f'(?=.*?{re.escape(term)})' for term in terms), re.IGNORECASE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_hyperscan(level, search):
+    """
+    Compile the level/search filter into a hyperscan database (one id per term).
+
+    Only called for ASCII terms: HS_FLAG_CASELESS folds ASCII letters only,
+    so anything else goes through the re path to keep matching consistent.
+    """
+    terms = [term for term in (level, search) if term]
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(term).encode('utf-8') for term in terms],
+        ids=list(range(len(terms))),
+        elements=len(terms),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(terms)
+    )
+    return db, len(terms)
+
+
+def _filter_logs_hyperscan(logs, level, search):
+    """Scan all lines in one pass and keep those matching every term."""
+    db, term_count = _compile_hyperscan(level, search)
+
+    encoded = [line.encode('utf-8', errors='replace') for line in logs]
+    starts = [0]
+    starts.extend(itertools.accumulate(len(line) + 1 for line in encoded))
+    hits = [set() for _ in range(term_count)]
+
+    def on_match(term_id, start, end, flags, context):
+        hits[term_id].add(bisect.bisect_right(starts, end - 1) - 1)
+
+    db.scan(b'\n'.join(encoded), match_event_handler=on_match)
+
+    matched = set.intersection(*hits)
+    return [logs[i] for i in sorted(matched)]
+
+
 def filter_logs(logs, level=None, search=None):
     """
     Filter log lines by level or search term.
 
+    Both filters are case-insensitive substring matches and are applied in
+    a single pass with a cached compiled pattern. Large inputs are scanned
+    with hyperscan when it is installed.
+
     Args:
         logs: List of log lines
         level: Log level to filter (ERROR, WARNING, INFO, DEBUG)
@@ -170,14 +446,12 @@ def filter_logs(logs, level=None, search=None):
     Returns:
         Filtered list of log lines
     """
-    filtered = logs
-
-    if level:
-        level_upper = level.upper()
-        filtered = [line for line in filtered if level_upper in line.upper()]
+    if not level and not search:
+        return logs
 
-    if search:
-        search_lower = search.lower()
-        filtered = [line for line in filtered if search_lower in line.lower()]
+    if (hyperscan is not None and len(logs) >= HYPERSCAN_MIN_LINES
+            and all(term.isascii() for term in (level, search) if term)):
+        return _filter_logs_hyperscan(logs, level or None, search or None)
 
-    return filtered
+    match = _compile_filter(level or None, search or None).match
+    return [line for line in logs if match(line)]
@@ -341,30 +341,31 @@ def trigger_backup_now(env):
     return result
 
 
-def get_backup_history(env=None, limit=50):
+def get_backup_history(env=None, limit=50, before=None):
     """
-    Get backup history from audit log.
+    Get backup history from audit log, newest first.
+
+    The log is read backwards from the end, so a page only costs the lines
+    it covers. Pass the returned next_cursor as `before` for the next page.
 
     Args:
         env: Optional environment filter
         limit: Maximum number of entries to return
+        before: Cursor from a previous call (byte offset into the log)
 
     Returns:
-        list: List of backup history entries
+        dict: 'entries' list and 'next_cursor' (None when there is no more)
     """
     audit_file = os.path.join(config.DATA_DIR, 'backup-audit.log')
     history = []
+    next_cursor = None
 
-    if not os.path.exists(audit_file):
-        return history
+    if not os.path.exists(audit_file) or limit <= 0:
+        return {'entries': history, 'next_cursor': next_cursor}
 
     try:
-        with open(audit_file, 'r') as f:
-            lines = f.readlines()
-
-        # Parse lines in reverse order (newest first)
-        for line in reversed(lines):
-            line = line.strip()
+        for offset, raw_line in config.read_lines_reversed(audit_file, end=before):
+            line = raw_line.decode('utf-8', errors='replace').strip()
             if not line:
                 continue
 
@@ -390,6 +391,7 @@ def get_backup_history(env=None, limit=50):
                     history.append(entry)
 
                     if len(history) >= limit:
+                        next_cursor = offset or None
                         break
 
             except Exception:
@@ -398,4 +400,4 @@ def get_backup_history(env=None, limit=50):
     except IOError as e:
         logger.warning(f"Failed to read audit log: {e}")
 
-    return history
+    return {'entries': history, 'next_cursor': next_cursor}
@@ -14,6 +14,31 @@ document.addEventListener('DOMContentLoaded', function() {
     startAutoRefresh();
 });
 
+// ============================================================================
+// Background Jobs
+// ============================================================================
+
+// Long operations run as background jobs: the endpoint answers with a job id
+// and the result is fetched from /api/jobs/<id> once the job is done.
+async function waitForJob(jobId, interval = 2000) {
+    while (true) {
+        const response = await fetch(`/api/jobs/${jobId}`);
+        const job = await response.json();
+
+        if (!response.ok) {
+            throw new Error(job.error || 'Job status unavailable');
+        }
+        if (job.status === 'finished') {
+            return job.result;
+        }
+        if (job.status === 'failed') {
+            throw new Error(job.error || 'Job failed');
+        }
+
+        await new Promise(resolve => setTimeout(resolve, interval));
+    }
+}
+
 // ============================================================================
 // Tab Management
 // ============================================================================
@@ -236,8 +261,11 @@ async function createBackup() {
             throw new Error(result.error || 'Backup creation failed');
         }
 
-        showMessage(`Backup created successfully: ${result.backup_id}`, 'success');
         closeCreateBackupModal();
+        showMessage('Backup started...', 'info');
+        const backup = await waitForJob(result.job_id);
+
+        showMessage(`Backup created successfully: ${backup.backup_id}`, 'success');
         loadBackups();
 
     } catch (error) {
@@ -265,12 +293,14 @@ async function uploadBackup(env, backupId) {
             method: 'POST'
         });
 
-        const result = await response.json();
+        const job = await response.json();
 
         if (!response.ok) {
-            throw new Error(result.error || 'Upload failed');
+            throw new Error(job.error || 'Upload failed');
         }
 
+        const result = await waitForJob(job.job_id);
+
         if (result.uploaded) {
             showMessage(`Backup uploaded to ${result.backend}`, 'success');
         } else {
@@ -503,12 +533,14 @@ async function executeDatabaseCopy(source, target, includeFilestore, includeAddo
             body: JSON.stringify(requestBody)
         });
 
-        const result = await response.json();
+        const job = await response.json();
 
         if (!response.ok) {
-            throw new Error(result.error || 'Copy failed');
+            throw new Error(job.error || 'Copy failed');
         }
 
+        const result = await waitForJob(job.job_id);
+
         if (result.success) {
             let message = `Database copied from ${source} to ${target}`;
             if (result.target_db_name) {
@@ -572,6 +604,12 @@ async function loadBackupConfig() {
             document.getElementById('retention-remote').value = config.retention.remote_days || 30;
         }
 
+        // Filestore
+        if (config.filestore) {
+            document.getElementById('filestore-incremental').checked = !!config.filestore.incremental;
+            document.getElementById('filestore-full-every').value = config.filestore.full_every_days || 7;
+        }
+
     } catch (error) {
         console.error('Error loading config:', error);
     }
@@ -611,6 +649,10 @@ async function saveBackupConfig() {
         retention: {
             local_days: parseInt(document.getElementById('retention-local').value) || 7,
             remote_days: parseInt(document.getElementById('retention-remote').value) || 30
+        },
+        filestore: {
+            incremental: document.getElementById('filestore-incremental').checked,
+            full_every_days: parseInt(document.getElementById('filestore-full-every').value) || 7
         }
     };
 
@@ -833,12 +875,14 @@ async function triggerBackupNow(env) {
             method: 'POST'
         });
 
-        const result = await response.json();
+        const job = await response.json();
 
         if (!response.ok) {
-            throw new Error(result.error || 'Backup failed');
+            throw new Error(job.error || 'Backup failed');
         }
 
+        const result = await waitForJob(job.job_id);
+
         if (result.success) {
             showMessage(`Backup completed: ${result.backup_id}`, 'success');
             loadBackups();
@@ -375,8 +375,8 @@ async function pullRepository(repoId) {
 
         // Show result
         let message = result.message || `Pulled ${result.commits_pulled} commit(s)`;
-        if (result.auto_restart && result.commits_pulled > 0) {
-            message += ' - Container restarted';
+        if (result.restart_job_id) {
+            message += ' - Container restarting';
         }
 
         showToast(message, 'success');
@@ -0,0 +1,47 @@
+"""
+WSGI entry point for running the dashboard under gunicorn with gevent workers,
+so long-lived log streams don't tie up a thread each:
+
+    gunicorn -k gevent -w 1 --worker-connections 1000 -b 0.0.0.0:9998 wsgi:app
+
+Keep a single worker: the backup scheduler and the container status cache
+live in-process, and more workers would run every scheduled backup twice.
+"""
+try:
+    # Must run before anything else imports socket/subprocess/threading
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    monkey = None
+
+
+def _gevent_wait_callback(conn, timeout=None):
+    """Wait for psycopg2 I/O through gevent, so other greenlets keep running."""
+    from gevent.socket import wait_read, wait_write
+    from psycopg2 import extensions, OperationalError
+
+    while True:
+        state = conn.poll()
+        if state == extensions.POLL_OK:
+            break
+        elif state == extensions.POLL_READ:
+            wait_read(conn.fileno(), timeout=timeout)
+        elif state == extensions.POLL_WRITE:
+            wait_write(conn.fileno(), timeout=timeout)
+        else:
+            raise OperationalError(f"Bad result from poll: {state}")
+
+
+if monkey is not None:
+    try:
+        # psycopg2 is blocking C code; without this a query would stall the
+        # whole (single) worker. The backup service only uses psycopg2 under
+        # gevent once this is registered.
+        from psycopg2 import extensions as psycopg2_extensions
+        psycopg2_extensions.set_wait_callback(_gevent_wait_callback)
+    except ImportError:
+        pass
+
+from dashboard import app, scheduler_service
+
+scheduler_service.init_scheduler()